@@ -20,22 +20,31 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
+import asyncio
+import gzip
+import hashlib
 import math
-import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
+import orjson
 from sanic import Sanic, response, SanicException
-from sanic.response import json, html
+from sanic.response import json as sanic_json, html
 from sanic_cors import CORS
 from sanic.exceptions import NotFound
+from sanic.log import error_logger
 
 from computemodularization import compute_LMS_modular, compute_xyz_purples_modular, compute_XYZ_standard_modular
 from descriptionapi import *
 from graph import LMS_graph, macleod_graph, maxwellian_graph, XYZ_graph, XY_graph, XYZP_graph, xyp_graph, \
-    cieXYZ_std, ciexyz_std
+    cieXYZ_std, ciexyz_std, plot_body_HTML, PLOT_ERROR_HTML
 from compute import chop
 
 
-api = Sanic(__name__)
+# orjson encodes the JSON responses (errors and status) in C
+api = Sanic(__name__, dumps=orjson.dumps)
 CORS(api, resources={r"/*": {"origins": "*"}})
 
 # constants for each endpoint
@@ -51,9 +60,26 @@ XYP_ENDPOINT = "xy-p"
 XYZSTD_ENDPOINT = "xyz-std"
 XYSTD_ENDPOINT = "xy-std"
 STATUS_ENDPOINT = "status"
+# the complete routes for each endpoint
+LMS_ROUTE = f"{API_HOMEPAGE}/{API_VERSION}/{LMS_ENDPOINT}/<more:str>"
+LMS_MB_ROUTE = f"{API_HOMEPAGE}/{API_VERSION}/{LMS_MB_ENDPOINT}/<more:str>"
+LMS_MW_ROUTE = f"{API_HOMEPAGE}/{API_VERSION}/{LMS_MW_ENDPOINT}/<more:str>"
+XYZ_ROUTE = f"{API_HOMEPAGE}/{API_VERSION}/{XYZ_ENDPOINT}/<more:str>"
+XY_ROUTE = f"{API_HOMEPAGE}/{API_VERSION}/{XY_ENDPOINT}/<more:str>"
+XYZP_ROUTE = f"{API_HOMEPAGE}/{API_VERSION}/{XYZP_ENDPOINT}/<more:str>"
+XYP_ROUTE = f"{API_HOMEPAGE}/{API_VERSION}/{XYP_ENDPOINT}/<more:str>"
+XYZSTD_ROUTE = f"{API_HOMEPAGE}/{API_VERSION}/{XYZSTD_ENDPOINT}/<more:str>"
+XYSTD_ROUTE = f"{API_HOMEPAGE}/{API_VERSION}/{XYSTD_ENDPOINT}/<more:str>"
+STATUS_ROUTE = f"{API_HOMEPAGE}/{API_VERSION}/{STATUS_ENDPOINT}"
 # constants for standardization field sizes
 STD_1931 = 2.0
 STD_1964 = 10.0
+# the only field sizes of the standardization endpoints
+STD_FIELD_SIZES = frozenset((STD_1931, STD_1964))
+# the calculations are deterministic given the URL, so their responses may be cached by anyone for a while
+CALCULATION_HEADERS = {"cache-control": "public, max-age=300"}
+# the sidemenus are HTML pages meant for the browser of the user, which revalidates them with their ETag
+SIDEMENU_HEADERS = {"cache-control": "private"}
 
 # Timer that starts when server boots up, for status endpoint
 server_start = time.time()
@@ -80,7 +106,7 @@ async def check_get(request):
 
 @api.exception(NotFound)
 async def notfound_handler(request, exception):
-    return json(
+    return sanic_json(
         {
             "error": "Not Found",
             "status_code": 404,
@@ -113,7 +139,7 @@ async def error_handler(request, exception):
         "message": message,
         "suggestion:": suggestion,
     }
-    return json(json_error, status=exception.status_code)
+    return sanic_json(json_error, status=exception.status_code)
 
 
 def endpoint_creator(homepage, version, endpoint=""):
@@ -130,7 +156,7 @@ def endpoint_creator(homepage, version, endpoint=""):
     The combined URL.
 
     """
-    return '/'.join([homepage, version, endpoint])
+    return f"{homepage}/{version}/{endpoint}"
 
 
 """
@@ -184,9 +210,65 @@ calculation_formats = {
     }
 }
 
+# which formats of calculation_formats each calculation uses
+CALCULATION_FORMAT_KEYS = {
+    compute_Maxwellian_modular: "Maxwell-Macleod-resplot",
+    compute_MacLeod_modular: "Maxwell-Macleod-resplot",
+    compute_XYZ_modular: "XYZ-XYZP-XYZ-STD",
+    compute_XYZ_purples_modular: "XYZ-XYZP-XYZ-STD",
+    compute_XYZ_standard_modular: "XYZ-XYZP-XYZ-STD",
+    compute_XY_modular: "XY-XYP-XY-STD",
+    compute_xyz_purples_modular: "XY-XYP-XY-STD",
+    compute_xyz_standard_modular: "XY-XYP-XY-STD",
+}
+# formats of compute_LMS_modular, as LMS_FORMATS[base][log]
+LMS_FORMATS = (("LMS", "LMS-log"), ("LMS-base", "LMS-base-log"))
+
+
+def load_page(path):
+    """
+    Reads a static HTML page into memory, both as it is and gzip compressed, so that serving it
+    requires neither file access nor compression per request.
+
+    Parameters
+    ----------
+    path: The path to the HTML file.
+
+    Returns
+    -------
+    A tuple of the raw bytes of the page, and the gzip compressed bytes of the page.
+
+    """
+    with open(path, "rb") as file:
+        page = file.read()
+    return page, gzip.compress(page, 9)
+
+
+def page_response(request, page):
+    """
+    Helper function that returns a page loaded by load_page(...), compressed if the client accepts gzip.
+    """
+    (plain, compressed) = page
+    headers = {"cache-control": "public, max-age=3600", "vary": "accept-encoding"}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["content-encoding"] = "gzip"
+        return response.raw(compressed, content_type="text/html; charset=utf-8", headers=headers)
+    return response.raw(plain, content_type="text/html; charset=utf-8", headers=headers)
+
+
 # static file hosting
-api.static("/", "./templates/index.html", name="home-page")
-api.static("/api/v2/", "./templates/api-page.html", name="api-page")
+HOME_PAGE = load_page("./templates/index.html")
+API_PAGE = load_page("./templates/api-page.html")
+
+
+@api.get("/", name="home-page")
+async def home_page(request):
+    return page_response(request, HOME_PAGE)
+
+
+@api.get("/api/v2/", name="api-page")
+async def api_page(request):
+    return page_response(request, API_PAGE)
 
 
 def new_calculation_JSON(calculation, parameters):
@@ -195,6 +277,9 @@ def new_calculation_JSON(calculation, parameters):
     the calculation and format. Different calculations have different needs for string formats, and the
     same goes for parameters. This makes sure the right one is used for each endpoint.
 
+    The calculations are deterministic, so the JSON is cached for each combination of calculation and
+    parameters; see cached_calculation_JSON(...) below.
+
     Parameters
     ----------
     calculation: The calculation function from computemodularization.py.
@@ -205,31 +290,99 @@ def new_calculation_JSON(calculation, parameters):
     A raw JSON string representing the output data from the computational function, given the parameters.
 
     """
-    if parameters['info']:
-        return write_to_JSON(calculation(parameters), calculation_formats['info-1'])
+    return calculation_JSON_bytes(calculation, parameters).decode()
+
+
+def calculation_JSON_bytes(calculation, parameters):
+    """
+    The same as new_calculation_JSON(...), but returns the JSON as the ASCII bytes it is built as, which is what
+    the calculation endpoints send as they are.
+    """
+    return cached_calculation_JSON(calculation, calculation_key(calculation, parameters))
+
+
+def calculation_key(calculation, parameters):
+    """
+    The (name, value) pairs of the parameters that a calculation depends on, which is what its JSONs are cached on.
+    The CIE standard functions, for example, are the same for every age and domain, so the comparisons in the plots
+    share one JSON of each. 'info' is always included, as it decides the formats.
+    """
+    names = dict.fromkeys(calculation.parameter_names + ('info',))
+    return tuple((name, parameters[name]) for name in names if name in parameters)
+
+
+@lru_cache(maxsize=128)
+def cached_calculation_JSON(calculation, parameters):
+    """
+    The cached body of new_calculation_JSON(...). Identical requests (such as the plot, sidemenu and calculation
+    of the same parameters) only have to run the calculation and formatting once.
+
+    Parameters
+    ----------
+    calculation: The calculation function from computemodularization.py.
+    parameters: The (name, value) pairs of the treated URL parameters the calculation depends on.
+
+    Returns
+    -------
+    The raw JSON, as bytes, representing the output data from the computational function, given the parameters.
+
+    """
+    # the calculations are free to modify the dictionary they are given, as it is a new one for every call
+    parameters = dict(parameters)
+    formats = COMPILED_FORMATS[formats_key(calculation, parameters)]
+    return write_compiled_JSON(calculation(parameters), formats)
+
+
+def formats_key(calculation, parameters):
+    """
+    Finds which of the formats in calculation_formats the results of a calculation are written with.
 
+    Parameters
+    ----------
+    calculation: The calculation function from computemodularization.py.
+    parameters: A dictionary of treated URL parameters.
+
+    Returns
+    -------
+    The key of the formats in calculation_formats.
+
+    """
+    if parameters['info']:
+        return 'info-1'
     if calculation is compute_LMS_modular:
-        if parameters['base']:
-            if parameters['log']:
-                # log10 base LMS
-                return write_to_JSON(calculation(parameters), calculation_formats['LMS-base-log'])
-            else:
-                # base LMS
-                return write_to_JSON(calculation(parameters), calculation_formats['LMS-base'])
-        else:
-            # log10 LMS
-            if parameters['log']:
-                return write_to_JSON(calculation(parameters), calculation_formats['LMS-log'])
-            else:
-                # LMS
-                return write_to_JSON(calculation(parameters), calculation_formats['LMS'])
+        # indexed by whether it is base LMS, and then whether it is log10
+        return LMS_FORMATS[bool(parameters['base'])][bool(parameters['log'])]
     # many of these share the same ones
-    if calculation in [compute_Maxwellian_modular, compute_MacLeod_modular]:
-        return write_to_JSON(calculation(parameters), calculation_formats["Maxwell-Macleod-resplot"])
-    if calculation in [compute_XYZ_modular, compute_XYZ_purples_modular, compute_XYZ_standard_modular]:
-        return write_to_JSON(calculation(parameters), calculation_formats["XYZ-XYZP-XYZ-STD"])
-    else:
-        return write_to_JSON(calculation(parameters), calculation_formats["XY-XYP-XY-STD"])
+    return CALCULATION_FORMAT_KEYS.get(calculation, "XY-XYP-XY-STD")
+
+
+def new_plot_columns_JSON(calculation, parameters):
+    """
+    The columns of the 'plot' of a calculation, as a JSON array of arrays, such as [[λ...], [x...], [y...]].
+    The values are formatted exactly as in new_calculation_JSON(...), but the plots get them already
+    transposed, so that they do not have to transpose them in JS.
+
+    Parameters
+    ----------
+    calculation: The calculation function from computemodularization.py.
+    parameters: A dictionary of treated URL parameters.
+
+    Returns
+    -------
+    A raw JSON string of the columns of the plot of the calculation, given the parameters.
+
+    """
+    return cached_plot_columns_JSON(calculation, calculation_key(calculation, parameters))
+
+
+@lru_cache(maxsize=128)
+def cached_plot_columns_JSON(calculation, parameters):
+    """
+    The cached body of new_plot_columns_JSON(...), with the parameters as in cached_calculation_JSON(...).
+    """
+    parameters = dict(parameters)
+    (_, formatta) = COMPILED_FORMATS[formats_key(calculation, parameters)]['plot']
+    return b''.join(write_columns(calculation(parameters)['plot'], formatta)).decode()
 
 
 def write_to_JSON(results_dict, json_dict):
@@ -249,15 +402,62 @@ def write_to_JSON(results_dict, json_dict):
     json_dict wishes.
 
     """
-    something = {}
+    return write_JSON_bytes(results_dict, json_dict).decode()
+
+
+def write_JSON_bytes(results_dict, json_dict):
+    """
+    The same as write_to_JSON(...), but returns the JSON as ASCII bytes. Every part of the JSON is formatted
+    directly as bytes, so it never has to be encoded before it is sent.
+    """
+    return write_compiled_JSON(results_dict, compile_formats(json_dict))
+
+
+def write_compiled_JSON(results_dict, compiled):
+    """
+    The same as write_JSON_bytes(...), but with formats that are already translated by compile_formats(...),
+    such as the ones in COMPILED_FORMATS.
+    """
+    # Everything is written straight into one list of chunks, which is joined once at the end.
+    output = [b'{']
+    append = output.append
     for (name, body) in results_dict.items():
-        something[name] = ndarray_to_JSON(body, json_dict[name])
-    output = []
-    for (name, body) in something.items():
-        temp = '"{}":'.format(name) + body
-        output.append(temp)
-    fin = ','.join(output)
-    return '{' + fin + '}'
+        if len(output) > 1:
+            append(b',')
+        (key, formatta) = compiled[name]
+        append(key)
+        write_ndarray(body, formatta, append)
+    append(b'}')
+    return b''.join(output)
+
+
+def printf_format(formatta):
+    """
+    Translates a list of "{:.Nx}"-style format strings into the equivalent printf-style ("%.Nx") format strings,
+    which is what NumPy's vectorized string formatting expects. Both styles produce the exact same output for floats.
+
+    Parameters
+    ----------
+    formatta: An array of format strings, such as the ones found in calculation_formats.
+
+    Returns
+    -------
+    A tuple of printf-style formats, as bytes.
+
+    """
+    return tuple(('%' + fmt[2:-1]).encode() for fmt in formatta)
+
+
+def compile_formats(json_dict):
+    """
+    Translates a dictionary of formats, such as the ones in calculation_formats, into the JSON key of each
+    entry (as bytes) along with its printf-style formats, which is what write_compiled_JSON(...) expects.
+    """
+    return {name: (b'"%s":' % name.encode(), printf_format(formatta)) for (name, formatta) in json_dict.items()}
+
+
+# every format of calculation_formats, translated once when the server starts
+COMPILED_FORMATS = {key: compile_formats(json_dict) for (key, json_dict) in calculation_formats.items()}
 
 
 def ndarray_to_JSON(body, formatta):
@@ -277,49 +477,146 @@ def ndarray_to_JSON(body, formatta):
     A JSON string of the ndarray, with the formats specified.
 
     """
-    # for later consideration; have it return a value that is not dict nor array
-    # if (not isinstance(body, dict)) and (not isinstance(body, numpy.ndarray)):
-    # not necessary for our needs now, but perhaps for later
+    output = []
+    write_ndarray(body, printf_format(formatta), output.append)
+    return b''.join(output).decode()
+
+
+def write_ndarray(body, formatta, append):
+    """
+    Writes the JSON of a ndarray, as chunks of bytes, through the given 'append' function.
+    This is what both write_to_JSON(...) and ndarray_to_JSON(...) uses, so that a whole response is
+    built in a single list.
 
-    # If the current 'body' is an 1D array (which either happens because of parameter being originally
-    # an 1D-array, or by an ndarray recursively calling this function for each row)...
+    Parameters
+    ----------
+    body: A ndarray symbolizing something to be converted into a JSON string.
+    formatta: A tuple of printf-style formats as bytes, one for each column of 'body'.
+    append: A function that takes a chunk of the JSON, such as the append method of a list.
+
+    """
+    # An empty ndarray of rows is simply an empty JSON array.
+    if body.ndim > 1 and len(body) == 0:
+        append(b'[]')
+        return
+    # Double check if the length of the rows is equal to the length of the format
+    if body.shape[-1] != len(formatta):
+        # should only happen if the row format of a calculation does not match
+        # the given format (example, [x, y, z] =/= [f1, f2]
+        raise SanicException(
+            ("PROCESSING ERROR",
+             "There has been an error inside of the server.",
+             "Contact system administrator for server, or try again later."),
+            status_code=500)
+    # Anything deeper than a matrix gets handled recursively, one matrix at a time.
+    if body.ndim > 2:
+        append(b'[')
+        for (index, row) in enumerate(body):
+            if index:
+                append(b',')
+            write_ndarray(row, formatta, append)
+        append(b']')
+        return
+    rows = format_rows(np.atleast_2d(body), formatta)
     if body.ndim == 1:
-        # Double check if the length of the row is equal to the length of the format
-        if len(body) == len(formatta):
-            # Format each row respectively as they should be, through indexed for-loop:
-            all = []
-            for index in range(len(body)):
-                # Retrieve the format and chopped body.
-                tempar = chop(body[index])
-                asda = formatta[index]
-                # The '-inf' produced by LMS (log10) is something that cannot be parsed by JSON;
-                # it gets remade into null instead.
-                if math.isinf(body[index]):
-                    tempar = "null"
-                    asda = "{}"
-                # Append the formatted string to the 'all' array, symbolizing 'all' elements of current row.
-                all.append(asda.format(tempar))
-            # Join them all with commas, and then output it with [ ] on either side, succesfully making it into
-            # a JSON array.
-            output = ','.join(all)
-            return '[' + output + ']'
+        append(rows[0])
+        return
+    append(b'[')
+    append(b','.join(rows))
+    append(b']')
+
+
+def format_rows(body, formatta):
+    """
+    Formats every row of a 2D ndarray into a JSON array string. The formats of a row are combined into a single
+    format string for the whole row, so that each row is formatted by one '%' operation.
+
+    Parameters
+    ----------
+    body: A 2D ndarray.
+    formatta: A tuple of printf-style formats as bytes, one for each column.
+
+    Returns
+    -------
+    A list of bytes, one JSON array for each row of 'body'.
+
+    """
+    row_format = row_format_of(formatta)
+    # Values that are practically zero gets chopped to zero, once for the whole array.
+    rows = chop(body).tolist()
+    # The '-inf' produced by LMS (log10) is something that cannot be parsed by JSON;
+    # it gets remade into null instead. Only the rows that contain any of them needs it.
+    # Reducing the whole array first is much cheaper than reducing it row by row, which is rarely needed.
+    infinite = np.isinf(body)
+    if not infinite.any():
+        return [row_format % tuple(row) for row in rows]
+    return [b'[' + b','.join([b'null' if math.isinf(value) else fmt % value for (fmt, value) in zip(formatta, row)])
+            + b']' if is_infinite else row_format % tuple(row)
+            for (row, is_infinite) in zip(rows, infinite.any(axis=1).tolist())]
+
+
+@lru_cache(maxsize=None)
+def row_format_of(formatta):
+    """
+    Helper function that combines a tuple of printf-style formats into the format string of a whole JSON array,
+    such as (b"%.1f", b"%.5f") into b"[%.1f,%.5f]".
+    """
+    return b'[' + b','.join(formatta) + b']'
+
+
+def ndarray_columns_to_JSON(body, formatta):
+    """
+    The same as ndarray_to_JSON(...) for a 2D ndarray, but writes its columns instead of its rows,
+    as a JSON array of arrays. Each column is formatted by its own format.
+
+    Parameters
+    ----------
+    body: A 2D ndarray.
+    formatta: An array of format strings, one for each column of 'body'.
+
+    Returns
+    -------
+    A JSON string of the columns of the ndarray, with the formats specified.
+
+    """
+    return b''.join(write_columns(body, printf_format(formatta))).decode()
+
+
+def write_columns(body, formatta):
+    """
+    Formats the columns of a 2D ndarray into the chunks of a JSON array of arrays. Values are chopped,
+    and '-inf' written as null, just as format_rows(...) does.
+
+    Parameters
+    ----------
+    body: A 2D ndarray.
+    formatta: A tuple of printf-style formats as bytes, one for each column.
+
+    Returns
+    -------
+    A list of bytes, which joined together are the JSON.
+
+    """
+    if body.shape[-1] != len(formatta):
+        raise SanicException(
+            ("PROCESSING ERROR",
+             "There has been an error inside of the server.",
+             "Contact system administrator for server, or try again later."),
+            status_code=500)
+    output = [b'[']
+    for (index, (fmt, column, is_infinite)) in enumerate(
+            zip(formatta, chop(body).T.tolist(), np.isinf(body).any(axis=0).tolist())):
+        if index:
+            output.append(b',')
+        if is_infinite:
+            output.append(b'[' + b','.join([b'null' if math.isinf(value) else fmt % value for value in column])
+                          + b']')
         else:
-            # should only happen if the row format of a calculation does not match
-            # the given format (example, [x, y, z] =/= [f1, f2]
-            raise SanicException(
-                ("PROCESSING ERROR",
-                 "There has been an error inside of the server.",
-                 "Contact system administrator for server, or try again later."),
-                status_code=500)
-    else:
-        # create empty array
-        temp = []
-        # for each array in current array, recursively call to each and append them to array above
-        for row in body:
-            temp.append(ndarray_to_JSON(row, formatta))
-        # join them with commas, and output with [ ]
-        output = ','.join(temp)
-        return '[' + output + ']'
+            # the format of the whole column, so that it is formatted by one '%' operation
+            output.append((b'[' + b','.join([fmt] * len(column)) + b']') % tuple(column))
+    output.append(b']')
+    return output
+
 
 # handler for old version
 @api.get("/api/v1")
@@ -331,6 +628,34 @@ async def old_version(request):
                           "Please use the newest version of the API available ({}).".format(API_VERSION)),
                          status_code=501)
 
+
+@api.before_server_start
+async def start_pool(app):
+    """
+    Starts the pool that calculations and generation of HTML runs in, so that a slow calculation does not block
+    the event loop of the worker while it runs.
+    Sanic workers are daemonic processes which are not allowed to have children, so this is a thread pool;
+    the workers themselves are what spreads the requests over several processes.
+    """
+    app.ctx.pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+@api.after_server_stop
+async def stop_pool(app):
+    app.ctx.pool.shutdown()
+
+
+async def run_in_pool(function, *args):
+    """
+    Helper function that runs a function from the endpoints below in the pool, and waits for the result
+    without blocking the event loop. If the pool has not been started, the function is simply called directly.
+    """
+    pool = getattr(api.ctx, "pool", None)
+    if pool is None:
+        return function(*args)
+    return await asyncio.get_running_loop().run_in_executor(pool, function, *args)
+
+
 """
     The endpoints for the API.     
     They are all very equal, so all meaningful comments go here.
@@ -353,259 +678,105 @@ def not_found(more):
                           "The supported endpoints are: 'calculation', 'sidemenu' or 'plot'."),
                          status_code=404)
 
-# lms
-
-
-@api.get(endpoint_creator(API_HOMEPAGE, API_VERSION, LMS_ENDPOINT) + "/<more:str>")
-async def lms(request, more: str):
-    if more == "calculation":
-        return response.raw(new_calculation_JSON(compute_LMS_modular,
-                                                 create_and_check_parameters(
-                                                     True,
-                                                     compute_LMS_modular,
-                                                     request)),
-                            content_type="application/json",
-                            headers={"cache-control": "private"})
-    if more == "sidemenu":
-        return html(LMS_sidemenu(create_and_check_parameters(
-            True,
-            compute_LMS_modular,
-            request)),
-            headers={"cache-control": "private"})
-    if more == "plot":
-        return html(LMS_graph(create_and_check_parameters(
-            True,
-            compute_LMS_modular,
-            request)),
-            headers={"cache-control": "private"})
-    else:
-        not_found(more)
-
-
-# macleod
-@api.get(endpoint_creator(API_HOMEPAGE, API_VERSION, LMS_MB_ENDPOINT) + "/<more:str>")
-async def macleod(request, more: str):
-    if more == "calculation":
-        return response.raw(new_calculation_JSON(compute_MacLeod_modular,
-                                                 create_and_check_parameters(
-                                                     True,
-                                                     compute_MacLeod_modular,
-                                                     request)),
-                            content_type="application/json",
-                            headers={"cache-control": "private"})
-    if more == "sidemenu":
-        return html(LMS_MB_sidemenu(create_and_check_parameters(
-            True,
-            compute_MacLeod_modular,
-            request)),
-            headers={"cache-control": "private"})
-    if more == "plot":
-        return html(macleod_graph(create_and_check_parameters(
-            True,
-            compute_MacLeod_modular,
-            request)),
-            headers={"cache-control": "private"})
-    else:
-        not_found(more)
-
-
-# maxwellian
-@api.get(endpoint_creator(API_HOMEPAGE, API_VERSION, LMS_MW_ENDPOINT) + "/<more:str>")
-async def maxwellian(request, more: str):
-    if more == "calculation":
-        return response.raw(new_calculation_JSON(compute_Maxwellian_modular,
-                                                 create_and_check_parameters(
-                                                     True,
-                                                     compute_Maxwellian_modular,
-                                                     request)),
-                            content_type="application/json",
-                            headers={"cache-control": "private"})
-    if more == "sidemenu":
-        return html(LMS_MW_sidemenu(create_and_check_parameters(
-            True,
-            compute_Maxwellian_modular,
-            request)),
-            headers={"cache-control": "private"})
-    if more == "plot":
-        return html(maxwellian_graph(create_and_check_parameters(
-            True,
-            compute_Maxwellian_modular,
-            request)),
-            headers={"cache-control": "private"})
-    else:
-        not_found(more)
-
-
-# xyz
-@api.get(endpoint_creator(API_HOMEPAGE, API_VERSION, XYZ_ENDPOINT) + "/<more:str>")
-async def xyz(request, more: str):
-    if more == "calculation":
-        return response.raw(new_calculation_JSON(compute_XYZ_modular,
-                                                 create_and_check_parameters(
-                                                     True,
-                                                     compute_XYZ_modular,
-                                                     request)),
-                            content_type="application/json",
-                            headers={"cache-control": "private"})
-    if more == "sidemenu":
-        return html(XYZ_sidemenu(create_and_check_parameters(
-            True,
-            compute_XYZ_modular,
-            request)),
-            headers={"cache-control": "private"})
-    if more == "plot":
-        return html(XYZ_graph(create_and_check_parameters(
-            True,
-            compute_XYZ_modular,
-            request)),
-            headers={"cache-control": "private"})
-    else:
-        not_found(more)
 
-# xy
+def response_etag(function, parameters):
+    """
+    Helper function that creates the ETag of a calculation or sidemenu response. These only depend on the
+    function generating them, the parameters and the API version, so a hash of those identifies the response
+    without generating it.
+    """
+    key = repr((API_VERSION, function.__name__, sorted(parameters.items()))).encode()
+    return '"{}"'.format(hashlib.blake2b(key, digest_size=8).hexdigest())
 
 
-@api.get(endpoint_creator(API_HOMEPAGE, API_VERSION, XY_ENDPOINT) + "/<more:str>")
-async def xy(request, more: str):
-    if more == "calculation":
-        return response.raw(
-            new_calculation_JSON(compute_XY_modular,
-                                 create_and_check_parameters(
-                                     True,
-                                     compute_XY_modular,
-                                     request)),
-            content_type="application/json",
-            headers={"cache-control": "private"})
-    if more == "sidemenu":
-        return html(XY_sidemenu(create_and_check_parameters(
-            True,
-            compute_XY_modular,
-            request)),
-            headers={"cache-control": "private"})
-    if more == "plot":
-        return html(XY_graph(create_and_check_parameters(
-            True,
-            compute_XY_modular,
-            request)),
-            headers={"cache-control": "private"})
-    else:
-        not_found(more)
-
-
-# xyz purples
-@api.get(endpoint_creator(API_HOMEPAGE, API_VERSION, XYZP_ENDPOINT) + "/<more:str>")
-async def xyz_p(request, more: str):
-    if more == "calculation":
-        return response.raw(
-            new_calculation_JSON(compute_XYZ_purples_modular,
-                                 create_and_check_parameters(
-                                     True,
-                                     compute_XYZ_purples_modular,
-                                     request)),
-            content_type="application/json",
-            headers={"cache-control": "private"})
-    if more == "sidemenu":
-        return html(XYZP_sidemenu(create_and_check_parameters(
-            True,
-            compute_XYZ_purples_modular,
-            request)),
-            headers={"cache-control": "private"})
-    if more == "plot":
-        return html(XYZP_graph(create_and_check_parameters(
-            True,
-            compute_XYZ_purples_modular,
-            request)),
-            headers={"cache-control": "private"})
-    else:
-        not_found(more)
-
-
-# xy purples
-@api.get(endpoint_creator(API_HOMEPAGE, API_VERSION, XYP_ENDPOINT) + "/<more:str>")
-async def xy_p(request, more: str):
-    if more == "calculation":
-        return response.raw(
-            new_calculation_JSON(compute_xyz_purples_modular,
-                                 create_and_check_parameters(
-                                     True,
-                                     compute_xyz_purples_modular,
-                                     request)),
-            content_type="application/json",
-            headers={"cache-control": "private"})
-    if more == "sidemenu":
-        return html(XYP_sidemenu(create_and_check_parameters(
-            True,
-            compute_xyz_purples_modular,
-            request)),
-            headers={"cache-control": "private"})
-    if more == "plot":
-        return html(xyp_graph(create_and_check_parameters(
-            True,
-            compute_xyz_purples_modular,
-            request)),
-            headers={"cache-control": "private"})
-    else:
-        not_found(more)
-
-
-# xyz standardization
-@api.get(endpoint_creator(API_HOMEPAGE, API_VERSION, XYZSTD_ENDPOINT) + "/<more:str>")
-async def xyz_std(request, more: str):
-    if more == "calculation":
-        return response.raw(
-            new_calculation_JSON(compute_XYZ_standard_modular,
-                                 create_and_check_parameters(
-                                     False,
-                                     compute_XYZ_standard_modular,
-                                     request)),
-            content_type="application/json",
-            headers={"cache-control": "private"})
-    if more == "sidemenu":
-        return html(XYZ_std_sidemenu(create_and_check_parameters(
-            False,
-            compute_XYZ_standard_modular,
-            request)),
-            headers={"cache-control": "private"})
-    if more == "plot":
-        return html(cieXYZ_std(create_and_check_parameters(
-            False,
-            compute_XYZ_standard_modular,
-            request)),
-            headers={"cache-control": "private"})
-    else:
-        not_found(more)
+def endpoint_handler(calculation, sidemenu, graph, disabled):
+    """
+    Creates the handler of an endpoint, as they only differ in which functions they use.
 
-# xy standardization
+    Parameters
+    ----------
+    calculation: The calculation function from computemodularization.py.
+    sidemenu: The function from descriptionapi.py that generates the sidemenu.
+    graph: The function from graph.py that generates the plot.
+    disabled: Passed on to create_and_check_parameters(...); False for standardization functions.
 
+    Returns
+    -------
+    An async handler taking the request and the route ('calculation', 'sidemenu' or 'plot').
 
-@api.get(endpoint_creator(API_HOMEPAGE, API_VERSION, XYSTD_ENDPOINT) + "/<more:str>")
-async def xy_std(request, more: str):
-    if more == "calculation":
-        return response.raw(
-            new_calculation_JSON(compute_xyz_standard_modular,
-                                 create_and_check_parameters(
-                                     False,
-                                     compute_xyz_standard_modular,
-                                     request)),
+    """
+
+    # bound once for the handlers below
+    raw = response.raw
+
+    async def calculation_route(request):
+        parameters = create_and_check_parameters(disabled, calculation, request)
+        # the client already has the result of these parameters, so there is no need to calculate or send it
+        headers = {"etag": response_etag(calculation, parameters), **CALCULATION_HEADERS}
+        if request.headers.get("if-none-match") == headers["etag"]:
+            return response.empty(status=304, headers=headers)
+        return raw(
+            await run_in_pool(calculation_JSON_bytes, calculation, parameters),
             content_type="application/json",
-            headers={"cache-control": "private"})
-    if more == "sidemenu":
-        return html(XY_std_sidemenu(create_and_check_parameters(
-            False,
-            compute_xyz_standard_modular,
-            request)),
-            headers={"cache-control": "private"})
-    if more == "plot":
-        return html(ciexyz_std(create_and_check_parameters(
-            False,
-            compute_xyz_standard_modular,
-            request)),
-            headers={"cache-control": "private"})
-    else:
-        not_found(more)
+            headers=headers)
+
+    async def sidemenu_route(request):
+        parameters = create_and_check_parameters(disabled, calculation, request)
+        # same as the calculations, an unchanged sidemenu is neither generated nor sent again
+        headers = {"etag": response_etag(sidemenu, parameters), **SIDEMENU_HEADERS}
+        if request.headers.get("if-none-match") == headers["etag"]:
+            return response.empty(status=304, headers=headers)
+        return html(await run_in_pool(sidemenu_HTML, sidemenu, parameters), headers=headers)
+
+    async def plot_route(request):
+        parameters = create_and_check_parameters(disabled, calculation, request)
+        # the head is sent right away, while the rest of the page is calculated in the pool
+        stream = await request.respond(content_type="text/html; charset=utf-8", headers={"cache-control": "private"})
+        await stream.send(next(graph(parameters)))
+        try:
+            body = await run_in_pool(plot_body_HTML, graph, parameters)
+        except Exception:
+            # the status has already been sent, so the page is ended with an error instead of being cut off
+            error_logger.exception("The plot of %s failed after its head was sent", request.path)
+            body = PLOT_ERROR_HTML
+        await stream.send(body)
+        await stream.eof()
+
+    routes = {
+        "calculation": calculation_route,
+        "sidemenu": sidemenu_route,
+        "plot": plot_route,
+    }
+
+    async def handler(request, more: str):
+        route = routes.get(more)
+        if route is None:
+            not_found(more)
+        return await route(request)
+
+    return handler
+
 
+# name, route, calculation, sidemenu, plot, and whether it is not a standardization function, for each endpoint
+ENDPOINTS = (
+    ("lms", LMS_ROUTE, compute_LMS_modular, LMS_sidemenu, LMS_graph, True),
+    ("macleod", LMS_MB_ROUTE, compute_MacLeod_modular, LMS_MB_sidemenu, macleod_graph, True),
+    ("maxwellian", LMS_MW_ROUTE, compute_Maxwellian_modular, LMS_MW_sidemenu, maxwellian_graph, True),
+    ("xyz", XYZ_ROUTE, compute_XYZ_modular, XYZ_sidemenu, XYZ_graph, True),
+    ("xy", XY_ROUTE, compute_XY_modular, XY_sidemenu, XY_graph, True),
+    ("xyz_p", XYZP_ROUTE, compute_XYZ_purples_modular, XYZP_sidemenu, XYZP_graph, True),
+    ("xy_p", XYP_ROUTE, compute_xyz_purples_modular, XYP_sidemenu, xyp_graph, True),
+    ("xyz_std", XYZSTD_ROUTE, compute_XYZ_standard_modular, XYZ_std_sidemenu, cieXYZ_std, False),
+    ("xy_std", XYSTD_ROUTE, compute_xyz_standard_modular, XY_std_sidemenu, ciexyz_std, False),
+)
 
-@api.route(endpoint_creator(API_HOMEPAGE, API_VERSION, STATUS_ENDPOINT), methods=["GET"])
+for (endpoint_name, endpoint_route, *endpoint) in ENDPOINTS:
+    # unexpected errors are shown as HTML, as the sidemenus and plots are HTML pages
+    api.add_route(endpoint_handler(*endpoint), endpoint_route, methods=["GET"], name=endpoint_name,
+                  error_format="html")
+
+
+@api.route(STATUS_ROUTE, methods=["GET"])
 def status_endpoint(request):
     """
     A simple endpoint that returns a status, the current uptime of the server in seconds, and the current
@@ -616,7 +787,94 @@ def status_endpoint(request):
         "uptime": str(time.time() - server_start) + "s",
         "version": API_VERSION
     }
-    return response.json(status, status=200, headers={"cache-control": "no-store"})
+    return sanic_json(status, status=200, headers={"cache-control": "no-store"})
+
+
+"""
+    Constants describing the URL parameters, used by create_and_check_parameters(...) below. They are built once
+    when the server starts, so handling a request only has to look up and compare values.
+"""
+# mandatory parameters for all functions except standardization functions
+MANDATORY_PARAMETERS = ("field_size", "age")
+# optional domain parameters, and their default values in the case they are not present
+DOMAIN_PARAMETERS = (("min", 390.0), ("max", 830.0), ("step_size", 1.0))
+# the error raised for each mandatory parameter that is absent or of an invalid type
+MISSING_ERRORS = {
+    name: ("VALUE ERROR", "Invalid input for '{}' either due to absence or invalid type".format(name),
+           "Control that '{}' is present, and is of the 'float' type.".format(name))
+    for name in MANDATORY_PARAMETERS
+}
+# the error raised for each domain parameter of an invalid type
+TYPE_ERRORS = {
+    name: ("TYPE ERROR", "Invalid input for '{}' due to invalid type".format(name),
+           "Control that the value is of a 'float' type, or remove it to use default settings.")
+    for (name, default) in DOMAIN_PARAMETERS
+}
+# allowed (inclusive) range of each numerical parameter, along with the error raised if it is outside of it
+PARAMETER_RANGES = (
+    ("field_size", 1.0, 10.0, ("VALUE ERROR", "Invalid value for 'field_size'.",
+                               "Control that the value is between 1.0 and 10.0.")),
+    ("age", 20.0, 80.0, ("VALUE ERROR", "Invalid value for 'age'",
+                         "Control that the value is between 20.0 and 80.0.")),
+    ("min", 390.0, 400.0, ("VALUE ERROR", "Invalid value for 'min'-imum domain.",
+                           "Control that the value is between 390.0 and 400.0. "
+                           "Alternatively, remove it from URL.")),
+    ("max", 700.0, 830.0, ("VALUE ERROR", "Invalid value for 'max'-imum domain.",
+                           "Control that the value is between 700.0 and 830.0.")),
+    ("step_size", 0.1, 5.0, ("VALUE ERROR", "Invalid value for 'step size'",
+                             "Control that the value is between 0.1 and 5.0.")),
+)
+# every URL parameter that is read
+URL_PARAMETERS = ("field_size", "age", "min", "max", "step_size", "optional")
+# the entries allowed in the 'optional' URL parameter
+OPTIONALS = ("log", "base", "info", "norm", "sidemenu")
+# standardization functions have no sidemenu option
+STD_OPTIONALS = ("log", "base", "info", "norm")
+# entries of 'optional' that are exclusive to the /lms endpoint
+LMS_OPTIONALS = ("log", "base")
+# entries of 'optional' that specific endpoints do not support
+UNSUPPORTED_OPTIONALS = {
+    compute_LMS_modular: ("info", "norm"),
+    compute_MacLeod_modular: ("norm",),
+    compute_Maxwellian_modular: ("norm",),
+    compute_XYZ_standard_modular: ("info", "norm"),
+    compute_xyz_standard_modular: ("norm",),
+}
+# entries of 'optional' that cannot be combined with each other, along with the error raised if they are
+EXCLUSIVE_OPTIONALS = tuple(
+    (first, second, ("Value error", "Cannot combine parameters '{}' and '{}'.".format(first, second),
+                     "Please remove one of them from the URL."))
+    for (first, second) in (("sidemenu", "info"),)
+)
+
+
+def forbidden_optionals(calculation):
+    """
+    Helper function that creates the errors for each entry of 'optional' that the endpoint of a calculation
+    does not support, used to build FORBIDDEN_OPTIONALS below.
+    """
+    forbidden = {}
+    for name in OPTIONALS:
+        if name in LMS_OPTIONALS and calculation is not compute_LMS_modular:
+            forbidden[name] = ("Value error", "Invalid usage of '{}' for endpoint.".format(name),
+                               "The '{}' parameter is exclusive to the /lms endpoint. "
+                               "Please remove it from the URL.".format(name))
+        elif name in UNSUPPORTED_OPTIONALS.get(calculation, ()):
+            forbidden[name] = ("Value error", "Invalid usage of '{}' for endpoint.".format(name),
+                               "This endpoint does not support {}. Please, verify this, and try again. "
+                               "If not, remove it from URL.".format(name))
+    return forbidden
+
+
+# the errors of every unsupported entry of 'optional', for each calculation
+FORBIDDEN_OPTIONALS = {
+    calculation: forbidden_optionals(calculation)
+    for calculation in (compute_LMS_modular, compute_MacLeod_modular, compute_Maxwellian_modular,
+                        compute_XYZ_modular, compute_XY_modular, compute_XYZ_purples_modular,
+                        compute_xyz_purples_modular, compute_XYZ_standard_modular, compute_xyz_standard_modular)
+}
+# marks a parameter that is present in the URL, but cannot be converted to its type
+INVALID = object()
 
 
 def create_and_check_parameters(disabled, calculation, request):
@@ -641,138 +899,86 @@ def create_and_check_parameters(disabled, calculation, request):
 
     """
 
+    # every URL parameter is read in a single pass, which is also the key of the cache
+    return dict(checked_parameters(disabled, calculation, tuple(map(request.args.get, URL_PARAMETERS))))
+
+
+@lru_cache(maxsize=1024)
+def parse_float(string):
+    """
+    float(string), or INVALID if the string is not a finite float ('nan' and 'inf' pass float(...), but not the
+    range checks or the calculations). Memoized, as the same few values (2.0, 10.0, the common ages) are sent
+    again and again.
+    """
+    try:
+        value = float(string)
+    except ValueError:
+        return INVALID
+    return value if math.isfinite(value) else INVALID
+
+
+# the memoized conversion of each type used by string_to_type_else(...)
+CONVERTERS = {float: parse_float}
+
+
+@lru_cache(maxsize=4096)
+def checked_parameters(disabled, calculation, arguments):
+    """
+    The cached body of create_and_check_parameters(...). The same URLs are requested again and again (the
+    calculation, sidemenu and plot of the same parameters, for one), so each combination of URL parameters
+    is only parsed and checked once. Errors are not cached, and are raised again for every request.
+
+    Parameters
+    ----------
+    disabled: See create_and_check_parameters(...).
+    calculation: See create_and_check_parameters(...).
+    arguments: A tuple of the values of the URL parameters in URL_PARAMETERS, None for those not present.
+
+    Returns
+    -------
+    A tuple of the (name, value) pairs of the parsed and treated URL parameters.
+
+    """
+    get = dict(zip(URL_PARAMETERS, arguments)).get
+
     # error handling
-    def string_to_type_else(string, given_type, other):
-        # try to make the string into an instance of type
-        try:
-            return given_type(string)
-        # if it cannot be converted to type, then return the "other"
-        except ValueError:
-            return other
-        # however, if there is a typerror (such as passing None to float()), then return None
-        except TypeError:
+    def string_to_type_else(name, given_type, other):
+        # try to make the argument into an instance of type
+        string = get(name)
+        # if the argument is not present at all, then return None
+        if string is None:
             return None
+        value = CONVERTERS[given_type](string)
+        # if it cannot be converted to type, then return the "other"
+        return other if value is INVALID else value
 
     # for all functions except standardization functions:
     if disabled:
-        # uses checkArgument to fill in all mandatory parameters
-        parameters = {
-            # mostly mandatory parameters
-            "field_size": string_to_type_else(request.args.get('field_size'), float, None),
-            "age": string_to_type_else(request.args.get('age'), float, None)
-        }
-
+        parameters = {}
         # checks if mandatory parameters are present
-        for (name, value) in parameters.items():
+        for name in MANDATORY_PARAMETERS:
+            value = string_to_type_else(name, float, None)
             if value is None:
-                raise SanicException(
-                    ("VALUE ERROR", "Invalid input for '{}' either due to absence or invalid type".format(name),
-                     "Control that '{}' is present, and is of the 'float' type.".format(name)), status_code=422)
+                raise SanicException(MISSING_ERRORS[name], status_code=422)
+            parameters[name] = value
 
         parameters['age'] = round(parameters['age'])
 
         # sees if optional parameters present, makes them default to their usual values in the case they are
         # not present
-        optionals = {
-            # are either None (if arg is not present at all),
-            # a float value if the arg is present and is a float,
-            # or a -1 if the arg is present, but not float
-            "min": string_to_type_else(request.args.get('min'), float, -1),
-            "max": string_to_type_else(request.args.get('max'), float, -1),
-            "step_size": string_to_type_else(request.args.get('step_size'), float, -1),
-        }
-
-        for (name, value) in optionals.items():
+        for (name, default) in DOMAIN_PARAMETERS:
+            value = string_to_type_else(name, float, INVALID)
             # if not correct type
-            if value is -1:
-                raise SanicException((
-                    "TYPE ERROR",
-                    "Invalid input for '{}' due to invalid type".format(name),
-                    "Control that the value is of a 'float' type, or remove it to use default settings."),
-                    status_code=422)
-            # if not present at all
-            if value is None:
-                given = 0
-                if name == "min":
-                    given = 390.0
-                if name == "max":
-                    given = 830.0
-                if name == "step_size":
-                    given = 1.0
-                parameters.update({name: given})
-            # if present and correct type
-            else:
-                parameters.update({name: float(value)})
+            if value is INVALID:
+                raise SanicException(TYPE_ERRORS[name], status_code=422)
+            parameters[name] = default if value is None else value
 
         # error handling for the values
-        if parameters['field_size'] > 10 or parameters['field_size'] < 1:
-            raise SanicException(("VALUE ERROR", "Invalid value for 'field_size'.",
-                                  "Control that the value is between 1.0 and 10.0."), status_code=422)
-        if parameters['age'] < 20 or parameters['age'] > 80:
-            raise SanicException(("VALUE ERROR", "Invalid value for 'age'",
-                                  "Control that the value is between 20.0 and 80.0."), status_code=422)
-        if parameters['min'] < 390 or parameters['min'] > 400:
-            raise SanicException(("VALUE ERROR", "Invalid value for 'min'-imum domain.",
-                                  "Control that the value is between 390.0 and 400.0. "
-                                  "Alternatively, remove it from URL."),
-                                 status_code=422)
-        if parameters['max'] > 830 or parameters['max'] < 700:
-            raise SanicException(("VALUE ERROR", "Invalid value for 'max'-imum domain.",
-                                  "Control that the value is between 700.0 and 830.0."), status_code=422)
-        if parameters['step_size'] > 5 or parameters['step_size'] < 0.1:
-            raise SanicException(("VALUE ERROR", "Invalid value for 'step size'",
-                                  "Control that the value is between 0.1 and 5.0."), status_code=422)
-
-        # ----------------------
-
-        optionals = {
-            'log': False,
-            'base': False,
-            'info': False,
-            'norm': False,
-            'sidemenu': False,
-        }
-
-        # if there is anything with "optional" in URL
-        if request.args.get('optional') is not None:
-            # split it by the comma to make a list of entries
-            params = request.args.get('optional').split(',')
-            # for every element in this list, see if it exists in the optional parameter dictionary keys; if it does,
-            # then make that key's body True
-            for param in params:
-                if param in optionals.keys():
-                    optionals[param] = True
-                else:
-                    raise SanicException(
-                        ("VALUE ERROR", "Parameter list 'optional' contains unknown parameter '{}'.".format(param),
-                         "Check if the parameter has correct value, and try again. Alternatively, remove it if not."),
-                        status_code=422)
-
-        if optionals['sidemenu'] and optionals['info']:
-            raise SanicException(("Value error", "Cannot combine parameters 'sidemenu' and 'info'.",
-                                  "Please remove one of them from the URL."), 422)
-
-        for (name, body) in optionals.items():
-            if body:
-                if (name == "log" or name == "base") and (calculation is not compute_LMS_modular):
-                    raise SanicException(("Value error",
-                                          "Invalid usage of '{}' for endpoint.".format(
-                                              name),
-                                          "The '{}' parameter is exclusive to the /lms endpoint. "
-                                          "Please remove it from the URL.".format(name)),
-                                         status_code=422)
-                if (((name == "info") and (calculation is compute_LMS_modular))
-                        or ((name == "norm") and (calculation in [compute_LMS_modular, compute_MacLeod_modular,
-                                                                  compute_Maxwellian_modular]))):
-                    raise SanicException(("Value error",
-                                          "Invalid usage of '{}' for endpoint.".format(
-                                              name),
-                                          "This endpoint does not support {}. Please, verify this, and try again. "
-                                          "If not, remove it from URL.".format(name)),
-                                         status_code=422)
-            parameters.update({
-                name: body
-            })
+        for (name, low, high, error) in PARAMETER_RANGES:
+            if parameters[name] < low or parameters[name] > high:
+                raise SanicException(error, status_code=422)
+
+        parameters.update(parse_optionals(get('optional'), OPTIONALS, calculation))
 
         # parameter that cannot be triggered by any URL parameter,
         # exclusive to XYZ-purples in usage for compute_xy_modular
@@ -781,78 +987,75 @@ def create_and_check_parameters(disabled, calculation, request):
         # std-xy needs xyz-std, saves time
         parameters['xyz-std'] = False
 
-        return parameters
+        return tuple(parameters.items())
 
     else:
-        parameters = {"field_size": string_to_type_else(
-            request.args.get('field_size'), float, None)}
+        parameters = {"field_size": string_to_type_else('field_size', float, None)}
         if parameters['field_size'] is None:
             raise SanicException(("Value error", "The value of 'field_size' is not present.",
                                  "Please make sure that the parameter is present as "
                                   "a float value that is either 2.0 or 10.0."),
                                  status_code=422)
+        # checked before the optionals, so that invalid field sizes fail without parsing them
+        if parameters['field_size'] not in STD_FIELD_SIZES:
+            raise SanicException(("Value error", "Invalid value for 'field_size'.",
+                                  "Please make sure that the parameter is present as a float "
+                                  "value that is either 2.0 or 10.0."),
+                                 status_code=422)
+
+        # standardization functions always use the default domain
+        for (name, default) in DOMAIN_PARAMETERS:
+            parameters[name] = default
+
+        parameters.update(parse_optionals(get('optional'), STD_OPTIONALS, calculation))
+
+        return tuple(parameters.items())
+
+
+def parse_optionals(given, allowed, calculation):
+    """
+    Parses the comma separated 'optional' URL parameter into a dictionary of booleans, and makes sure that
+    every entry in it is both known and supported by the endpoint.
+
+    Parameters
+    ----------
+    given: The value of the 'optional' URL parameter, or None if it is not present.
+    allowed: A tuple of the entries that 'optional' can contain.
+    calculation: The calculation function used, to make error handling for specific functions possible.
+
+    Returns
+    -------
+    A dictionary with a boolean for each of the allowed entries, or won't finish due to raised exception
+    caused by error handling.
+
+    """
+    optionals = dict.fromkeys(allowed, False)
+
+    # if there is anything with "optional" in URL
+    if given is not None:
+        # split it by the comma to make a set of entries, and make the body of every known entry True
+        entries = set(given.split(','))
+        unknown = entries.difference(optionals)
+        if unknown:
+            raise SanicException(
+                ("VALUE ERROR", "Parameter list 'optional' contains unknown parameter '{}'."
+                 .format("', '".join(sorted(unknown))),
+                 "Check if the parameter has correct value, and try again. Alternatively, remove it if not."),
+                status_code=422)
+        optionals.update(dict.fromkeys(entries, True))
+
+    for (first, second, error) in EXCLUSIVE_OPTIONALS:
+        if optionals.get(first) and optionals.get(second):
+            raise SanicException(error, 422)
+
+    forbidden = FORBIDDEN_OPTIONALS[calculation]
+    for (name, body) in optionals.items():
+        if body and name in forbidden:
+            raise SanicException(forbidden[name], status_code=422)
 
-        optionals = {
-            'log': False,
-            'base': False,
-            'info': False,
-            'norm': False
-        }
-        #                 if name == "min": given = 390.0
-        #                 if name == "max": given = 830.0
-        #                 if name == "step_size": given = 1.0
-        parameters['min'] = 390.0
-        parameters['max'] = 830.0
-        parameters['step_size'] = 1.0
-
-        # if there is anything with "optional" in URL
-        if request.args.get('optional') is not None:
-            # split it by the comma to make a list of entries
-            params = request.args.get('optional').split(',')
-            # for every element in this list, see if it exists in the optional parameter dictionary keys; if it does,
-            # then make that key's body True
-            for param in params:
-                if param in optionals.keys():
-                    optionals[param] = True
-                else:
-                    raise SanicException(
-                        (
-                            "VALUE ERROR",
-                            "Parameter list 'optional' contains unknown parameter '{}'.".format(
-                                param),
-                            "Check if the parameter has correct value, and try again. "
-                            "Alternatively, remove it if not."),
-                        status_code=422)
-            # else, if it is not in it, then throw error
-
-        for (name, body) in optionals.items():
-            if body is None:
-                if body is None:
-                    parameters.update({name: False})
-                    continue
-            if body:
-                if name == "log" or name == "base":
-                    raise SanicException(("Value error", "Invalid usage of '{}' for endpoint.".format(name),
-                                          "The '{}' parameter is exclusive to the /lms endpoint. "
-                                          " remove it from the URL.".format(
-                                              name)), status_code=422)
-                if ((name == "info") and (calculation is compute_XYZ_standard_modular)) or (name == "norm"):
-                    raise SanicException(("Value error", "Invalid usage of '{}' for endpoint.".format(name),
-                                          "This endpoint does not support {}. Please, verify this, and try again. "
-                                          "If not, remove it from URL.".format(
-                                              name)), status_code=422)
-            parameters.update({
-                name: body
-            })
-
-        if parameters['field_size'] == STD_1931 or parameters['field_size'] == STD_1964:
-            return parameters
-
-        raise SanicException(("Value error", "Invalid value for 'field_size'.",
-                              "Please make sure that the parameter is present as a float "
-                              "value that is either 2.0 or 10.0."),
-                             status_code=422)
+    return optionals
 
 
 if __name__ == '__main__':
-    api.run(host="0.0.0.0", port=8000, workers=4)
+    # one worker per CPU core, without access logs; Sanic runs on uvloop when it is installed
+    api.run(host="0.0.0.0", port=8000, fast=True, access_log=False)
@@ -21,9 +21,9 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import json
+import orjson
 import pytest
 import numpy as np
-import pandas as pd
 import cieapi as cieapi
 
 
@@ -157,6 +157,77 @@ async def test_api_endpoint():
     assert response.status == 200
 
 
+@pytest.mark.asyncio
+async def test_xyp_plot():
+    """
+        Performs a GET request to the xy-p plot, whose points on the purple line depend on the parameters, and
+        asserts the value if it is 200 (Successful).
+    """
+    req, response = await cieapi.api.asgi_client.get("/api/v2/xy-p/plot?field_size=2&age=32")
+    assert response.status == 200
+
+
+@pytest.mark.asyncio
+async def test_plot_with_info():
+    """
+        Performs a GET request to the xyz plot with the 'info' optional, which the plot does not use, and
+        asserts that the whole page is sent (Successful).
+    """
+    req, response = await cieapi.api.asgi_client.get("/api/v2/xyz/plot?field_size=2&age=32&optional=info")
+    assert response.status == 200
+    assert response.text.rstrip().endswith("</html>")
+
+
+@pytest.mark.asyncio
+async def test_repeated_optionals():
+    """
+        Performs a GET request with the same optional repeated more times than there are optionals, and
+        asserts that it is accepted like a single one (Successful).
+    """
+    req, response = await cieapi.api.asgi_client.get("/api/v2/xyz/calculation?field_size=2&age=32"
+                                                     "&optional=norm,norm,norm,norm,norm,norm,norm")
+    assert response.status == 200
+
+
+@pytest.mark.asyncio
+async def test_plot_with_nan():
+    """
+        Performs a GET request to the xyz plot with a step size of 'nan', and asserts that it is rejected before
+        any of the page is sent (Unprocessable Content).
+    """
+    req, response = await cieapi.api.asgi_client.get("/api/v2/xyz/plot?field_size=2&age=32&step_size=nan")
+    assert response.status == 422
+
+
+@pytest.mark.asyncio
+async def test_calculation_etag():
+    """
+        Performs a GET request to a calculation, and then repeats it with the ETag it got back; asserts that the
+        second one is 304 (Not Modified) without a body.
+    """
+    req, response = await cieapi.api.asgi_client.get("/api/v2/xyz/calculation?field_size=2&age=32")
+    assert response.status == 200
+    etag = response.headers["etag"]
+    req, response = await cieapi.api.asgi_client.get("/api/v2/xyz/calculation?field_size=2&age=32",
+                                                     headers={"if-none-match": etag})
+    assert response.status == 304
+    assert response.body == b""
+
+
+@pytest.mark.asyncio
+async def test_sidemenu_etag():
+    """
+        Same as test_calculation_etag(), but for a sidemenu.
+    """
+    req, response = await cieapi.api.asgi_client.get("/api/v2/xy/sidemenu?field_size=2&age=32")
+    assert response.status == 200
+    etag = response.headers["etag"]
+    req, response = await cieapi.api.asgi_client.get("/api/v2/xy/sidemenu?field_size=2&age=32",
+                                                     headers={"if-none-match": etag})
+    assert response.status == 304
+    assert response.body == b""
+
+
 def load_csv_to_array(file_path):
     """
     'load_csv_to_array()' is a helper function that just reads in a given csv file as a np ndarray,
@@ -171,7 +242,7 @@ def load_csv_to_array(file_path):
     -------
 
     """
-    return pd.read_csv(file_path, header=None).to_numpy()
+    return np.loadtxt(file_path, delimiter=',')
 
 
 # tests lms endpoint
@@ -183,7 +254,7 @@ async def test_lms_endpoint():
     """
     truth_data = load_csv_to_array("./tests/LMS-1-25-1.csv")
     req, response = await cieapi.api.asgi_client.get("/api/v2/lms/calculation?field_size=1&age=25")
-    assert np.all(np.array(json.loads(response.body)['result']) == truth_data) == True
+    assert np.array_equal(np.asarray(orjson.loads(response.body)['result']), truth_data)
     assert response.status == 200
 
 
@@ -196,7 +267,7 @@ async def test_lmsmb_endpoint():
     """
     truth_data = load_csv_to_array("./tests/LMS-MB-5-63-1.csv")
     req, response = await cieapi.api.asgi_client.get("/api/v2/lms-mb/calculation?field_size=5&age=63")
-    assert np.all(np.array(json.loads(response.body)['result']) == truth_data) == True
+    assert np.array_equal(np.asarray(orjson.loads(response.body)['result']), truth_data)
     assert response.status == 200
 
 
@@ -209,7 +280,7 @@ async def test_lmsmw_endpoint():
     """
     truth_data = load_csv_to_array("./tests/LMS-MW-45-45-1.csv")
     req, response = await cieapi.api.asgi_client.get("/api/v2/lms-mw/calculation?field_size=4.5&age=45")
-    assert np.all(np.array(json.loads(response.body)['result']) == truth_data) == True
+    assert np.array_equal(np.asarray(orjson.loads(response.body)['result']), truth_data)
     assert response.status == 200
 
 
@@ -222,7 +293,7 @@ async def test_xyz_endpoint():
     """
     truth_data = load_csv_to_array("./tests/XYZ-38-52-15.csv")
     req, response = await cieapi.api.asgi_client.get("/api/v2/xyz/calculation?field_size=3.8&age=52&step_size=1.5")
-    assert np.all(np.array(json.loads(response.body)['result']) == truth_data) == True
+    assert np.array_equal(np.asarray(orjson.loads(response.body)['result']), truth_data)
     assert response.status == 200
 
 
@@ -236,7 +307,7 @@ async def test_xy_endpoint():
     """
     truth_data = load_csv_to_array("./tests/XY-31-71-1.csv")
     req, response = await cieapi.api.asgi_client.get("/api/v2/xy/calculation?field_size=3.1&age=71")
-    assert np.all(np.array(json.loads(response.body)['result']) == truth_data) == True
+    assert np.array_equal(np.asarray(orjson.loads(response.body)['result']), truth_data)
     assert response.status == 200
 
 
@@ -250,7 +321,7 @@ async def test_xyp_endpoint():
     """
     truth_data = load_csv_to_array("./tests/XYP-20-32-1.csv")
     req, response = await cieapi.api.asgi_client.get("/api/v2/xy-p/calculation?field_size=2&age=32")
-    assert np.all(np.array(json.loads(response.body)['result']) == truth_data) == True
+    assert np.array_equal(np.asarray(orjson.loads(response.body)['result']), truth_data)
     assert response.status == 200
 
 
@@ -263,7 +334,7 @@ async def test_xyzstd_endpoint():
     """
     truth_data = load_csv_to_array("./tests/XYZ-STD-2.csv")
     req, response = await cieapi.api.asgi_client.get("/api/v2/xyz-std/calculation?field_size=2")
-    assert np.all(np.array(json.loads(response.body)['result']) == truth_data) == True
+    assert np.array_equal(np.asarray(orjson.loads(response.body)['result']), truth_data)
     assert response.status == 200
 
 
@@ -276,7 +347,7 @@ async def test_xystd_endpoint():
     """
     truth_data = load_csv_to_array("./tests/XY-STD-2.csv")
     req, response = await cieapi.api.asgi_client.get("/api/v2/xy-std/calculation?field_size=2")
-    assert np.all(np.array(json.loads(response.body)['plot']) == truth_data) == True
+    assert np.array_equal(np.asarray(orjson.loads(response.body)['plot']), truth_data)
     assert response.status == 200
 
 
@@ -294,7 +365,7 @@ async def test_param1_endpoint():
                  '0.663468,0.951054],[699.9,0.969648,0]]}')
     req, response = await cieapi.api.asgi_client.get("/api/v2/lms-mb/calculation"
                                                      "?field_size=1.5&age=51&max=700&optional=info")
-    assert json.loads(response.body) == json.loads(test_case)
+    assert orjson.loads(response.body) == orjson.loads(test_case)
 
 
 @pytest.mark.asyncio
@@ -302,7 +373,7 @@ async def test_param2_endpoint():
     test_case = ('{"white":[0.333300,0.333330,0.333370],"tg_purple":[[360.200000,0.182210,0.019980],'
                  '[700.900000,0.720360,0.279640]]}')
     req, response = await cieapi.api.asgi_client.get("/api/v2/xy-std/calculation?field_size=10.0&optional=info")
-    assert json.loads(response.body) == json.loads(test_case)
+    assert orjson.loads(response.body) == orjson.loads(test_case)
 
 
 @pytest.mark.asyncio
@@ -311,7 +382,7 @@ async def test_param3_endpoint():
                  '0.72329,0.27671]],"XYZ_tg_purple":[[409.70000,0.08657,0.00879,0.43561],[703.30000,0.00863,0.00330,'
                  '0.00000]]}')
     req, response = await cieapi.api.asgi_client.get("/api/v2/xy-p/calculation?field_size=2&age=32&optional=info")
-    assert json.loads(response.body) == json.loads(test_case)
+    assert orjson.loads(response.body) == orjson.loads(test_case)
 
 
 @pytest.mark.asyncio
@@ -319,4 +390,4 @@ async def test_param4_endpoint():
     test_case = ('{"trans_mat":[[1.93122240,-1.42718225,0.40529507],[0.68367008,0.35153487,0.00000000],[0.00000000,'
                  '0.00000000,1.94811216]]}')
     req, response = await cieapi.api.asgi_client.get("/api/v2/xyz-p/calculation?field_size=2.0&age=20&optional=info")
-    assert json.loads(response.body) == json.loads(test_case)
+    assert orjson.loads(response.body) == orjson.loads(test_case)
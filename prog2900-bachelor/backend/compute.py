@@ -4,7 +4,7 @@ import numpy as np
 import scipy.optimize
 import scipy.interpolate
 import warnings
-from scipy.spatial import Delaunay
+from scipy.spatial import ConvexHull
 from utils import resource_path
 
 def my_round(x, n=0):
@@ -187,8 +187,12 @@ def chrom_coords_µ(tristimulus_µ):
     # µ denotes wavelength/complementary wavelength
     (µ, A_µ, B_µ, C_µ) = tristimulus_µ.T
     sumABC_µ = A_µ + B_µ + C_µ
-    cc_µ = np.array([µ, A_µ / sumABC_µ, B_µ / sumABC_µ, C_µ / sumABC_µ]).T
-    return cc_µ
+    # one division of all three columns by the shared sum, written
+    # straight into the (transposed) result
+    cc_µ = np.empty((4, len(µ)))
+    cc_µ[0] = µ
+    np.divide(tristimulus_µ.T[1:], sumABC_µ, out=cc_µ[1:])
+    return cc_µ.T
 def chrom_coords_E(tristimulus_λ):
     """
     Compute the chromaticity coordinates of Illuminant E from
@@ -566,42 +570,82 @@ def square_sum(a13, a21, a22, a33, L_spline, M_spline, S_spline, V_spline,
     ok : bool
         Hit the correct minimum wavelength.
     """
+    terms = square_sum_terms(L_spline, M_spline, S_spline, V_spline,
+                             λ, λ_ref_min, xyz_ref)
+    return square_sum_from_terms(a13, a21, a22, a33, terms, λ_ref_min,
+                                 full_results)
+def square_sum_terms(L_spline, M_spline, S_spline, V_spline,
+                     λ, λ_ref_min, xyz_ref):
+    """
+    Compute the parts of square_sum that do not depend on a13, so that
+    they can be computed once for the whole optimisation rather than once
+    per evaluation. See square_sum for the parameters.
+    Returns
+    -------
+    terms : tuple
+        Reference values, spline values and spline sums used by
+        square_sum_from_terms.
+    """
     # Stripping reference values in accordance with CIE2006 tables
     xyz_ref_trunk = xyz_ref[30:, 1:].T
     x_ref_min = xyz_ref_trunk[0, :].min()
+    # Spline values
+    L_ref_min = L_spline(λ_ref_min)
+    M_ref_min = M_spline(λ_ref_min)
+    S_ref_min = S_spline(λ_ref_min)
+    L_sum = L_spline(λ).sum()
+    M_sum = M_spline(λ).sum()
+    S_sum = S_spline(λ).sum()
+    V_sum = V_spline(λ).sum()
+    λ_test = np.arange(390, 831)
+    LMS = np.array([L_spline(λ_test),
+                    M_spline(λ_test),
+                    S_spline(λ_test)])
+    return (xyz_ref_trunk, x_ref_min,
+            L_ref_min, M_ref_min, S_ref_min,
+            L_sum, M_sum, S_sum, V_sum,
+            λ_test, LMS)
+def square_sum_from_terms(a13, a21, a22, a33, terms, λ_ref_min,
+                          full_results=False):
+    """
+    Compute square_sum from the terms computed by square_sum_terms. This
+    is the function to be optimised; see square_sum for the parameters
+    and return values.
+    """
+    (xyz_ref_trunk, x_ref_min,
+     L_ref_min, M_ref_min, S_ref_min,
+     L_sum, M_sum, S_sum, V_sum,
+     λ_test, LMS) = terms
     # Transformation coefficients (a11 and a12 computed by Mathematica)
     a11 = (((a13 * (1 - x_ref_min) *
-             (M_spline(λ_ref_min) * S_spline(λ).sum() -
-              S_spline(λ_ref_min) * M_spline(λ).sum())) +
+             (M_ref_min * S_sum -
+              S_ref_min * M_sum)) +
             (x_ref_min *
-             (a21 * L_spline(λ_ref_min) + a22 * M_spline(λ_ref_min) +
-              a33 * S_spline(λ_ref_min)) * M_spline(λ).sum()) -
-            ((1 - x_ref_min) * M_spline(λ_ref_min) * V_spline(λ).sum())) /
+             (a21 * L_ref_min + a22 * M_ref_min +
+              a33 * S_ref_min) * M_sum) -
+            ((1 - x_ref_min) * M_ref_min * V_sum)) /
            ((1 - x_ref_min) *
-            (L_spline(λ_ref_min) * M_spline(λ).sum() -
-             M_spline(λ_ref_min) * L_spline(λ).sum())))
+            (L_ref_min * M_sum -
+             M_ref_min * L_sum)))
     a12 = (((a13 * (1 - x_ref_min) *
-             (L_spline(λ_ref_min) * S_spline(λ).sum() -
-              S_spline(λ_ref_min) * L_spline(λ).sum())) +
+             (L_ref_min * S_sum -
+              S_ref_min * L_sum)) +
             (x_ref_min *
-             (a21 * L_spline(λ_ref_min) + a22 * M_spline(λ_ref_min) +
-              a33 * S_spline(λ_ref_min)) * L_spline(λ).sum()) -
-            ((1 - x_ref_min) * L_spline(λ_ref_min) * V_spline(λ).sum())) /
+             (a21 * L_ref_min + a22 * M_ref_min +
+              a33 * S_ref_min) * L_sum) -
+            ((1 - x_ref_min) * L_ref_min * V_sum)) /
            ((1 - x_ref_min) *
-            (M_spline(λ_ref_min) * L_spline(λ).sum() -
-             L_spline(λ_ref_min) * M_spline(λ).sum())))
+            (M_ref_min * L_sum -
+             L_ref_min * M_sum)))
     a11 = my_round(a11[0], 8)
     a12 = my_round(a12[0], 8)
     a13 = my_round(a13[0], 8)
     trans_mat = np.array([[a11, a12, a13], [a21, a22, 0], [0, 0, a33]])
-    LMS = np.array([L_spline(np.arange(390, 831)),
-                    M_spline(np.arange(390, 831)),
-                    S_spline(np.arange(390, 831))])
     (X, Y, Z) = sign_figs(np.dot(trans_mat, LMS), 7)
     sumXYZ = X + Y + Z
     xyz = np.array([X / sumXYZ, Y / sumXYZ, Z / sumXYZ])
     err = ((xyz - xyz_ref_trunk)**2).sum()
-    λ_test_min = np.arange(390, 831)[xyz[0, :].argmin()]
+    λ_test_min = λ_test[xyz[0, :].argmin()]
     ok = (λ_test_min == λ_ref_min)
     if not ok:
         err = err + np.inf
@@ -641,30 +685,33 @@ def tangent_points_purple_line(chrom_coords_λ, MacLeod_Boynton=False,
         corresponding wavelengths in first column.
     """
     cc = chrom_coords_λ
+    # Only the convex hull is needed, not a full triangulation
     if MacLeod_Boynton:
-        delaunay = Delaunay(cc[:, 1:4:2])
+        hull = ConvexHull(cc[:, 1:4:2]).simplices
     else:
-        delaunay = Delaunay(cc[:, 1:3])
-    ind = np.argmax(np.abs(
-        delaunay.convex_hull[:, 0] - delaunay.convex_hull[:, 1]))
+        hull = ConvexHull(cc[:, 1:3]).simplices
+    # The purple line is the hull edge between the most distant wavelengths;
+    # shortest wavelength first
+    ind = np.argmax(np.abs(hull[:, 0] - hull[:, 1]))
+    (ind_0, ind_1) = np.sort(hull[ind])
     cc_tg_purple = np.zeros((2, 3))  # initialise for in-place editing
     if MacLeod_Boynton:
-        cc_tg_purple[0, 0] = cc[delaunay.convex_hull[ind, 0], 0]
-        cc_tg_purple[0, 1] = cc[delaunay.convex_hull[ind, 0], 1]
-        cc_tg_purple[0, 2] = cc[delaunay.convex_hull[ind, 0], 3]
-        cc_tg_purple[1, 0] = cc[delaunay.convex_hull[ind, 1], 0]
-        cc_tg_purple[1, 1] = cc[delaunay.convex_hull[ind, 1], 1]
-        cc_tg_purple[1, 2] = cc[delaunay.convex_hull[ind, 1], 3]
+        cc_tg_purple[0, 0] = cc[ind_0, 0]
+        cc_tg_purple[0, 1] = cc[ind_0, 1]
+        cc_tg_purple[0, 2] = cc[ind_0, 3]
+        cc_tg_purple[1, 0] = cc[ind_1, 0]
+        cc_tg_purple[1, 1] = cc[ind_1, 1]
+        cc_tg_purple[1, 2] = cc[ind_1, 3]
     else:
-        cc_tg_purple[0, :3] = cc[delaunay.convex_hull[ind, 0], :3]
-        cc_tg_purple[1, :3] = cc[delaunay.convex_hull[ind, 1], :3]
+        cc_tg_purple[0, :3] = cc[ind_0, :3]
+        cc_tg_purple[1, :3] = cc[ind_1, :3]
     if tristimulus_λ is None:
         return cc_tg_purple
     else:
         ts = tristimulus_λ
         ts_tg_purple = np.zeros((2, 4))  # initialise for in-place editing
-        ts_tg_purple[0, :4] = ts[delaunay.convex_hull[ind, 0], :4]
-        ts_tg_purple[1, :3] = ts[delaunay.convex_hull[ind, 1], :3]
+        ts_tg_purple[0, :4] = ts[ind_0, :4]
+        ts_tg_purple[1, :3] = ts[ind_1, :3]
         return (cc_tg_purple, ts_tg_purple)
 def XYZ_purples(xyz_λ, xyz_E, XYZ_tg_purple_line):
     """
@@ -31,12 +31,152 @@ import numpy as np
 import scipy.optimize
 import scipy.interpolate
 import warnings
+from functools import lru_cache, partial, wraps
 
 from compute import my_round, sign_figs, chrom_coords_µ, LMS_energy, chop, Vλ_energy_and_LM_weights, \
     tangent_points_purple_line, chrom_coords_E, VisualData, xyz_interpolated_reference_system, linear_transformation_λ, \
-    square_sum, XYZ_purples, compute_CIE_standard_XYZ
+    square_sum_terms, square_sum_from_terms, XYZ_purples, compute_CIE_standard_XYZ
 
 
+# the parameters that the calculations below depend on
+CALCULATION_PARAMETERS = ("field_size", "age", "min", "max", "step_size", "base", "log", "info", "norm", "purple")
+# the parameters that compute_LMS_modular(...) depends on; its results are the same with and without 'info'
+LMS_PARAMETERS = ("field_size", "age", "min", "max", "step_size", "base", "log")
+# the parameters that the CIE standard calculations depend on; they are the same for any age and domain
+STANDARD_PARAMETERS = ("field_size", "info")
+
+
+def memoize_calculation(calculation, names=CALCULATION_PARAMETERS):
+    """
+    Decorator that caches the results of a calculation below, keyed on the parameters it depends on. The
+    calculation, sidemenu and plot of the same parameters all use the same calculations, and so do the
+    calculations themselves (compute_XYZ_purples_modular(...) uses compute_XY_modular(...), and so on).
+
+    The parameters it depends on are kept as 'parameter_names' of the cached version, so that what is
+    made from its results can be cached the same way.
+
+    The ndarrays of a cached result are made read-only, as they are shared by every caller of the
+    calculation. A calculation is allowed to change the parameters it is given (such as setting 'base'), and
+    those changes are applied to the parameters of every caller, as if the calculation had run.
+
+    Parameters
+    ----------
+    calculation: A function from this module, taking a dictionary of parameters.
+    names: The parameters the calculation depends on. Calculations that only differ in the others share
+        the same result.
+
+    Returns
+    -------
+    The cached version of the calculation.
+
+    """
+
+    @lru_cache(maxsize=32)
+    def cached(key):
+        parameters = dict(key)
+        result = calculation(parameters)
+        for body in result.values():
+            if isinstance(body, np.ndarray):
+                body.setflags(write=False)
+        changes = tuple((name, parameters[name]) for name in names if name in parameters)
+        return result, changes
+
+    @wraps(calculation)
+    def memoized(parameters):
+        (result, changes) = cached(tuple((name, parameters[name]) for name in names if name in parameters))
+        parameters.update(changes)
+        return dict(result)
+
+    memoized.parameter_names = names
+    return memoized
+
+
+@lru_cache(maxsize=64)
+def wavelengths(minimum, maximum, step_size):
+    """
+    The wavelengths from minimum to maximum (inclusive) with the given step size, which the results of the
+    calculations are given for. Cached, as only a few domains are commonly used, and read-only as it is shared.
+    """
+    wavelength = np.arange(minimum, maximum + .01, step_size)
+    wavelength.setflags(write=False)
+    return wavelength
+
+
+@lru_cache(maxsize=64)
+def plot_wavelengths(minimum, maximum):
+    """
+    The wavelengths from minimum to maximum (inclusive) with a step of 0.1 nm, which the plots are drawn with.
+    Cached and read-only, the same way as wavelengths(...).
+    """
+    wavelength = my_round(np.arange(minimum, maximum + .01, .1), 1)
+    wavelength.setflags(write=False)
+    return wavelength
+
+
+@lru_cache(maxsize=64)
+def cached_LMS_energy(field_size, age, base=False):
+    """
+    The energy-based LMS cone fundamentals of LMS_energy(...) from compute.py, without the maximum values.
+    They only depend on the field size and age, so they are cached, and read-only as they are shared.
+    The table is stored column by column, as it is used through its columns (LMS.T), which are then contiguous.
+    """
+    LMS = np.asfortranarray(LMS_energy(field_size, age, base=base)[0])
+    LMS.setflags(write=False)
+    return LMS
+
+
+@lru_cache(maxsize=64)
+def cached_Vλ_energy_and_LM_weights(field_size, age):
+    """
+    Vλ_energy_and_LM_weights(...) from compute.py, cached and read-only the same way as cached_LMS_energy(...).
+    """
+    (Vλ, LM_weights) = Vλ_energy_and_LM_weights(field_size, age)
+    Vλ = np.asfortranarray(Vλ)
+    Vλ.setflags(write=False)
+    return (Vλ, LM_weights)
+
+
+@lru_cache(maxsize=64)
+def LMS_splines(field_size, age, base=False):
+    """
+    The splines of the L, M and S cone fundamentals of cached_LMS_energy(...). Building a spline is most of the
+    cost of interpolating with it, so they are cached the same way; evaluating a spline does not change it.
+    """
+    (λ_all, L, M, S) = cached_LMS_energy(field_size, age, base).T
+    return (scipy.interpolate.InterpolatedUnivariateSpline(λ_all, L),
+            scipy.interpolate.InterpolatedUnivariateSpline(λ_all, M),
+            scipy.interpolate.InterpolatedUnivariateSpline(λ_all, S))
+
+
+@lru_cache(maxsize=64)
+def LMS_bspline(field_size, age, base=False):
+    """
+    The splines of LMS_splines(...) combined into a single B-spline with a column for each of L, M and S, so that
+    a grid is evaluated for all three in one call. The splines are fitted to the same wavelengths and share the
+    same knots, so the values are exactly the ones of the separate splines.
+    """
+    splines = LMS_splines(field_size, age, base)
+    knots = splines[0].get_knots()
+    if not all(np.array_equal(spline.get_knots(), knots) for spline in splines[1:]):
+        raise ValueError("The L, M and S splines do not share the same knots.")
+    # the splines are cubic (the default degree), and get_knots() leaves out the repeats of the end knots
+    degree = 3
+    knots = np.concatenate((np.repeat(knots[0], degree), knots, np.repeat(knots[-1], degree)))
+    coefficients = np.stack([spline.get_coeffs() for spline in splines], axis=1)
+    return scipy.interpolate.BSpline(knots, coefficients, degree)
+
+
+@lru_cache(maxsize=64)
+def Vλ_spline(field_size, age):
+    """
+    The spline of the V(λ) function of cached_Vλ_energy_and_LM_weights(...), cached the same way as
+    LMS_splines(...).
+    """
+    (λ_all, V_std_all) = cached_Vλ_energy_and_LM_weights(field_size, age)[0].T
+    return scipy.interpolate.InterpolatedUnivariateSpline(λ_all, V_std_all)
+
+
+@partial(memoize_calculation, names=LMS_PARAMETERS)
 def compute_LMS_modular(parameters):
     """
     A modularized version of 'compute_LMS(...)' from compute.py, calculates logarithmic values
@@ -53,21 +193,6 @@ def compute_LMS_modular(parameters):
     """
 
     def inner_LMS(variation):
-        # compute.py line 1761
-        LMS_base_all = LMS_energy(
-            parameters['field_size'], parameters['age'])[0]
-        if parameters['base']:
-            # compute.py line 1758
-            LMS_base_all = LMS_energy(
-                parameters['field_size'], parameters['age'], base=True)[0]
-        # compute.py, line 1775
-        (λ_all, L, M, S) = LMS_base_all.T
-
-        # compute.py, lines 1776-1785
-        L_spline = scipy.interpolate.InterpolatedUnivariateSpline(λ_all, L)
-        M_spline = scipy.interpolate.InterpolatedUnivariateSpline(λ_all, M)
-        S_spline = scipy.interpolate.InterpolatedUnivariateSpline(λ_all, S)
-
         # compute.py, lines 892-897
         LMS_sf = 6
         logLMS_dp = 5
@@ -75,31 +200,31 @@ def compute_LMS_modular(parameters):
             LMS_sf = 9
             logLMS_dp = 8
 
-        # compute.py lines 899-902
-        (La, Ma, Sa) = np.array([sign_figs(L_spline(variation), LMS_sf),
-                                 sign_figs(M_spline(variation), LMS_sf),
-                                 sign_figs(S_spline(variation), LMS_sf)])
-        LMS = chop(np.array([variation, La, Ma, Sa]).T)
+        # compute.py lines 899-902, and 1758-1785 for the splines
+        (La, Ma, Sa) = sign_figs(LMS_bspline(
+            parameters['field_size'], parameters['age'], parameters['base'])(variation).T, LMS_sf)
+        LMS = chop(np.column_stack((variation, La, Ma, Sa)))
 
         if parameters['log']:
-            # compute.py, line 905-907
-            LMS[:, 1:][LMS[:, 1:] == 0] = -np.inf
-            LMS[:, 1:][LMS[:, 1:] > 0] = my_round(
-                np.log10(LMS[:, 1:][LMS[:, 1:] > 0]), logLMS_dp)
+            # compute.py, line 905-907, in place and without gathering the positive values first
+            values = LMS[:, 1:]
+            positive = values > 0
+            logarithm = my_round(np.log10(values, out=np.zeros_like(values), where=positive), logLMS_dp)
+            np.copyto(values, -np.inf, where=values == 0)
+            np.copyto(values, logarithm, where=positive)
             LMS[:, 0] = my_round(LMS[:, 0], 1)
             return LMS
         else:
             LMS[:, 0] = my_round(LMS[:, 0], 1)
             return LMS
 
-    dict = {
-        "result": inner_LMS(np.arange(parameters['min'], parameters['max'] + .01, parameters['step_size'])),
-        "plot": inner_LMS(my_round(np.arange(parameters['min'], parameters['max'] + .01, .1), 1))
+    return {
+        "result": inner_LMS(wavelengths(parameters['min'], parameters['max'], parameters['step_size'])),
+        "plot": inner_LMS(plot_wavelengths(parameters['min'], parameters['max']))
     }
 
-    return dict
-
 
+@memoize_calculation
 def compute_MacLeod_modular(parameters):
     """
     A modularized version of 'compute_MacLeod_Boynton_diagram(...)' from compute.py,
@@ -126,31 +251,22 @@ def compute_MacLeod_modular(parameters):
     (λ_plot, L_plot, M_plot, S_plot) = LMS_results['plot'].T
 
     # compute.py, line 1768
-    (Vλ_all, LM_weights) = Vλ_energy_and_LM_weights(
+    (Vλ_all, LM_weights) = cached_Vλ_energy_and_LM_weights(
         parameters['field_size'], parameters['age'])
     # compute.py, line 1758
-    LMS_all = LMS_energy(parameters['field_size'],
-                         parameters['age'], base=True)[0]
-
-    # compute.py, line 1781
-    (λ_all, V_std_all) = Vλ_all.T
-    # compute.py, line 1785
-    V_std_spline = scipy.interpolate.InterpolatedUnivariateSpline(
-        λ_all, V_std_all)
-    # compute.py, line 1794
-    Vλ_spec = np.array([λ_spec, V_std_spline(λ_spec)]).T
+    LMS_all = cached_LMS_energy(parameters['field_size'],
+                                parameters['age'], True)
 
     # compute.py, line 983
     S_all = (LMS_all.T)[3]
     V_all = (Vλ_all.T)[1]
-    V_spec = (Vλ_spec.T)[1]
 
     # compute.py, lines 986-992
     (κL, κM) = LM_weights  # k: kappa (greek letter)
     κS = 1 / np.max(S_all / V_all)
     V_plot = sign_figs(κL * L_plot + κM * M_plot, 7)
-    lms_mb_plot = np.array(
-        [λ_plot, κL * L_plot / V_plot, κM * M_plot / V_plot, κS * S_plot / V_plot]).T
+    lms_mb_plot = np.column_stack(
+        (λ_plot, κL * L_plot / V_plot, κM * M_plot / V_plot, κS * S_plot / V_plot))
 
     if parameters['info']:
         # compute.py, lines 1000-1007
@@ -177,9 +293,14 @@ def compute_MacLeod_modular(parameters):
         }
         return output
     else:
+        # the tabulated V(λ) is only needed for the result, not for info
+        # compute.py, lines 1781-1785
+        V_std_spline = Vλ_spline(parameters['field_size'], parameters['age'])
+        # compute.py, line 1794
+        V_spec = V_std_spline(λ_spec)
         # compute.py, lines 988-993
-        lms_mb_spec = np.array(
-            [λ_spec, κL * L_spec / V_spec, κM * M_spec / V_spec, κS * S_spec / V_spec]).T
+        lms_mb_spec = np.column_stack(
+            (λ_spec, κL * L_spec / V_spec, κM * M_spec / V_spec, κS * S_spec / V_spec))
         lms_mb_spec[:, 1:] = my_round(lms_mb_spec[:, 1:], 6)
         return {
             "result": lms_mb_spec,
@@ -187,6 +308,7 @@ def compute_MacLeod_modular(parameters):
         }
 
 
+@memoize_calculation
 def compute_Maxwellian_modular(parameters):
     """
     A modularized version of 'compute_Maxwellian_diagram(...)' from compute.py, modularized
@@ -213,15 +335,15 @@ def compute_Maxwellian_modular(parameters):
 
     # compute.py, lines 1074-1082
     (kL, kM, kS) = (1. / np.sum(L_spec), 1. / np.sum(M_spec), 1. / np.sum(S_spec))
-    LMS_spec_N = np.array([λ_spec, kL * L_spec, kM * M_spec, kS * S_spec]).T
-    lms_mw_spec = chrom_coords_µ(LMS_spec_N)
-    lms_mw_spec[:, 1:] = my_round(lms_mw_spec[:, 1:], 6)
+    LMS_spec_N = np.column_stack((λ_spec, kL * L_spec, kM * M_spec, kS * S_spec))
     (cL, cM, cS) = (1. / np.sum(L_plot), 1. / np.sum(M_plot), 1. / np.sum(S_plot))
-    LMS_plot_N = np.array([λ_plot, cL * L_plot, cM * M_plot, cS * S_plot]).T
+    LMS_plot_N = np.column_stack((λ_plot, cL * L_plot, cM * M_plot, cS * S_plot))
     lms_mw_plot = chrom_coords_µ(LMS_plot_N)
 
     # returns non-info before info calculations to save performance
     if not parameters['info']:
+        lms_mw_spec = chrom_coords_µ(LMS_spec_N)
+        lms_mw_spec[:, 1:] = my_round(lms_mw_spec[:, 1:], 6)
         return {
             "result": lms_mw_spec,
             "plot": lms_mw_plot
@@ -236,7 +358,7 @@ def compute_Maxwellian_modular(parameters):
         lms_mw_tg_purple[:, 0] = my_round(lms_mw_tg_purple[:, 0], 1)
         lms_mw_tg_purple[:, 1:] = my_round(lms_mw_tg_purple[:, 1:], 6)
         # could be updated to also have those values, but little value in that
-        dict = {
+        return {
             # compute.py, line 1091
             "norm": np.array([kL, kM, kS]),
             # compute.py, line 1085
@@ -245,55 +367,37 @@ def compute_Maxwellian_modular(parameters):
             "tg_purple": lms_mw_tg_purple,
             # "tg_purple_plot": lms_mw_tg_purple_plot
         }
-        return dict
 
 
-def compute_XYZ_modular(parameters):
+@lru_cache(maxsize=64)
+def transformation_matrix(field_size, age):
     """
-    A modularized version of the original 'compute_XYZ(...)' from compute.py, designed
-    to separate calculations from 'info' and non info.
+    The (non-renormalized) transformation matrix of the linear transformation LMS --> XYZ, found by optimizing
+    square_sum(...) from compute.py. It is by far the most expensive part of the XYZ calculations, and only
+    depends on the field size and age, so it is cached (and read-only as it is shared).
 
     Parameters
     ----------
-    parameters: A dictionary containing the processed information from URL parameters.
+    field_size: Field size in degrees.
+    age: Age in years.
 
     Returns
     -------
-    A ndarray of CIE cone-fundamental-based XYZ tristimulus functions given the parameters.
+    The 3x3 transformation matrix as a ndarray.
 
     """
-    # XYZ uses LMS-base for calculations, needs that
-    # parameter adjustment for LMS-base
-    parameters['base'] = True
-    parameters['log'] = False
-    # specific results are dependent on other plot/result values
-
-    LMS_results = compute_LMS_modular(parameters)
-    LMS_spec = LMS_results['result']
-    LMS_plot = LMS_results['plot']
-
     # compute.py, line 1758
-    LMS_all = LMS_energy(parameters['field_size'],
-                         parameters['age'], base=True)[0]
+    LMS_all = cached_LMS_energy(field_size, age, True)
     # compute.py, line 1768
-    (Vλ_std_all, LM_weights) = Vλ_energy_and_LM_weights(
-        parameters['field_size'], parameters['age'])
-    # compute.py, line 1775
-    (λ_all, L_base_all, M_base_all, S_base_all) = LMS_all.T
-    # compute.py, line 1781
-    (λ_all, V_std_all) = Vλ_std_all.T
-    # compute.py, line 1776-1778
-    L_spline = scipy.interpolate.InterpolatedUnivariateSpline(
-        λ_all, L_base_all)
-    M_spline = scipy.interpolate.InterpolatedUnivariateSpline(
-        λ_all, M_base_all)
-    S_spline = scipy.interpolate.InterpolatedUnivariateSpline(
-        λ_all, S_base_all)
-    V_spline = scipy.interpolate.InterpolatedUnivariateSpline(λ_all, V_std_all)
+    LM_weights = cached_Vλ_energy_and_LM_weights(field_size, age)[1]
+    # compute.py, lines 1775-1785
+    (L_spline, M_spline, S_spline) = LMS_splines(field_size, age, True)
+    V_spline = Vλ_spline(field_size, age)
 
     # compute.py, lines 1904-1905
+    # it only reads the tables, so they do not have to be copied
     xyz_ref = xyz_interpolated_reference_system(
-        parameters['field_size'], VisualData.XYZ31.copy(), VisualData.XYZ64.copy())
+        field_size, VisualData.XYZ31, VisualData.XYZ64)
 
     # compute.py, lines 1165-1202
     (a21, a22) = LM_weights
@@ -304,30 +408,81 @@ def compute_XYZ_modular(parameters):
     λ_x_min_ref = 502
     ok = False
     while not ok:
+        # everything in square_sum(...) but a13 is the same throughout an optimization, so it is computed once
+        terms = square_sum_terms(L_spline, M_spline, S_spline, V_spline,
+                                 λ_main, λ_x_min_ref, xyz_ref)
         with warnings.catch_warnings():
             warnings.simplefilter('ignore')
             a13 = scipy.optimize.fmin(
-                square_sum, 0.39, (a21, a22, a33,
-                                   L_spline, M_spline, S_spline,
-                                   V_spline,
-                                   λ_main, λ_x_min_ref,
-                                   xyz_ref, False),
+                square_sum_from_terms, 0.39, (a21, a22, a33,
+                                              terms, λ_x_min_ref, False),
                 xtol=10 ** (-(10)), disp=False)  # exp: -(mat_dp + 2) = -10
         trans_mat, λ_x_min_ref, ok = (
-            square_sum(a13, a21, a22, a33,
-                       L_spline, M_spline, S_spline,
-                       V_spline,
-                       λ_main, λ_x_min_ref,
-                       xyz_ref, True)[1:])
-    (λ_spec,
-     X_exact_spec,
-     Y_exact_spec,
-     Z_exact_spec) = linear_transformation_λ(trans_mat, LMS_spec).T
+            square_sum_from_terms(a13, a21, a22, a33,
+                                  terms, λ_x_min_ref, True)[1:])
+    trans_mat.setflags(write=False)
+    return trans_mat
+
+
+def XYZ_tristimulus(trans_mat, LMS):
+    """
+    The XYZ tristimulus values of a LMS table (wavelengths in first column) given the transformation matrix,
+    to 7 significant figures; compute.py, lines 1207-1217.
+    """
+    XYZ = linear_transformation_λ(trans_mat, LMS)
+    XYZ[:, 1:] = sign_figs(XYZ[:, 1:], 7)
+    return XYZ
+
+
+@memoize_calculation
+def compute_XYZ_modular(parameters):
+    """
+    A modularized version of the original 'compute_XYZ(...)' from compute.py, designed
+    to separate calculations from 'info' and non info.
+
+    Parameters
+    ----------
+    parameters: A dictionary containing the processed information from URL parameters.
+
+    Returns
+    -------
+    A ndarray of CIE cone-fundamental-based XYZ tristimulus functions given the parameters.
+
+    """
+    # XYZ uses LMS-base for calculations, needs that
+    # parameter adjustment for LMS-base
+    parameters['base'] = True
+    parameters['log'] = False
+    # specific results are dependent on other plot/result values
+
+    LMS_results = compute_LMS_modular(parameters)
+    LMS_spec = LMS_results['result']
+    LMS_plot = LMS_results['plot']
+
+    # compute.py, lines 1165-1202
+    trans_mat = transformation_matrix(parameters['field_size'], parameters['age'])
+    # routes it depending on normalization parameter or not
+    if not parameters['norm']:
+        if parameters['info']:
+            return {
+                "trans_mat": trans_mat
+            }
+        else:
+            return {
+                "result": XYZ_tristimulus(trans_mat, LMS_spec),
+                "plot": XYZ_tristimulus(trans_mat, LMS_plot)
+            }
+
+    # the default domain needs no renormalization, which saves transforming the spectrum just for its sums
+    λ_spec = LMS_spec[:, 0]
     if ((λ_spec[0] == 390. and λ_spec[-1] == 830.) and
             (my_round(λ_spec[1] - λ_spec[0], 1) ==
              1.0)):
         trans_mat_N = trans_mat
     else:
+        (X_exact_spec,
+         Y_exact_spec,
+         Z_exact_spec) = linear_transformation_λ(trans_mat, LMS_spec).T[1:]
         (X_exact_sum, Y_exact_sum, Z_exact_sum) = (np.sum(X_exact_spec),
                                                    np.sum(Y_exact_spec),
                                                    np.sum(Z_exact_spec))
@@ -335,38 +490,17 @@ def compute_XYZ_modular(parameters):
                                             [1],
                                             [Y_exact_sum / Z_exact_sum]), 8)
 
-    # routes it depending on normalization parameter or not
-    if not parameters['norm']:
-        if parameters['info']:
-            return {
-                "trans_mat": trans_mat
-            }
-        else:
-            # compute.py, lines 1207-1217
-            XYZ_spec = linear_transformation_λ(trans_mat, LMS_spec)
-            XYZ_spec[:, 1:] = sign_figs(XYZ_spec[:, 1:], 7)
-            XYZ_plot = linear_transformation_λ(trans_mat, LMS_plot)
-            XYZ_plot[:, 1:] = sign_figs(XYZ_plot[:, 1:], 7)
-            return {
-                "result": XYZ_spec,
-                "plot": XYZ_plot
-            }
-
     if parameters['info']:
         return {
             "trans_mat": trans_mat_N
         }
-    # compute.py, lines 1207-1217
-    XYZ_spec_N = linear_transformation_λ(trans_mat_N, LMS_spec)
-    XYZ_spec_N[:, 1:] = sign_figs(XYZ_spec_N[:, 1:], 7)
-    XYZ_plot_N = linear_transformation_λ(trans_mat_N, LMS_plot)
-    XYZ_plot_N[:, 1:] = sign_figs(XYZ_plot_N[:, 1:], 7)
     return {
-        "result": XYZ_spec_N,
-        "plot": XYZ_plot_N
+        "result": XYZ_tristimulus(trans_mat_N, LMS_spec),
+        "plot": XYZ_tristimulus(trans_mat_N, LMS_plot)
     }
 
 
+@memoize_calculation
 def compute_XY_modular(parameters):
     """
     A modularized version of 'compute_xy_diagram(...)' from compute.py, outputs either for 'info' or not.
@@ -390,6 +524,8 @@ def compute_XY_modular(parameters):
     XYZ = compute_XYZ_modular(temp)
     XYZ_spec = XYZ['result']
     XYZ_plot = XYZ['plot']
+    # compute.py, lines 1324 and 1343; the chromaticities of the plot are used by both resplot() and info()
+    xyz_plot = chrom_coords_µ(XYZ_plot)
 
     def resplot():
         # compute.py, lines 1323-1324
@@ -397,7 +533,7 @@ def compute_XY_modular(parameters):
         xyz_spec[:, 1:] = my_round(xyz_spec[:, 1:], 5)
         return {
             "result": xyz_spec,
-            "plot": chrom_coords_µ(XYZ_plot)
+            "plot": xyz_plot
         }
 
     """ note: while original code separates between normalization and not, this doesn't;
@@ -412,7 +548,7 @@ def compute_XY_modular(parameters):
         # compute.py, lines 1342-1350
         (xyz_tg_purple_plot,
          XYZ_tg_purple_plot) = tangent_points_purple_line(
-            chrom_coords_µ(XYZ_plot), False, XYZ_plot)
+            xyz_plot, False, XYZ_plot)
         xyz_tg_purple = xyz_tg_purple_plot.copy()
         xyz_tg_purple[:, 0] = my_round(xyz_tg_purple[:, 0], 1)
         xyz_tg_purple[:, 1:] = my_round(xyz_tg_purple[:, 1:], 5)
@@ -436,14 +572,14 @@ def compute_XY_modular(parameters):
 
     # parameter option exclusively for xy-p to retrieve both info and non-info for calculations
     if parameters['purple']:
-        asd = {**info(), **resplot()}
-        return asd
+        return {**info(), **resplot()}
 
     if parameters['info']:
         return info()
     return resplot()
 
 
+@memoize_calculation
 def compute_XYZ_purples_modular(parameters):
     """
     compute_XYZ_purples_modular is a modularized version of the compute_XYZ_purples(...) function from compute.py,
@@ -457,6 +593,8 @@ def compute_XYZ_purples_modular(parameters):
     Returns
     -------
     A ndarray of the XYZ cone-fundamental-based tristimulus function of purple-line stimuli, given parameters.
+    If the 'purple' parameter is set, the trans_mat of XYZ as well as xyz_white and xyz_tg_purple of xy are
+    included, which is what the purple-line sidemenus need.
     """
 
     if parameters['info']:
@@ -466,12 +604,21 @@ def compute_XYZ_purples_modular(parameters):
         temp['purple'] = True
         xy_dict = compute_XY_modular(temp)
         # compute.py, line 1368
-        return {
+        output = {
             "result": XYZ_purples(xy_dict["result"], xy_dict["xyz_white"], xy_dict["XYZ_tg_purple"]),
             "plot": XYZ_purples(xy_dict["plot"], xy_dict["xyz_white_plot"], xy_dict["XYZ_tg_purple_plot"]),
         }
+        if parameters['purple']:
+            temp['info'] = True
+            output.update({
+                "trans_mat": compute_XYZ_modular(temp)["trans_mat"],
+                "xyz_white": xy_dict["xyz_white"],
+                "xyz_tg_purple": xy_dict["xyz_tg_purple"]
+            })
+        return output
 
 
+@memoize_calculation
 def compute_xyz_purples_modular(parameters):
     """
     compute_xyz_purples_modular(...) is a modularized version of compute_xyz_purples(...) from compute.py, made to
@@ -499,6 +646,19 @@ def compute_xyz_purples_modular(parameters):
         }
 
 
+@lru_cache(maxsize=None)
+def CIE_standard_XYZ():
+    """
+    compute_CIE_standard_XYZ(...) from compute.py, which only depends on the (constant) CIE tables, so it is only
+    computed once. The returned ndarrays are read-only, as they are shared.
+    """
+    tables = compute_CIE_standard_XYZ(VisualData.XYZ31.copy(), VisualData.XYZ64.copy())
+    for table in tables:
+        table.setflags(write=False)
+    return tables
+
+
+@partial(memoize_calculation, names=STANDARD_PARAMETERS)
 def compute_XYZ_standard_modular(parameters):
     """
     compute_XYZ_standard_modular(...) is a modularized version of compute_CIE_standard_XYZ(...) from compute.py,
@@ -517,8 +677,7 @@ def compute_XYZ_standard_modular(parameters):
     (XYZ31_std_main,
      XYZ31_plot,
      XYZ64_std_main,
-     XYZ64_plot) = compute_CIE_standard_XYZ(
-        VisualData.XYZ31.copy(), VisualData.XYZ64.copy())
+     XYZ64_plot) = CIE_standard_XYZ()
     # routing through parameter
     if parameters['field_size'] == 2:
         return {
@@ -532,6 +691,7 @@ def compute_XYZ_standard_modular(parameters):
         }
 
 
+@partial(memoize_calculation, names=STANDARD_PARAMETERS)
 def compute_xyz_standard_modular(parameters):
     """
     compute_xyz_standard_modular(...) is the modularized version of compute_CIE_std_xy_diagram(...) from compute.py,
@@ -546,14 +706,12 @@ def compute_xyz_standard_modular(parameters):
     A ndarray of computated CIE chromaticity coordinates for spectral stimuli, etc.
     """
 
-    relevant = compute_XYZ_standard_modular(parameters)
-
     if parameters['info']:
         # compute.py, lines 1667
         white = np.array([0.33330, 0.33333, 0.33337])
-        # compute.py, lines 1669-1671
+        # compute.py, lines 1669-1671; the chromaticities of the plot are the cached ones of the other view
         purple_plot = tangent_points_purple_line(
-            chrom_coords_µ(relevant['plot']))
+            compute_xyz_standard_modular({**parameters, 'info': False})['plot'])
         purple = purple_plot.copy()
         purple[:, 1:] = my_round(purple_plot[:, 1:], 5)
         # routes depending on parameters
@@ -564,6 +722,7 @@ def compute_xyz_standard_modular(parameters):
             "white": white,
             "tg_purple": purple
         }
+    relevant = compute_XYZ_standard_modular(parameters)
     # compute.py, lines 1659-1660
     result = chrom_coords_µ(relevant['result'])
     result[:, 1:] = my_round(result[:, 1:], 5)
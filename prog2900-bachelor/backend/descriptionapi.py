@@ -40,15 +40,27 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import sys
+from functools import lru_cache
 
 import cieapi
-import styles.description
+from styles.description import _heading, _parameters, _functions, _wavelenghts, _normalization_LMS, \
+    _precision_LMS, _coordinates, _normalization_lms_mb, _LMS_to_lms_mb, _precision_lms_mb, \
+    _illuminant_E_lms_mb, _purpleline_tangentpoints_lms_mb, _normalization_lms_mw, _LMS_to_lms_mw, \
+    _precision_lms_mw, _illuminant_E_lms_mw, _purpleline_tangentpoints_lms_mw, _normalization_XYZ, _LMS_to_XYZ, \
+    _precision_XYZ, _normalization_xyz, _XYZ_to_xyz, _precision_xyz, _illuminant_E_xyz, \
+    _purpleline_tangentpoints_xyz, _wavelenghts_complementary, _LMS_to_XYZ_purples, _XYZ_purples_to_xyz_purples, \
+    _purpleline_tangentpoints_xyz_complementary, _parameters_std, _wavelenghts_std, _normalization_XYZ31, \
+    _normalization_XYZ64, _normalization_xyz31, _XYZ31_to_xyz31, _illuminant_E_xyz31, \
+    _purpleline_tangentpoints_xyz31, _normalization_xyz64, _XYZ64_to_xyz64, _illuminant_E_xyz64, \
+    _purpleline_tangentpoints_xyz64
 from computemodularization import compute_MacLeod_modular, compute_Maxwellian_modular, compute_XYZ_modular, \
     compute_XY_modular, compute_XYZ_purples_modular, compute_xyz_standard_modular
 
 
 def _head():
-    html_string = """
+    # the MathJax scale is the only part depending on the platform
+    scale = '95' if sys.platform.startswith(('win', 'linux')) else '100'
+    return "".join(("""
     <head>
         <style>  
             body {
@@ -91,26 +103,79 @@ def _head():
             displayMath:[["$$","$$"]],
             tex2jax: { preview: "none" },
             "HTML-CSS": {
-    """
-    if sys.platform.startswith('win'):
-        html_string += """
-                scale: 95
-        """
-    elif sys.platform.startswith('linux'):
-        html_string += """
-                scale: 95
-        """
-    else:
-        html_string += """
-                scale: 100
-        """
-    html_string += """
+    """, """
+                scale: """, scale, """
+        """, """
             }
         });
     </script>
     </head> 
+    """))
+
+
+# the head is the same for every sidemenu and only depends on the platform, so it is generated once on import
+HEAD_HTML = _head()
+
+# the LaTeX labels of the functions or coordinates of each sidemenu, formatted with the field size and age
+LMS_LABELS = ('\\(\\bar l_{%s,\,%d}\\)', '\\(\\bar m_{\,%s,\,%d}\\)', '\\(\\bar s_{%s,\,%d}\\)')
+LMS_MB_LABELS = ('\\(l_{\,\mathrm{MB},\,%s,\,%d}\\)', '\\(m_{\,\mathrm{MB},\,%s,\,%d}\\)',
+                 '\\(s_{\,\mathrm{MB},\,%s,\,%d}\\)')
+LMS_MW_LABELS = ('\\(l_{\,%s,\,%d}\\)', '\\(m_{\,%s,\,%d}\\)', '\\(s_{\,%s,\,%d}\\)')
+XYZ_LABELS = ('\\(\\bar x_{\,\mathrm{F},\,%s,\,%d}\\)', '\\(\\bar y_{\,\mathrm{F},\,%s,\,%d}\\)',
+              '\\(\\bar z_{\,\mathrm{F},\,%s,\,%d}\\)')
+XY_LABELS = ('\\(x_{\,\mathrm{F},\,%s,\,%d}\\)', '\\(y_{\,\mathrm{F},\,%s,\,%d}\\)',
+             '\\(z_{\,\mathrm{F},\,%s,\,%d}\\)')
+XYZP_LABELS = ('\\(\\bar x_{\,\mathrm{Fp},\,%s,\,%d}\\)', '\\(\\bar y_{\,\mathrm{Fp},\,%s,\,%d}\\)',
+               '\\(\\bar z_{\,\mathrm{Fp},\,%s,\,%d}\\)')
+# the labels of the standard functions, which do not depend on anything
+XYZ31_LABELS = ('\\(\\bar x\\) ', '\\(\\bar y\\) ', '\\(\\bar z\\)')
+XYZ64_LABELS = ('\\(\\bar x_{10}\\)', '\\(\\bar y_{10}\\)', '\\(\\bar z_{10}\\)')
+XY31_LABELS = ('\\(x\\)', '\\(y\\)', '\\(z\\)')
+XY64_LABELS = ('\\(x_{10}\\)', '\\(y_{\,10}\\)', '\\(z_{\,10}\\)')
+WAVELENGTH_LABEL = '\\(\\lambda\\) &nbsp;(wavelength)'
+
+
+@lru_cache(maxsize=None)
+def _labels(labels, field_size, age):
+    """
+    Formats one of the label tuples above with the given field size and age. The sidemenus of the same field size
+    and age share the labels, so each combination is only formatted once.
+    """
+    return tuple(label % (field_size, age) for label in labels)
+
+
+def _data(parameters, **changes):
+    """
+    A new dictionary of the parameters, so that a sidemenu can make changes without modifying the original, with
+    'min', 'max' and 'step_size' also under the names of the 'data' and 'options' keys of description.py, so that
+    it can use as much of the original material as possible.
+    """
+    return {**parameters, 'λ_min': parameters['min'], 'λ_max': parameters['max'], 'λ_step': parameters['step_size'],
+            **changes}
+
+
+def _page(heading, *sections):
+    """
+    Joins the head, the heading and the given sections of a sidemenu into its HTML page.
+    """
+    return "".join((HEAD_HTML, _heading(heading)) + sections)
+
+
+def _set_info(data, values):
+    """
+    Sets the calculated values (such as 'trans_mat') in data. description.py reads these with the '_N' suffix
+    when data['norm'] is set, and without it otherwise. The calculations already give the normalized or
+    non-normalized value depending on data['norm'], so each value is only set under the name it will be read by.
     """
-    return html_string
+    suffix = '_N' if data['norm'] else ''
+    data.update({name + suffix: value for (name, value) in values.items()})
+
+
+def _purple_bounds(data, purples):
+    """
+    Sets the complementary wavelengths at the ends of the purple line, the first and last of the purples, in data.
+    """
+    _set_info(data, {'λ_purple_min': '%.1f' % purples[0, 0], 'λ_purple_max': '%.1f' % purples[-1, 0]})
 
 
 """
@@ -134,40 +199,14 @@ def LMS_sidemenu(parameters):
     Generated HTML page with sidemenu contents.
 
     """
-    html_string = ""
-    html_string += _head()
-
-    # copy of parameters to allow for changes without modifying original
-    params = parameters.copy()
-    # changing their names to be equal to 'data' and 'options' keys, so that it
-    # can use as much of the original material as possible
-    params['λ_min'] = params['min']
-    params['λ_max'] = params['max']
-    params['λ_step'] = params['step_size']
-    params['log10'] = params['log']
-
-    if parameters['base']:
-        html_string += styles.description._heading(
-            'CIE LMS cone fundamentals (9 sign. figs.)')
-    else:
-        html_string += styles.description._heading('CIE LMS cone fundamentals')
-    html_string += (
-        styles.description._parameters(params) +
-        styles.description._functions('\\(\\bar l_{%s,\,%d}\\)' %
-                                      (params['field_size'],
-                                       params['age']),
-                                      '\\(\\bar m_{\,%s,\,%d}\\)' %
-                                      (params['field_size'],
-                                       params['age']),
-                                      '\\(\\bar s_{%s,\,%d}\\)' %
-                                      (params['field_size'],
-                                       params['age']),
-                                      '\\(\\lambda\\) &nbsp;(wavelength)') +
-        styles.description._wavelenghts(params) +
-        styles.description._normalization_LMS(params) +
-        styles.description._precision_LMS(params, params['base'])
-    )
-    return html_string
+    params = _data(parameters, log10=parameters['log'])
+
+    return _page('CIE LMS cone fundamentals (9 sign. figs.)' if parameters['base'] else 'CIE LMS cone fundamentals',
+                 _parameters(params),
+                 _functions(*_labels(LMS_LABELS, params['field_size'], params['age']), WAVELENGTH_LABEL),
+                 _wavelenghts(params),
+                 _normalization_LMS(params),
+                 _precision_LMS(params, params['base']))
 
 
 def LMS_MB_sidemenu(parameters):
@@ -183,42 +222,22 @@ def LMS_MB_sidemenu(parameters):
     Generated HTML page with sidemenu contents.
 
     """
-    html_string = ""
-    html_string += _head()
-
-    # copy of parameters to allow for changes without modifying original
-    data = parameters.copy()
-    # changing their names to be equal to 'data' and 'options' keys, so that it
-    # can use as much of the original material as possible
-    data['λ_min'] = data['min']
-    data['λ_max'] = data['max']
-    data['λ_step'] = data['step_size']
-
-    # needs info from macleod, does computation
-    data['info'] = True
+    # also needs info from macleod, does computation
+    data = _data(parameters, info=True)
     info = compute_MacLeod_modular(data)
     data['norm_coeffs_lms_mb'] = info['norm']
     data['lms_mb_white'] = info['white']
     data['lms_mb_tg_purple'] = info['tg_purple']
 
-    html_string += styles.description._heading(
-        u'MacLeod\u2013Boynton ls chromaticity diagram')
-    html_string += (
-        styles.description._parameters(data) +
-        styles.description._coordinates('\\(l_{\,\mathrm{MB},\,%s,\,%d}\\)' %
-                                        (data['field_size'], data['age']),
-                                        '\\(m_{\,\mathrm{MB},\,%s,\,%d}\\)' %
-                                        (data['field_size'], data['age']),
-                                        '\\(s_{\,\mathrm{MB},\,%s,\,%d}\\)' %
-                                        (data['field_size'], data['age'])) +
-        styles.description._wavelenghts(data) +
-        styles.description._normalization_lms_mb(data) +
-        styles.description._LMS_to_lms_mb(data, data) +
-        styles.description._precision_lms_mb() +
-        styles.description._illuminant_E_lms_mb(data) +
-        styles.description._purpleline_tangentpoints_lms_mb(data))
-
-    return html_string
+    return _page(u'MacLeod\u2013Boynton ls chromaticity diagram',
+                 _parameters(data),
+                 _coordinates(*_labels(LMS_MB_LABELS, data['field_size'], data['age'])),
+                 _wavelenghts(data),
+                 _normalization_lms_mb(data),
+                 _LMS_to_lms_mb(data, data),
+                 _precision_lms_mb(),
+                 _illuminant_E_lms_mb(data),
+                 _purpleline_tangentpoints_lms_mb(data))
 
 
 def LMS_MW_sidemenu(parameters):
@@ -234,42 +253,22 @@ def LMS_MW_sidemenu(parameters):
     Generated HTML page with sidemenu contents.
 
     """
-    html_string = ""
-    html_string += _head()
-
-    # copy of parameters to allow for changes without modifying original
-    data = parameters.copy()
-    # changing their names to be equal to 'data' and 'options' keys, so that it
-    # can use as much of the original material as possible
-    data['λ_min'] = data['min']
-    data['λ_max'] = data['max']
-    data['λ_step'] = data['step_size']
-
-    # needs info from maxwell, does computation
-    data['info'] = True
+    # also needs info from maxwell, does computation
+    data = _data(parameters, info=True)
     info = compute_Maxwellian_modular(data)
     data['norm_coeffs_lms_mw'] = info['norm']
     data['lms_mw_white'] = info['white']
     data['lms_mw_tg_purple'] = info['tg_purple']
 
-    html_string += (styles.description._heading('Maxwellian lm chromaticity diagram') +
-                    styles.description._parameters(data) +
-                    styles.description._coordinates('\\(l_{\,%s,\,%d}\\)' %
-                                                    (data['field_size'],
-                                                     data['age']),
-                                                    '\\(m_{\,%s,\,%d}\\)' %
-                                                    (data['field_size'],
-                                                     data['age']),
-                                                    '\\(s_{\,%s,\,%d}\\)' %
-                                                    (data['field_size'], data['age'])) +
-                    styles.description._wavelenghts(data) +
-                    styles.description._normalization_lms_mw(data) +
-                    styles.description._LMS_to_lms_mw(data) +
-                    styles.description._precision_lms_mw() +
-                    styles.description._illuminant_E_lms_mw(data) +
-                    styles.description._purpleline_tangentpoints_lms_mw(data))
-
-    return html_string
+    return _page('Maxwellian lm chromaticity diagram',
+                 _parameters(data),
+                 _coordinates(*_labels(LMS_MW_LABELS, data['field_size'], data['age'])),
+                 _wavelenghts(data),
+                 _normalization_lms_mw(data),
+                 _LMS_to_lms_mw(data),
+                 _precision_lms_mw(),
+                 _illuminant_E_lms_mw(data),
+                 _purpleline_tangentpoints_lms_mw(data))
 
 
 def XYZ_sidemenu(parameters):
@@ -285,43 +284,20 @@ def XYZ_sidemenu(parameters):
     Generated HTML page with sidemenu contents.
 
     """
-    html_string = ""
-    html_string += _head()
-
-    # copy of parameters to allow for changes without modifying original
-    data = parameters.copy()
-    # changing their names to be equal to 'data' and 'options' keys, so that it
-    # can use as much of the original material as possible
-    data['λ_min'] = data['min']
-    data['λ_max'] = data['max']
-    data['λ_step'] = data['step_size']
-
-    data['info'] = True
+    # also needs info from the calculation
+    data = _data(parameters, info=True)
     info = compute_XYZ_modular(data)
     # compute_XYZ_modular makes the trans_mat itself either normal or not normalized, depending on
-    # the value of parameters['norm']; if it is activated, 'trans_mat' is normalized, so it makes sure
-    # that either way, it gets the right one
-    data['trans_mat'] = info['trans_mat']
-    data['trans_mat_N'] = info['trans_mat']
-
-    html_string += (styles.description._heading('CIE XYZ cone-fundamental-based tristimulus functions') +
-                    styles.description._parameters(data) +
-                    styles.description._functions('\\(\\bar x_{\,\mathrm{F},\,%s,\,%d}\\)' %
-                                                  (data['field_size'],
-                                                   data['age']),
-                                                  '\\(\\bar y_{\,\mathrm{F},\,%s,\,%d}\\)' %
-                                                  (data['field_size'],
-                                                   data['age']),
-                                                  '\\(\\bar z_{\,\mathrm{F},\,%s,\,%d}\\)' %
-                                                  (data['field_size'],
-                                                   data['age']),
-                                                  '\\(\\lambda\\) &nbsp;(wavelength)') +
-                    styles.description._wavelenghts(data) +
-                    styles.description._normalization_XYZ(data, data) +
-                    styles.description._LMS_to_XYZ(data, data) +
-                    styles.description._precision_XYZ()
-                    )
-    return html_string
+    # the value of parameters['norm']
+    _set_info(data, {'trans_mat': info['trans_mat']})
+
+    return _page('CIE XYZ cone-fundamental-based tristimulus functions',
+                 _parameters(data),
+                 _functions(*_labels(XYZ_LABELS, data['field_size'], data['age']), WAVELENGTH_LABEL),
+                 _wavelenghts(data),
+                 _normalization_XYZ(data, data),
+                 _LMS_to_XYZ(data, data),
+                 _precision_XYZ())
 
 
 def XY_sidemenu(parameters):
@@ -337,43 +313,22 @@ def XY_sidemenu(parameters):
     Generated HTML page with sidemenu contents.
 
     """
-    html_string = ""
-    html_string += _head()
-
-    # copy of parameters to allow for changes without modifying original
-    data = parameters.copy()
-    # changing their names to be equal to 'data' and 'options' keys, so that it
-    # can use as much of the original material as possible
-    data['λ_min'] = data['min']
-    data['λ_max'] = data['max']
-    data['λ_step'] = data['step_size']
-
-    data['info'] = True
+    # also needs info from the calculation
+    data = _data(parameters, info=True)
     info = compute_XY_modular(data)
-    # same as XYZ, the 'xyz_white' in info is equal to both normalized and unnormalized value of xyz_white,
-    # depending on the true/false of parameters['norm'] (copied to data, so data['norm']
-    data['xyz_white'] = info['xyz_white']
-    data['xyz_white_N'] = info['xyz_white']
-    data['xyz_tg_purple'] = info['xyz_tg_purple']
-    data['xyz_tg_purple_N'] = info['xyz_tg_purple']
-
-    html_string += (
-        styles.description._heading("CIE xy cone-fundamental-based chromaticity diagram") +
-        styles.description._parameters(data) +
-        styles.description._coordinates('\\(x_{\,\mathrm{F},\,%s,\,%d}\\)' %
-                                        (data['field_size'], data['age']),
-                                        '\\(y_{\,\mathrm{F},\,%s,\,%d}\\)' %
-                                        (data['field_size'], data['age']),
-                                        '\\(z_{\,\mathrm{F},\,%s,\,%d}\\)' %
-                                        (data['field_size'], data['age'])) +
-        styles.description._wavelenghts(data) +
-        styles.description._normalization_xyz(data, data) +
-        styles.description._XYZ_to_xyz(data) +
-        styles.description._precision_xyz() +
-        styles.description._illuminant_E_xyz(data, data) +
-        styles.description._purpleline_tangentpoints_xyz(data, data)
-    )
-    return html_string
+    # same as XYZ, the 'xyz_white' and 'xyz_tg_purple' in info are either normalized or not, depending on
+    # the value of parameters['norm']
+    _set_info(data, {'xyz_white': info['xyz_white'], 'xyz_tg_purple': info['xyz_tg_purple']})
+
+    return _page("CIE xy cone-fundamental-based chromaticity diagram",
+                 _parameters(data),
+                 _coordinates(*_labels(XY_LABELS, data['field_size'], data['age'])),
+                 _wavelenghts(data),
+                 _normalization_xyz(data, data),
+                 _XYZ_to_xyz(data),
+                 _precision_xyz(),
+                 _illuminant_E_xyz(data, data),
+                 _purpleline_tangentpoints_xyz(data, data))
 
 
 def XYZP_sidemenu(parameters):
@@ -389,52 +344,26 @@ def XYZP_sidemenu(parameters):
     Generated HTML page with sidemenu contents.
 
     """
-    html_string = ""
-    html_string += _head()
+    # one calculation gives both the result and the trans_mat of XYZ
+    data = _data(parameters, info=False, purple=True)
+    info = compute_XYZ_purples_modular(data)
+    # compute_XYZ_modular makes the trans_mat itself either normal or not normalized, depending on
+    # the value of parameters['norm']
+    _set_info(data, {'trans_mat': info['trans_mat']})
 
-    # copy of parameters to allow for changes without modifying original
-    data = parameters.copy()
-    # changing their names to be equal to 'data' and 'options' keys, so that it
-    # can use as much of the original material as possible
-    data['λ_min'] = data['min']
-    data['λ_max'] = data['max']
-    data['λ_step'] = data['step_size']
+    _purple_bounds(data, info['result'])
 
-    data['info'] = True
-    info = compute_XYZ_modular(data)
-    # compute_XYZ_modular makes the trans_mat itself either normal or not normalized, depending on
-    # the value of parameters['norm']; if it is activated, 'trans_mat' is normalized, so it makes sure
-    # that either way, it gets the right one
-    data['trans_mat'] = info['trans_mat']
-    data['trans_mat_N'] = info['trans_mat']
-
-    # also needs result from computation of itself to get these values
-    data['info'] = False
-    purples = compute_XYZ_purples_modular(data)['result']
-    data['λ_purple_min'] = '%.1f' % purples[0, 0]
-    data['λ_purple_max'] = '%.1f' % purples[-1, 0]
-    data['λ_purple_min_N'] = data['λ_purple_min']
-    data['λ_purple_max_N'] = data['λ_purple_max']
-
-    html_string += (
-        styles.description._heading("XYZ cone-fundamental-based tristimulus functions for purple-line stimuli") +
-        styles.description._parameters(data) +
-        styles.description._functions(
-            '\\(\\bar x_{\,\mathrm{Fp},\,%s,\,%d}\\)' %
-            (data['field_size'], data['age']),
-            '\\(\\bar y_{\,\mathrm{Fp},\,%s,\,%d}\\)' %
-            (data['field_size'], data['age']),
-            '\\(\\bar z_{\,\mathrm{Fp},\,%s,\,%d}\\)' %
-            (data['field_size'], data['age']),
-            '<nobr>\\(\\lambda_{\\mathrm{c}}\\)</nobr> \
+    return _page("XYZ cone-fundamental-based tristimulus functions for purple-line stimuli",
+                 _parameters(data),
+                 _functions(
+                     *_labels(XYZP_LABELS, data['field_size'], data['age']),
+                     '<nobr>\\(\\lambda_{\\mathrm{c}}\\)</nobr> \
                             &nbsp;(complementary<font size="0.0em"> </font>\
-                            &nbsp;wavelength)') +
-        styles.description._wavelenghts_complementary(data, data) +
-        styles.description._normalization_XYZ(data, data) +
-        styles.description._LMS_to_XYZ_purples(data, data) +
-        styles.description._precision_XYZ()
-    )
-    return html_string
+                            &nbsp;wavelength)'),
+                 _wavelenghts_complementary(data, data),
+                 _normalization_XYZ(data, data),
+                 _LMS_to_XYZ_purples(data, data),
+                 _precision_XYZ())
 
 
 def XYP_sidemenu(parameters):
@@ -450,52 +379,24 @@ def XYP_sidemenu(parameters):
     Generated HTML page with sidemenu contents.
 
     """
-    html_string = ""
-    html_string += _head()
-
-    # copy of parameters to allow for changes without modifying original
-    data = parameters.copy()
-    # changing their names to be equal to 'data' and 'options' keys, so that it
-    # can use as much of the original material as possible
-    data['λ_min'] = data['min']
-    data['λ_max'] = data['max']
-    data['λ_step'] = data['step_size']
-
-    data['info'] = True
-    info = compute_XY_modular(data)
-    # same as XYZ, the 'xyz_white' in info is equal to both normalized and unnormalized value of xyz_white,
-    # depending on the true/false of parameters['norm'] (copied to data, so data['norm']
-    data['xyz_white'] = info['xyz_white']
-    data['xyz_white_N'] = info['xyz_white']
-    data['xyz_tg_purple'] = info['xyz_tg_purple']
-    data['xyz_tg_purple_N'] = info['xyz_tg_purple']
-
-    # also needs result from computation of itself to get these values
-    data['info'] = False
-    purples = compute_XYZ_purples_modular(data)['result']
-    data['λ_purple_min'] = '%.1f' % purples[0, 0]
-    data['λ_purple_max'] = '%.1f' % purples[-1, 0]
-    data['λ_purple_min_N'] = data['λ_purple_min']
-    data['λ_purple_max_N'] = data['λ_purple_max']
-
-    html_string += (
-        styles.description._heading("xy cone-fundamental-based chromaticity diagram (purple-line stimuli)") +
-        styles.description._parameters(data) +
-        styles.description._coordinates('\\(x_{\,\mathrm{F},\,%s,\,%d}\\)' %
-                                        (data['field_size'], data['age']),
-                                        '\\(y_{\,\mathrm{F},\,%s,\,%d}\\)' %
-                                        (data['field_size'], data['age']),
-                                        '\\(z_{\,\mathrm{F},\,%s,\,%d}\\)' %
-                                        (data['field_size'], data['age'])) +
-        styles.description._wavelenghts_complementary(data, data) +
-        styles.description._normalization_xyz(data, data) +
-        styles.description._XYZ_purples_to_xyz_purples(data) +
-        styles.description._precision_xyz() +
-        styles.description._illuminant_E_xyz(data, data) +
-        styles.description._purpleline_tangentpoints_xyz_complementary(
-            data, data)
-    )
-    return html_string
+    # one calculation gives both the result and the info of xy
+    data = _data(parameters, info=False, purple=True)
+    info = compute_XYZ_purples_modular(data)
+    # same as XYZ, the 'xyz_white' and 'xyz_tg_purple' in info are either normalized or not, depending on
+    # the value of parameters['norm']
+    _set_info(data, {'xyz_white': info['xyz_white'], 'xyz_tg_purple': info['xyz_tg_purple']})
+
+    _purple_bounds(data, info['result'])
+
+    return _page("xy cone-fundamental-based chromaticity diagram (purple-line stimuli)",
+                 _parameters(data),
+                 _coordinates(*_labels(XY_LABELS, data['field_size'], data['age'])),
+                 _wavelenghts_complementary(data, data),
+                 _normalization_xyz(data, data),
+                 _XYZ_purples_to_xyz_purples(data),
+                 _precision_xyz(),
+                 _illuminant_E_xyz(data, data),
+                 _purpleline_tangentpoints_xyz_complementary(data, data))
 
 
 def XYZ_std_sidemenu(parameters):
@@ -511,42 +412,21 @@ def XYZ_std_sidemenu(parameters):
     Generated HTML page with sidemenu contents.
 
     """
-    html_string = ""
-    html_string += _head()
-
-    # copy of parameters to allow for changes without modifying original
-    data = parameters.copy()
-    # changing their names to be equal to 'data' and 'options' keys, so that it
-    # can use as much of the original material as possible
-
-    html_string += styles.description._heading(
-        "CIE XYZ standard colour-matching functions")
-
     # description.py, lines 1390-1420
-    if data['field_size'] == cieapi.STD_1931:
-        html_string += (
-            styles.description._parameters_std('2') +
-            styles.description._functions('\\(\\bar x\\) ',
-                                          '\\(\\bar y\\) ',
-                                          '\\(\\bar z\\)',
-                                          '\\(\\lambda\\) &nbsp;(wavelength)') +
-            styles.description._wavelenghts_std() +
-            styles.description._normalization_XYZ31() +
-            styles.description._precision_XYZ()
-        )
-    else:
-        # description.py, lines 1423-1454
-        html_string += (
-            styles.description._parameters_std('10') +
-            styles.description._functions('\\(\\bar x_{10}\\)',
-                                          '\\(\\bar y_{10}\\)',
-                                          '\\(\\bar z_{10}\\)',
-                                          '\\(\\lambda\\) &nbsp;(wavelength)') +
-            styles.description._wavelenghts_std() +
-            styles.description._normalization_XYZ64() +
-            styles.description._precision_XYZ()
-        )
-    return html_string
+    if parameters['field_size'] == cieapi.STD_1931:
+        return _page("CIE XYZ standard colour-matching functions",
+                     _parameters_std('2'),
+                     _functions(*XYZ31_LABELS, WAVELENGTH_LABEL),
+                     _wavelenghts_std(),
+                     _normalization_XYZ31(),
+                     _precision_XYZ())
+    # description.py, lines 1423-1454
+    return _page("CIE XYZ standard colour-matching functions",
+                 _parameters_std('10'),
+                 _functions(*XYZ64_LABELS, WAVELENGTH_LABEL),
+                 _wavelenghts_std(),
+                 _normalization_XYZ64(),
+                 _precision_XYZ())
 
 
 def XY_std_sidemenu(parameters):
@@ -562,46 +442,70 @@ def XY_std_sidemenu(parameters):
     Generated HTML page with sidemenu contents.
 
     """
-    html_string = ""
-    html_string += _head()
-
-    # copy of parameters to allow for changes without modifying original
-    data = parameters.copy()
-    # changing their names to be equal to 'data' and 'options' keys, so that it
-    # can use as much of the original material as possible
-    data['info'] = True
+    # new dictionary of the parameters to allow for changes without modifying original
+    data = {**parameters, 'info': True}
     info = compute_xyz_standard_modular(data)
     # the info 'tg_purple' is applied to both for same reason normalization is above;
     #
     data['xyz31_tg_purple'] = info['tg_purple']
     data['xyz64_tg_purple'] = info['tg_purple']
 
-    html_string += styles.description._heading(
-        "CIE xy standard chromaticity diagram")
     # description.py, lines 1457-1487
     if data['field_size'] == cieapi.STD_1931:
-        html_string += (
-            styles.description._parameters_std('2') +
-            styles.description._coordinates('\\(x\\)', '\\(y\\)', '\\(z\\)') +
-            styles.description._wavelenghts_std() +
-            styles.description._normalization_xyz31() +
-            styles.description._XYZ31_to_xyz31() +
-            styles.description._precision_xyz() +
-            styles.description._illuminant_E_xyz31() +
-            styles.description._purpleline_tangentpoints_xyz31(data)
-        )
-    else:
-        # description.py, lines 1490-1522
-        html_string += (
-            styles.description._parameters_std('10') +
-            styles.description._coordinates('\\(x_{10}\\)',
-                                            '\\(y_{\,10}\\)',
-                                            '\\(z_{\,10}\\)') +
-            styles.description._wavelenghts_std() +
-            styles.description._normalization_xyz64() +
-            styles.description._XYZ64_to_xyz64() +
-            styles.description._precision_xyz() +
-            styles.description._illuminant_E_xyz64() +
-            styles.description._purpleline_tangentpoints_xyz64(data)
-        )
-    return html_string
+        return _page("CIE xy standard chromaticity diagram",
+                     _parameters_std('2'),
+                     _coordinates(*XY31_LABELS),
+                     _wavelenghts_std(),
+                     _normalization_xyz31(),
+                     _XYZ31_to_xyz31(),
+                     _precision_xyz(),
+                     _illuminant_E_xyz31(),
+                     _purpleline_tangentpoints_xyz31(data))
+    # description.py, lines 1490-1522
+    return _page("CIE xy standard chromaticity diagram",
+                 _parameters_std('10'),
+                 _coordinates(*XY64_LABELS),
+                 _wavelenghts_std(),
+                 _normalization_xyz64(),
+                 _XYZ64_to_xyz64(),
+                 _precision_xyz(),
+                 _illuminant_E_xyz64(),
+                 _purpleline_tangentpoints_xyz64(data))
+
+
+def sidemenu_HTML(sidemenu, parameters):
+    """
+    Generates the sidemenu of the given parameters, reusing the HTML of an earlier identical request.
+
+    Parameters
+    ----------
+    sidemenu: One of the *_sidemenu functions above.
+    parameters: Global parameter system, dict of user inputs.
+
+    Returns
+    -------
+    Generated HTML page with sidemenu contents, encoded as UTF-8 bytes, which is what the endpoints send.
+
+    """
+    return cached_sidemenu_HTML(sidemenu, tuple(sorted(parameters.items())))
+
+
+@lru_cache(maxsize=128)
+def cached_sidemenu_HTML(sidemenu, parameters):
+    """
+    The cached body of sidemenu_HTML(...). The sidemenus only depend on the parameters, and users tend to go back
+    and forth between a few of them, so each combination is only calculated and templated once.
+
+    Parameters
+    ----------
+    sidemenu: One of the *_sidemenu functions above.
+    parameters: A sorted tuple of the (name, value) pairs of the treated URL parameters.
+
+    Returns
+    -------
+    Generated HTML page with sidemenu contents, encoded as UTF-8 bytes.
+
+    """
+    # a new dictionary, as the sidemenus may modify what they are given; encoded here so that a cached sidemenu
+    # is not encoded again for every response
+    return sidemenu(dict(parameters)).encode()
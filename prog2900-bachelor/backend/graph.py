@@ -27,16 +27,20 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
     and add functionality through checkboxes. This module is loosely based on the original plotting module,
     https://github.com/ifarup/ciefunctions/blob/master/tc1_97/plot.py .
 
-    This module contains one instance of code lent from the internet, in the form of a transpose function
-    for the embedded JS code. These are marked with '// from StackOverflow, see module description.'.
-    The code is from this StackOverflow answer:
-    https://stackoverflow.com/a/36164530
+    The plotting functions are generators, which first yield the head of the page and then the rest of it.
+    The head does not depend on any calculation, so it can be sent on while the plot is still being calculated,
+    and the browser can start loading plotly in the meantime.
+
+    The plots get the columns of the calculations (see cieapi.new_plot_columns_JSON(...)), which are
+    transposed in Python, so that the embedded JS code does not have to transpose the rows itself.
 
 """
-import json
 import sys
 from array import array
+from functools import lru_cache
+from string import Template
 import numpy as np
+import orjson
 
 import cieapi
 from computemodularization import compute_LMS_modular, compute_MacLeod_modular, compute_Maxwellian_modular, \
@@ -44,6 +48,29 @@ from computemodularization import compute_LMS_modular, compute_MacLeod_modular,
     compute_XY_modular, compute_XYZ_purples_modular, compute_xyz_standard_modular, compute_XYZ_standard_modular, \
     compute_xyz_purples_modular
 
+
+def compact(source):
+    """
+    Strips the indentation, the blank lines and the comment lines from the HTML and JS of a page, which are
+    only there for whoever reads this module. The line breaks are kept, as the embedded JS relies on them
+    in place of semicolons.
+
+    Parameters
+    ----------
+    source: A page, or a template of one.
+
+    Returns
+    -------
+    The same page without the whitespace and comments that the browser has no use for.
+
+    """
+    lines = (line.strip() for line in source.splitlines())
+    # every line ends with its line break, so that the parts of the pages can be put one after another
+    return "".join(line + "\n" for line in lines if line and not line.startswith("//"))
+
+
+# the checkboxes and head only depend on which plot they are for, so they are made once for each of them
+@lru_cache(maxsize=None)
 def checkboxes(graph_function):
     """
     checkboxes() is a function that constructs the HTML checkboxes, making them enabled/disabled
@@ -67,23 +94,7 @@ def checkboxes(graph_function):
     # turn on/off grid
     # turn on/off labels
     # some functions have some enabled/disabled; this routes that process
-    disabled = []
-    if graph_function in [LMS_graph, XYZP_graph]:
-        disabled = [False, False, True, False]
-    if graph_function in [maxwellian_graph, macleod_graph, xyp_graph]:
-        disabled = [False, False, True, True]
-    if graph_function == XYZ_graph:
-        disabled = [True, True, True, False]
-    if graph_function == XY_graph:
-        disabled = [True, True, True, True]
-    if graph_function == "cie1931_2":
-        disabled = [False, True, True, False]
-    if graph_function == "cie1964_10":
-        disabled = [True, False, True, False]
-    if graph_function == "xyz1931_2":
-        disabled = [False, True, True, True]
-    if graph_function == "xyz1964_10":
-        disabled = [True, False, True, True]
+    disabled = DISABLED_CHECKBOXES[graph_function]
 
     # html representations of each of these checkboxes
     templates = ['<input type="checkbox" id="cie1931" name="cie1931"',
@@ -145,23 +156,17 @@ def retrievePoints(func, param):
 
     """
     # does this weird setup to remove potential duplicates
+    return list(set((int(param['min']),) + GRAPH_POINTS[func] + (int(param['max']),)))
+
 
-    if func == macleod_graph:
-        initial = list(set([int(param['min']), 410, 420, 430, 440, 450, 460, 470, 480, 490, 500, 550, 575, 600, 700,
-                            int(param['max'])]))
-        return initial
-    if func == maxwellian_graph:
-        initial = list(
-            set([int(param['min']), 450, 460, 470, 480, 490, 500, 510, 520, 530, 540, 550, 560, 570, 580, 590, 600, 610,
-                 620, 630, 700, int(param['max'])]))
-        return initial
-    if func == XY_graph:
-        initial = list(
-            set([int(param['min']), 470, 480, 490, 500, 510, 520, 530, 540, 550, 560, 570, 580, 590, 600, 610, 700,
-                 int(param['max'])]))
-        return initial
+# the wavelengths of the points on each of the plots that has them, besides the ends of the domain
+MACLEOD_POINTS = (410, 420, 430, 440, 450, 460, 470, 480, 490, 500, 550, 575, 600, 700)
+MAXWELLIAN_POINTS = (450, 460, 470, 480, 490, 500, 510, 520, 530, 540, 550, 560, 570, 580, 590, 600, 610, 620, 630,
+                     700)
+XY_POINTS = (470, 480, 490, 500, 510, 520, 530, 540, 550, 560, 570, 580, 590, 600, 610, 700)
 
 
+@lru_cache(maxsize=None)
 def head(function):
     """
     head(), creates the start of the HTML output by adding embedded plotly and CSS for some effects,
@@ -175,7 +180,7 @@ def head(function):
     String representing HTML for the start of the total HTML output.
     """
 
-    return """
+    return compact("""
     <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
@@ -199,89 +204,90 @@ def head(function):
     <div id='plot'></div>
     """ + checkboxes(function) + """
     <script>
-    """
+    // the config of plotly, which is the same for every plot
+    const config = {responsive: true}
+    """)
 
 
-def maxwellian_graph(parameters):
+def chromaticity_page(graph_function, calculation, template, parameters, **labels):
     """
-    maxwellian_graph(), plotting function responsible for the Maxwellian diagram.
+    The page after the head of maxwellian_graph(...), macleod_graph(...) and XY_graph(...), which all draw the
+    curve of their calculation, its info (illuminant E and the purple line) and the points of retrievePoints(...).
+
     Parameters
     ----------
-    parameters: Parameters in usage from the global parameters dict system.
+    graph_function: The graph function in question.
+    calculation: Its calculation function from computemodularization.py.
+    template: Its template, such as MAXWELLIAN_TEMPLATE.
+    parameters: Parameters from the global parameter system.
+    labels: The rest of the placeholders of the template, such as the title.
 
     Returns
     -------
-    A HTML string with embedded CSS and JS necessary to render a Maxwellian diagram,
-    given values within 'parameters'.
+    The HTML of the page after its head.
 
     """
-    # retrieves first both calculations and info values (illuminant E, purpleline)
-    # specifically made into JSONs as the endpoints offer to make sure values given to plot
-    # are not affected by floating point
-    temp = parameters.copy()
-    plots_json = cieapi.new_calculation_JSON(compute_Maxwellian_modular, temp)
-    temp['info'] = True
-    info_json = cieapi.new_calculation_JSON(compute_Maxwellian_modular, temp)
-    # gets the points for the graph
-    points = retrievePoints(maxwellian_graph, parameters)
+    # both the calculation and its info are embedded as the JSONs the endpoints offer, to make sure
+    # values given to plot are not affected by floating point
+    points = retrievePoints(graph_function, parameters)
+    wavelengths = calculation({**parameters, 'info': False})['plot'][:, 0]
+    return template.substitute(
+        plot_columns=cieapi.new_plot_columns_JSON(calculation, {**parameters, 'info': False}),
+        info_json=cieapi.new_calculation_JSON(calculation, {**parameters, 'info': True}),
+        indices=orjson.dumps(point_indices(wavelengths, points)).decode(),
+        point_names=orjson.dumps(list(map(str, points))).decode(),
+        **labels)
+
+
+def point_indices(wavelengths, points):
+    """
+    Finds where each of the points are on a curve, so that the page does not have to search for them.
 
-    # creates formatted title, xaxis and yaxis names
-    title = (
-        "Maxwellian lm chromaticity diagram<br> Field size: {}°, "
-        "Age: {} yr, Domain: {} nm - {} nm, Step: {} nm, Renormalized values".
-        format(
-            parameters['field_size'],
-            parameters['age'],
-            parameters['min'],
-            parameters['max'],
-            parameters['step_size']))
-    xaxis = "l<sub> {}, {} ({}-{}, {})</sub>".format(
-        parameters['field_size'],
-        parameters['age'],
-        parameters['min'],
-        parameters['max'],
-        parameters['step_size'])
-    yaxis = "m<sub> {}, {} ({}-{}, {})</sub>".format(
-        parameters['field_size'],
-        parameters['age'],
-        parameters['min'],
-        parameters['max'],
-        parameters['step_size'])
+    Parameters
+    ----------
+    wavelengths: The (sorted) wavelengths of the curve, as in the first column of its plot.
+    points: The wavelengths of the points, such as from retrievePoints(...).
 
-    # creates the html
-    raw = head(maxwellian_graph) + """
-    // converts JSONs from calculations to usable variables in JS
-    const results = '""" + plots_json + """';
-    const info = '""" + info_json + """';
-    const plot = JSON.parse(results)['plot'];
-    const information = JSON.parse(info);
+    Returns
+    -------
+    A list with the index of each point in 'wavelengths', or -1 where it is not on the curve (as indexOf in JS).
+
+    """
+    # the wavelengths are compared as they are written into the JSON, with one decimal
+    wavelengths = np.round(wavelengths, 1)
+    indices = np.searchsorted(wavelengths, points)
+    found = wavelengths[np.minimum(indices, len(wavelengths) - 1)] == points
+    return np.where(found, indices, -1).tolist()
+
+
+# the page of maxwellian_graph(...) after its head, with placeholders for what depends on the parameters
+MAXWELLIAN_TEMPLATE = Template(compact("""
+    // converts JSONs from calculations to usable variables in JS, the plot given as its columns
+    const output = JSON.parse('$plot_columns');
+    const information = JSON.parse('$info_json');
     
-    // creates generic layout and config for plotly
-    const config = {responsive: true}
+    // creates generic layout for plotly
     var layout = {
         showlegend: false,
         autosize: true,
-        title: '""" + title + """',
+        title: '$title',
         margin: { l: 50, r: 10, b: 50, t: 50, pad: 4 },
         height: 800,
         width: 600,
                 xaxis: {
                     nticks: 10,
                     zeroline: false,
-                    title: '""" + xaxis + """',
+                    title: '$xaxis',
                 },
                 yaxis: {
                     // attempted but failed attempt at 1:1 scale ratio
                     scaleanchor: "x",
                     scaleratio: 1,
                     zeroline: false,
-                    title: '""" + yaxis + """'
+                    title: '$yaxis'
                 },
         }
     
-    // from StackOverflow, see module description.
-    output = plot[0].map((_, colIndex) => plot.map(row => row[colIndex]));
-    
     // creates dictionary with values for maxwellian curve
     var curve = {
         x: output[1],
@@ -293,14 +299,10 @@ def maxwellian_graph(parameters):
     }
     
     // finds the positions on the curve where relevant points exist
-    const y_points = []
-    const x_points = []
-    const pointes = """ + str(points) + """;
-    for (let i = 0; i < pointes.length; i++) {
-        let index = output[0].indexOf(pointes[i]);
-        x_points.push(output[1][index]);
-        y_points.push(output[2][index]);
-    }
+    // (the index of each of them on the curve is found beforehand)
+    const indices = $indices;
+    const x_points = indices.map(index => output[1][index]);
+    const y_points = indices.map(index => output[2][index]);
     
     // adds relevant points onto the curve with points
     var points = {
@@ -347,145 +349,89 @@ def maxwellian_graph(parameters):
             }
         }
     
+    // the traces in the order they are drawn, so that the checkboxes can restyle only the ones they change
+    const renders = [curve, illuminantE, purpleline, points];
+    
     // adds an event listener for the grid button to update the plotly function to use/not use grid
     grid.addEventListener('change', (event) => {
-            var grid = document.getElementById('grid').checked;
-            layout['yaxis']['showgrid'] = grid;
-            layout['xaxis']['showgrid'] = grid;
-            
-            Plotly.react('plot', [curve, illuminantE, purpleline, points], layout, config);
+            var shown = event.currentTarget.checked;
+            Plotly.relayout('plot', {'xaxis.showgrid': shown, 'yaxis.showgrid': shown});
     })
     
     // adds an event listener to label to update plotly function to either show or not the labels for points
     label.addEventListener('change', (event) => {
-    var label = document.getElementById('label').checked;
+    var label = event.currentTarget.checked;
+            const labelled = [renders.indexOf(points), renders.indexOf(illuminantE)];
             if (label) {
-                points['mode'] = 'markers+text';
-                points['text'] = """ + str(list(map(str, points))) + """;
-                illuminantE['mode'] = 'markers+text';
-                illuminantE['text'] = ['E'];
+                Plotly.restyle('plot', {mode: 'markers+text', text: [$point_names, ['E']]}, labelled);
             } else {
-                points['mode'] = 'markers';
-                points['text'] = [];
-                illuminantE['mode'] = 'markers';
-                illuminantE['text'] = [];
+                Plotly.restyle('plot', {mode: 'markers', text: [[], []]}, labelled);
             }
-            Plotly.react('plot', [curve, illuminantE, purpleline, points], layout, config);
         })
     
-    // uses a .react() to faster load the plot initially with intention of updating with .react() later
-    Plotly.react('plot', [curve, illuminantE, purpleline, points], layout, config);
+    // uses a .react() to faster load the plot initially, the checkboxes then only restyle/relayout it
+    Plotly.react('plot', renders, layout, config);
         </script>
     </body>
     </html>
-    """
-    return raw
+    """))
 
 
-def xyp_graph(parameters):
+def maxwellian_graph(parameters):
     """
-    The plotting function for xy-p endpoint.
-
+    maxwellian_graph(), plotting function responsible for the Maxwellian diagram.
     Parameters
     ----------
-    parameters: Parameters from global parameter system.
+    parameters: Parameters in usage from the global parameters dict system.
 
-    Returns
-    -------
-    HTML representing the xy-p plot.
+    Yields
+    ------
+    A HTML string with embedded CSS and JS necessary to render a Maxwellian diagram,
+    given values within 'parameters'.
+    It is yielded in two parts: its head, and then the rest of it.
 
     """
-    # finds both info and calculations for normal xy (to get curve) and info from xyz_purples
-    temp = parameters.copy()
-    temp['info'] = False
-    # has to retrieve actual computation from xyz_purples for purpleline proper points
-    purpleplot = compute_xyz_purples_modular(temp)['plot']
-    xy_json = cieapi.new_calculation_JSON(compute_XY_modular, temp)
-    temp['info'] = True
-    info_json = cieapi.new_calculation_JSON(compute_xyz_purples_modular, temp)
-    # creates formatted title
-    title = ("xy cone-fundamental-based chromaticity diagram (purple-line stimuli)<br> Field size: {}°, Age: {} "
-             "yr, Domain: {} nm - {} nm, Step: {} nm").format(
-        parameters['field_size'],
-        parameters['age'],
-        parameters['min'],
-        parameters['max'],
-        parameters['step_size'])
-
-    # creation of points, unlike previous ones which were ranges in essence,
-    # needs exacts due to variations from parameters
-    # based on plot.py in ciefunctions, lines 560, 575-578
-    names = []
-    points_x = []
-    points_y = []
-    points = np.arange(400, 700, 10)
-    for l in points:
-        ind = np.nonzero(purpleplot[:, 0] == l)[0]
-        # creation of points from compute.py creates inhomogeneous array; filters them out
-        if purpleplot[ind, 1]:
-            names.append(l)
-            points_x.append(purpleplot[ind, 1])
-            points_y.append(purpleplot[ind, 2])
-    purpleline = json.loads(info_json)['xyz_tg_purple']
-    # formats them into strings to make them usable for embedded js
-    names = '[' + str(purpleline[0][0]) + "," + ','.join(map(str, np.array(names).flatten())) + "," + str(
-        purpleline[1][0]) + ']'
-    points_x = '[' + str(purpleline[0][1]) + "," + ','.join(map(str, np.array(points_x).flatten())) + "," + str(
-        purpleline[1][1]) + ']'
-    points_y = '[' + str(purpleline[0][2]) + "," + ','.join(map(str, np.array(points_y).flatten())) + "," + str(
-        purpleline[1][2]) + ']'
+    yield head(maxwellian_graph)
+    # creates formatted title, xaxis and yaxis names
+    domain = (parameters['field_size'], parameters['age'], parameters['min'], parameters['max'],
+              parameters['step_size'])
+    title = ("Maxwellian lm chromaticity diagram<br> Field size: {}°, "
+             "Age: {} yr, Domain: {} nm - {} nm, Step: {} nm, Renormalized values").format(*domain)
+    xaxis = "l<sub> {}, {} ({}-{}, {})</sub>".format(*domain)
+    yaxis = "m<sub> {}, {} ({}-{}, {})</sub>".format(*domain)
 
-    # adds to title if normalization parameter is on
-    if parameters['norm']:
-        title += ", Renormalized values"
+    # creates the html
+    yield chromaticity_page(maxwellian_graph, compute_Maxwellian_modular, MAXWELLIAN_TEMPLATE, parameters,
+                            title=title, xaxis=xaxis, yaxis=yaxis)
 
-    # names xaxis and yaxis with formatting
-    xaxis = "X<sub>F {}, {} ({}-{}, {})</sub>".format(
-        parameters['field_size'],
-        parameters['age'],
-        parameters['min'],
-        parameters['max'],
-        parameters['step_size'])
-    yaxis = "Y<sub>F {}, {} ({}-{}, {})</sub>".format(
-        parameters['field_size'],
-        parameters['age'],
-        parameters['min'],
-        parameters['max'],
-        parameters['step_size'])
 
-    raw = head(xyp_graph) + """
-        // creates variables for values from JSONs in calculation
-        const plot = JSON.parse('""" + cieapi.ndarray_to_JSON(
-        purpleplot,
-        ["{:.1f}", "{:.5f}", "{:.5f}", "{:.5f}"]) + """');
-        const xy_plot = JSON.parse('""" + xy_json + """')['plot'];
-        const info = JSON.parse('""" + info_json + """');
+# the page of xyp_graph(...) after its head, with placeholders for what depends on the parameters
+XYP_TEMPLATE = Template(compact("""
+        // creates variables for values from JSONs in calculation, the plots given as their columns
+        const output = JSON.parse('$purple_columns');
+        const output_xy = JSON.parse('$xy_columns');
+        const info = JSON.parse('$info_json');
         
-        // generic layout and config
-        const config = {responsive: true}
+        // generic layout
         var layout = {
             showlegend: false,
             autosize: true,
-            title: '""" + title + """',
+            title: '$title',
             margin: { l: 50, r: 50, b: 50, t: 50, pad: 20},
             height: 800,
             width: 800,
                 xaxis: {
                     nticks: 10,
                     zeroline: false,
-                    title: '""" + xaxis + """',
+                    title: '$xaxis',
                 },
                 yaxis: {
                     scaleanchor: "x",
                     zeroline: false,
-                    title: '""" + yaxis + """'
+                    title: '$yaxis'
                 },
             }
         
-        // from StackOverflow, see module description.
-        output = plot[0].map((_, colIndex) => plot.map(row => row[colIndex]));
-        output_xy = xy_plot[0].map((_, colIndex) => xy_plot.map(row => row[colIndex]));
-        
         // creates the horseshoe curve for xy-p
         var curve = {
             x: output_xy[1],
@@ -512,8 +458,8 @@ def xyp_graph(parameters):
         
         // creates the relevant datapoints
         var points = {
-            x: """ + points_x + """,
-            y: """ + points_y + """,
+            x: $points_x,
+            y: $points_y,
             mode: 'markers',
             type: 'scatter',
             textposition: 'bottom right',
@@ -557,28 +503,19 @@ def xyp_graph(parameters):
 
         // event listener for grid
         grid.addEventListener('change', (event) => {
-            var grid = document.getElementById('grid').checked;
-            layout['yaxis']['showgrid'] = grid;
-            layout['xaxis']['showgrid'] = grid;
-            
-            Plotly.react('plot', render, layout, config);
+            var shown = event.currentTarget.checked;
+            Plotly.relayout('plot', {'xaxis.showgrid': shown, 'yaxis.showgrid': shown});
         })
         
-        // eventlistener for the label button
+        // eventlistener for the label button, which restyles only the points and illuminant E
         label.addEventListener('change', (event) => {
-            var label = document.getElementById('label').checked;
+            var label = event.currentTarget.checked;
+            const labelled = [render.indexOf(points), render.indexOf(illuminantE)];
             if (label) {
-                points['mode'] = 'markers+text';
-                points['text'] = """ + names + """;
-                illuminantE['mode'] = 'markers+text';
-                illuminantE['text'] = ['E'];
+                Plotly.restyle('plot', {mode: 'markers+text', text: [$names, ['E']]}, labelled);
             } else {
-                points['mode'] = 'markers';
-                points['text'] = [];
-                illuminantE['mode'] = 'markers';
-                illuminantE['text'] = [];
+                Plotly.restyle('plot', {mode: 'markers', text: [[], []]}, labelled);
             }
-            Plotly.react('plot', render, layout, config);
         })
         
         Plotly.react('plot', render, layout, config);
@@ -586,70 +523,102 @@ def xyp_graph(parameters):
         </script>
     </body>
 </html>
-    """
-
-    return raw
+    """))
 
 
-def macleod_graph(parameters):
+def xyp_graph(parameters):
     """
-    Plotting function for the MacLeod-Boynton diagram.
+    The plotting function for xy-p endpoint.
+
     Parameters
     ----------
-    parameters: global parameter system in backend, given parameters from request.
+    parameters: Parameters from global parameter system.
 
-    Returns
-    -------
-    HTML representing the Macleod-Boynton diagram given parameters.
+    Yields
+    ------
+    HTML representing the xy-p plot.
+    It is yielded in two parts: its head, and then the rest of it.
 
     """
-    # finds the plot and info for MacLeod to get both curve and purplelinestimulus+illuminant E
-    temp = parameters.copy()
-    plots_json = cieapi.new_calculation_JSON(compute_MacLeod_modular, temp)
-    temp['info'] = True
-    info_json = cieapi.new_calculation_JSON(compute_MacLeod_modular, temp)
-    # retrieves relevant datapoints from a range
-    points = retrievePoints(macleod_graph, parameters)
+    yield head(xyp_graph)
+    # finds both info and calculations for normal xy (to get curve) and info from xyz_purples
+    # has to retrieve actual computation from xyz_purples for purpleline proper points
+    purpleplot = compute_xyz_purples_modular({**parameters, 'info': False})['plot']
+    xy_columns = cieapi.new_plot_columns_JSON(compute_XY_modular, {**parameters, 'info': False})
+    info_json = cieapi.new_calculation_JSON(compute_xyz_purples_modular, {**parameters, 'info': True})
+    # creates formatted title
+    title = ("xy cone-fundamental-based chromaticity diagram (purple-line stimuli)<br> Field size: {}°, Age: {} "
+             "yr, Domain: {} nm - {} nm, Step: {} nm").format(
+        parameters['field_size'],
+        parameters['age'],
+        parameters['min'],
+        parameters['max'],
+        parameters['step_size'])
 
-    # creates the formatted strings for title and xaxis/yaxis
-    title = (
-        "MacLeod-Boynton ls chromaticity diagram<br> Field size: {}°, Age: {} yr, Domain: {} nm - {} nm, Step: {} nm".
-        format(parameters['field_size'], parameters['age'], parameters['min'], parameters['max'],
-               parameters['step_size']))
-    xaxis = "l<sub>MB</sub>. {}, {}".format(
-        parameters['field_size'], parameters['age'])
-    yaxis = "S<sub>MB</sub>. {}, {}".format(
-        parameters['field_size'], parameters['age'])
+    # creation of points, unlike previous ones which were ranges in essence,
+    # needs exacts due to variations from parameters
+    # based on plot.py in ciefunctions, lines 560, 575-578
+    # one pass over the wavelengths finds which of the points are in the plot; the plot is sorted by wavelength,
+    # so they are found in the same order as the points
+    # creation of points from compute.py creates inhomogeneous array; filters them out
+    found = np.isin(purpleplot[:, 0], np.arange(400, 700, 10)) & (purpleplot[:, 1] != 0)
+    names = purpleplot[found, 0].astype(int)
+    points_x = purpleplot[found, 1]
+    points_y = purpleplot[found, 2]
+    purpleline = orjson.loads(info_json)['xyz_tg_purple']
+    # formats them into strings to make them usable for embedded js
+    (start, end) = purpleline
+    names = orjson.dumps([start[0], *names.tolist(), end[0]]).decode()
+    points_x = orjson.dumps([start[1], *points_x.tolist(), end[1]]).decode()
+    points_y = orjson.dumps([start[2], *points_y.tolist(), end[2]]).decode()
 
-    # creates the raw html
-    raw = head(macleod_graph) + """
-    // converts jsons from computation into variables within JS
-    const results = '""" + plots_json + """';
-    const info = '""" + info_json + """';
-    const plot = JSON.parse(results)['plot'];
-    const information = JSON.parse(info);
-    
-    // from StackOverflow, see module description.
-    output = plot[0].map((_, colIndex) => plot.map(row => row[colIndex]));
+    # adds to title if normalization parameter is on
+    if parameters['norm']:
+        title += ", Renormalized values"
+
+    # names xaxis and yaxis with formatting
+    xaxis = "X<sub>F {}, {} ({}-{}, {})</sub>".format(
+        parameters['field_size'],
+        parameters['age'],
+        parameters['min'],
+        parameters['max'],
+        parameters['step_size'])
+    yaxis = "Y<sub>F {}, {} ({}-{}, {})</sub>".format(
+        parameters['field_size'],
+        parameters['age'],
+        parameters['min'],
+        parameters['max'],
+        parameters['step_size'])
+
+    yield XYP_TEMPLATE.substitute(
+        purple_columns=cieapi.ndarray_columns_to_JSON(purpleplot, ["{:.1f}", "{:.5f}", "{:.5f}", "{:.5f}"]),
+        xy_columns=xy_columns, info_json=info_json, title=title, xaxis=xaxis, yaxis=yaxis,
+        points_x=points_x, points_y=points_y, names=names)
+
+
+# the page of macleod_graph(...) after its head, with placeholders for what depends on the parameters
+MACLEOD_TEMPLATE = Template(compact("""
+    // converts jsons from computation into variables within JS, the plot given as its columns
+    const output = JSON.parse('$plot_columns');
+    const information = JSON.parse('$info_json');
     
-    // generic config and layout
-    const config = {responsive: true}
+    // generic layout
     var layout = {
         showlegend: false,
         autosize: true,
-        title: '""" + title + """',
+        title: '$title',
         margin: { l: 50, r: 10, b: 50, t: 50, pad: 4 },
         height: 800,
         width: 800,
             yaxis: {
                 scaleanchor: "x",
                 zeroline: false,
-                title: '""" + yaxis + """'
+                title: '$yaxis'
             },
             xaxis: {
                 zeroline: false,
                 nticks: 10,
-                title: '""" + xaxis + """',
+                title: '$xaxis',
             }
         }
     
@@ -666,14 +635,10 @@ def macleod_graph(parameters):
     }
     
     // finds coordinate values for the datapoints within range,
-    const y_points = []
-    const x_points = []
-    const pointes = """ + str(points) + """;
-    for (let i = 0; i < pointes.length; i++) {
-        let index = output[0].indexOf(pointes[i]);
-        x_points.push(output[1][index]);
-        y_points.push(output[3][index]);
-    }
+    // (the index of each of them on the curve is found beforehand)
+    const indices = $indices;
+    const x_points = indices.map(index => output[1][index]);
+    const y_points = indices.map(index => output[3][index]);
     
     // expresses the coordinate points from above into points for plot drawing
     var points = {
@@ -718,110 +683,88 @@ def macleod_graph(parameters):
         }
     }
 
+    // the traces in the order they are drawn, so that the checkboxes can restyle only the ones they change
+    const renders = [curve, points, illuminantE, purpleline];
+
     // adds event listeners for grid and label button as done earlier
     
     grid.addEventListener('change', (event) => {
-        var grid = document.getElementById('grid').checked;
-        layout['yaxis']['showgrid'] = grid;
-        layout['xaxis']['showgrid'] = grid;
-        
-        Plotly.react('plot', [curve, points, illuminantE, purpleline], layout, config);
+        var shown = event.currentTarget.checked;
+        Plotly.relayout('plot', {'xaxis.showgrid': shown, 'yaxis.showgrid': shown});
     })
 
     label.addEventListener('change', (event) => {
-    var label = document.getElementById('label').checked;
+    var label = event.currentTarget.checked;
+        const labelled = [renders.indexOf(points), renders.indexOf(illuminantE)];
         if (label) {
-            points['mode'] = 'markers+text';
-            points['text'] = """ + str(list(map(str, points))) + """;
-            illuminantE['mode'] = 'markers+text';
-            illuminantE['text'] = ['E'];
+            Plotly.restyle('plot', {mode: 'markers+text', text: [$point_names, ['E']]}, labelled);
         } else {
-            points['mode'] = 'markers';
-            points['text'] = [];
-            illuminantE['mode'] = 'markers';
-            illuminantE['text'] = [];
+            Plotly.restyle('plot', {mode: 'markers', text: [[], []]}, labelled);
         }
-        Plotly.react('plot', [curve, points, illuminantE, purpleline], layout, config);
     })
 
-    Plotly.react('plot', [curve, points, illuminantE, purpleline], layout, config);
+    Plotly.react('plot', renders, layout, config);
     </script>
 </body>
 </html>
-    """
-    return raw
+    """))
 
 
-def XY_graph(parameters):
+def macleod_graph(parameters):
     """
-    Plotting function for the 'xy' endpoint.
+    Plotting function for the MacLeod-Boynton diagram.
     Parameters
     ----------
-    parameters: parameters for calculation, global system.
+    parameters: global parameter system in backend, given parameters from request.
 
-    Returns
-    -------
-    String representing HTML with plot and checkboxes.
+    Yields
+    ------
+    HTML representing the Macleod-Boynton diagram given parameters.
+    It is yielded in two parts: its head, and then the rest of it.
 
     """
-    # finds info and calculations for the xy endpoint function
-    temp = parameters.copy()
-    temp['info'] = False
-    jsona = cieapi.new_calculation_JSON(compute_XY_modular, temp)
-    temp['info'] = True
-    info_json = cieapi.new_calculation_JSON(compute_XY_modular, temp)
-    # retrieves relevant datapoints from range
-    points = retrievePoints(XY_graph, parameters)
+    yield head(macleod_graph)
+    # creates the formatted strings for title and xaxis/yaxis
+    title = (
+        "MacLeod-Boynton ls chromaticity diagram<br> Field size: {}°, Age: {} yr, Domain: {} nm - {} nm, Step: {} nm".
+        format(parameters['field_size'], parameters['age'], parameters['min'], parameters['max'],
+               parameters['step_size']))
+    xaxis = "l<sub>MB</sub>. {}, {}".format(
+        parameters['field_size'], parameters['age'])
+    yaxis = "S<sub>MB</sub>. {}, {}".format(
+        parameters['field_size'], parameters['age'])
 
-    # creates formatted strings representing title, xaxis and yaxis for plot
-    title = ("CIE xy-cone fundamental-based chromaticity diagram<br>Field size: {}°, Age: {} yr, Domain: {} nm - "
-             "{} nm, Step: {} nm").format(parameters['field_size'], parameters['age'], parameters['min'],
-                                          parameters['max'], parameters['step_size'])
-    if parameters['norm']:
-        title += ", Renormalized values"
-    xaxis = "X<sub>F{}, {} ({}-{}, {})</sub>".format(
-        parameters['field_size'],
-        parameters['age'],
-        parameters['min'],
-        parameters['max'],
-        parameters['step_size'])
-    yaxis = "Y<sub>F{}, {} ({}-{}, {})</sub>".format(
-        parameters['field_size'],
-        parameters['age'],
-        parameters['min'],
-        parameters['max'],
-        parameters['step_size'])
+    # creates the raw html
+    yield chromaticity_page(macleod_graph, compute_MacLeod_modular, MACLEOD_TEMPLATE, parameters,
+                            title=title, xaxis=xaxis, yaxis=yaxis)
 
-    # constructs html for output
-    raw = head(XY_graph) + """
-    // converts calculations from JSON to variables within JS
-    const plot = JSON.parse('""" + jsona + """')['plot'];
-    const info = JSON.parse('""" + info_json + """');
+
+# the page of XY_graph(...) after its head, with placeholders for what depends on the parameters
+XY_TEMPLATE = Template(compact("""
+    // converts calculations from JSON to variables within JS, the plot given as its columns
+    const output = JSON.parse('$plot_columns');
+    const info = JSON.parse('$info_json');
     
-    // generic layout/config
-    const config = {responsive: true}
+    // generic layout
     var layout = {
         showlegend: false,
         autosize: true,
-        title: '""" + title + """',
+        title: '$title',
         margin: { l: 50, r: 10, b: 50, t: 50, pad: 4 },
         height: 800,
         width: 800,
             yaxis: {
                 scaleanchor: "x",
                 zeroline: false,
-                title: '""" + yaxis + """'
+                title: '$yaxis'
             },
             xaxis: {
                 zeroline: false,
                 nticks: 10,
-                title: '""" + xaxis + """',
+                title: '$xaxis',
             }
         }
     
-    // from StackOverflow, see module description.
-    output = plot[0].map((_, colIndex) => plot.map(row => row[colIndex]));
-    
     // creates xy curve, horseshoe
     var curve = {
         x: output[1],
@@ -833,14 +776,10 @@ def XY_graph(parameters):
     }
     
     // finds the relevant datapoints' values
-    const y_points = []
-    const x_points = []
-    const pointes = """ + str(points) + """;
-    for (let i = 0; i < pointes.length; i++) {
-        let index = output[0].indexOf(pointes[i]);
-        x_points.push(output[1][index]);
-        y_points.push(output[2][index]);
-    }
+    // (the index of each of them on the curve is found beforehand)
+    const indices = $indices;
+    const x_points = indices.map(index => output[1][index]);
+    const y_points = indices.map(index => output[2][index]);
     // expresses them here
     var points = {
         x: x_points,
@@ -890,63 +829,48 @@ def XY_graph(parameters):
     
     // adds constructions of xy_1931 and xy_1964 from functions, and corresponding event listeners
     
-    """ + comparison_xy_1931(parameters) + """
+    $comparison_1931
     
-    // event listener for cie1931,
+    // the variables from earlier construction are in the "render" pile from the start, hidden until checked
+    for (const trace of [curve_31, points_31, purpleline_31]) {
+        trace.visible = false;
+        renders.push(trace);
+    }
+    
+    // event listener for cie1931, which only shows or hides them
     cie1931.addEventListener('change', (event) => {
-        // if the checkbox for this is checked, then
-        if (document.getElementById('cie1931').checked) {
-        // var grid = document.getElementById('grid').checked;
-            // add the variables from earlier construction into the "render" pile
-            renders.push(curve_31, points_31, purpleline_31);
-        } else {
-            // if not, remove them
-           renders = renders.filter( (element) => !( [curve_31, points_31, purpleline_31].includes(element)) );
-        }
-        // update graph
-        Plotly.react('plot', renders, layout, config);
+        Plotly.restyle('plot', {visible: event.currentTarget.checked},
+                       [curve_31, points_31, purpleline_31].map(trace => renders.indexOf(trace)));
     })
     
-    """ + comparison_xy_1964(parameters) + """
+    $comparison_1964
+    
+    // the same goes for the variables from construction of xy_1964
+    for (const trace of [curve_64, points_64, purpleline_64]) {
+        trace.visible = false;
+        renders.push(trace);
+    }
     
     cie1964.addEventListener('change', (event) => {
-    // if checked,
-        if (document.getElementById('cie1964').checked) {
-        // var grid = document.getElementById('grid').checked;
-        // push variables from construction of xy_1964 into render pile 
-            renders.push(curve_64, points_64, purpleline_64);
-        } else {
-        // remove them if not ticked on
-           renders = renders.filter( (element) => !( [curve_64, points_64, purpleline_64].includes(element)) );
-        }
-        // update plot to show it
-        Plotly.react('plot', renders, layout, config);
+        Plotly.restyle('plot', {visible: event.currentTarget.checked},
+                       [curve_64, points_64, purpleline_64].map(trace => renders.indexOf(trace)));
     })
     
     // generic label event listener
     label.addEventListener('change', (event) => {
-    var label = document.getElementById('label').checked;
+    var label = event.currentTarget.checked;
+        const labelled = [renders.indexOf(points), renders.indexOf(illuminantE)];
         if (label) {
-            points['mode'] = 'markers+text';
-            points['text'] = """ + str(list(map(str, points))) + """;
-            illuminantE['mode'] = 'markers+text';
-            illuminantE['text'] = ['E'];
+            Plotly.restyle('plot', {mode: 'markers+text', text: [$point_names, ['E']]}, labelled);
         } else {
-            points['mode'] = 'markers';
-            points['text'] = [];
-            illuminantE['mode'] = 'markers';
-            illuminantE['text'] = [];
+            Plotly.restyle('plot', {mode: 'markers', text: [[], []]}, labelled);
         }
-        Plotly.react('plot', renders, layout, config);
     })
     
     // generic grid event listener
     grid.addEventListener('change', (event) => {
-        var grid = document.getElementById('grid').checked;
-        layout['yaxis']['showgrid'] = grid;
-        layout['xaxis']['showgrid'] = grid;
-        
-        Plotly.react('plot', renders, layout, config);
+        var shown = event.currentTarget.checked;
+        Plotly.relayout('plot', {'xaxis.showgrid': shown, 'yaxis.showgrid': shown});
     })
     
     // initial creation of plot
@@ -955,79 +879,65 @@ def XY_graph(parameters):
         </script>
     </body>
 </html>
-    """
-    return raw
+    """))
 
 
-def XYZP_graph(parameters):
+def XY_graph(parameters):
     """
-    Plotting function for the xyz-p endpoint.
+    Plotting function for the 'xy' endpoint.
     Parameters
     ----------
-    parameters
+    parameters: parameters for calculation, global system.
 
-    Returns
-    -------
+    Yields
+    ------
+    String representing HTML with plot and checkboxes.
+    It is yielded in two parts: its head, and then the rest of it.
 
     """
-    # finds only the calculations (info either not needed or not existing)
-    temp = parameters.copy()
-    data = cieapi.new_calculation_JSON(compute_XYZ_purples_modular, temp)
-    # creates formatted title
-    title = ("XYZ cone-fundamental-based tristumulus functions for purple-line stimuli<br>Field size: "
-             "{}°, Age: {} yr, Domain: {} nm - {} nm, Step: {} nm").format(
-        parameters['field_size'],
-        parameters['age'],
-        parameters['min'],
-        parameters['max'],
-        parameters['step_size'])
-
+    yield head(XY_graph)
+    # creates formatted strings representing title, xaxis and yaxis for plot
+    domain = (parameters['field_size'], parameters['age'], parameters['min'], parameters['max'],
+              parameters['step_size'])
+    title = ("CIE xy-cone fundamental-based chromaticity diagram<br>Field size: {}°, Age: {} yr, Domain: {} nm - "
+             "{} nm, Step: {} nm").format(*domain)
     if parameters['norm']:
         title += ", Renormalized values"
+    xaxis = "X<sub>F{}, {} ({}-{}, {})</sub>".format(*domain)
+    yaxis = "Y<sub>F{}, {} ({}-{}, {})</sub>".format(*domain)
 
-    # creates the html for output
-    raw = head(XYZP_graph) + """
-        // parses calculation into variable through json
-        const xyzp = JSON.parse('""" + data + """')['plot'];
-        
-        // from StackOverflow, see module description.
-        const output = xyzp[0].map((_, colIndex) => xyzp.map(row => row[colIndex]));
+    # constructs html for output
+    yield chromaticity_page(XY_graph, compute_XY_modular, XY_TEMPLATE, parameters,
+                            title=title, xaxis=xaxis, yaxis=yaxis,
+                            comparison_1931=comparison_xy_1931(parameters),
+                            comparison_1964=comparison_xy_1964(parameters))
+
+
+# the points of each plot, as used by retrievePoints(...)
+GRAPH_POINTS = {macleod_graph: MACLEOD_POINTS, maxwellian_graph: MAXWELLIAN_POINTS, XY_graph: XY_POINTS}
+
+
+# the page of XYZP_graph(...) after its head, with placeholders for what depends on the parameters
+XYZP_TEMPLATE = Template(compact("""
+        // parses the columns of the calculation into variable through json
+        const output = JSON.parse('$columns');
         
         
-        // uses transposed output above to interpret into x, y, z curves with colours
-        var r = {
-            x: output[0],
-            y: output[1],
-            mode: 'lines',
-            name: 'x',
-            line: {
-            color: 'rgb(255, 0, 0)'
-            }
-        }
-        var g = {
-            x: output[0],
-            y: output[2],
-            mode: 'lines',
-            name: 'y',
-            line: {
-            color: 'rgb(0, 127, 0)'
-            }
-        }
-        var b = {
-            x: output[0],
-            y: output[3],
-            mode: 'lines',
-            name: 'z',
-            line: {
-            color: 'rgb(0, 0, 255)'
-            }
-        }
+        // uses the columns above to interpret into x, y, z curves with colours, as a name, column and colour each
+        var [r, g, b] = [['x', 1, 'rgb(255, 0, 0)'], ['y', 2, 'rgb(0, 127, 0)'], ['z', 3, 'rgb(0, 0, 255)']].map(
+            ([name, column, color]) => ({
+                x: output[0],
+                y: output[column],
+                type: 'scattergl',
+                mode: 'lines',
+                name: name,
+                line: {color: color}
+            }));
         
-        // generic config/layout
-        const config = {responsive: true}
+        // generic layout
         var layout = {
             showlegend: false,
-            title: '""" + title + """',
+            title: '$title',
             autosize: true,
             height: 700,
                 yaxis: {
@@ -1044,82 +954,82 @@ def XYZP_graph(parameters):
         renders = [r, g, b]
         // adds event listener for grid checkbox
         grid.addEventListener('change', (event) => {
-            var grid = document.getElementById('grid').checked;
-            layout['yaxis']['showgrid'] = grid;
-            layout['xaxis']['showgrid'] = grid;
-            // updates
-            Plotly.react('plot', renders, layout, config);
+            var shown = event.currentTarget.checked;
+            // updates only the axes
+            Plotly.relayout('plot', {'xaxis.showgrid': shown, 'yaxis.showgrid': shown});
         })
         // initial creation of plot
         Plotly.react('plot', renders, layout, config);
         </script>
     </body>
 </html>
-    """
-    return raw
+    """))
 
 
-def comparison_xy_1964(parameters, mode="dot"):
+def XYZP_graph(parameters):
     """
-    Plotting function for the xy-1964 (field_size 10) standard function, both endpoint
-    and for comparison checkboxes in other endpoints. Specifically made to be put into other HTML outputs.
+    Plotting function for the xyz-p endpoint.
     Parameters
     ----------
-    parameters: parameters from global system
-    mode: string representing the render mode for the plot, either solid (for standard function endpoint)
-    or empty/"dot" for comparisons in other endpoints.
+    parameters
 
-    Returns
-    -------
-    String representing partial-created HTML.
+    Yields
+    ------
+    The HTML of the plot.
+    It is yielded in two parts: its head, and then the rest of it.
 
     """
-    # finds both calculations and info
-    temp = parameters.copy()
-    temp['field_size'] = 10
-    temp['info'] = False
-    data = cieapi.new_calculation_JSON(compute_xyz_standard_modular, temp)
-    temp['info'] = True
-    info_data = cieapi.new_calculation_JSON(compute_xyz_standard_modular, temp)
-    # finds relevant datapoints
-    points = retrievePoints(XY_graph, parameters)
+    yield head(XYZP_graph)
+    # finds only the columns of the calculations (info either not needed or not existing)
+    columns = cieapi.new_plot_columns_JSON(compute_XYZ_purples_modular, {**parameters, 'info': False})
+    # creates formatted title
+    title = ("XYZ cone-fundamental-based tristumulus functions for purple-line stimuli<br>Field size: "
+             "{}°, Age: {} yr, Domain: {} nm - {} nm, Step: {} nm").format(
+        parameters['field_size'],
+        parameters['age'],
+        parameters['min'],
+        parameters['max'],
+        parameters['step_size'])
 
-    # returns partially constructed html
-    return """
+    if parameters['norm']:
+        title += ", Renormalized values"
+
+    # creates the html for output
+    yield XYZP_TEMPLATE.substitute(columns=columns, title=title)
+
+
+# the part of the pages that comparison_xy_1931(...) and comparison_xy_1964(...) make, with placeholders for the
+# standard function (see COMPARISON_XY_STANDARDS) and for what depends on the parameters
+COMPARISON_XY_TEMPLATE = Template(compact("""
     // parses calculations from computation into variables for JS.
-    const cie_1964 = JSON.parse('""" + data + """')['plot'];
-    const info1964 = JSON.parse('""" + info_data + """');
-    // from StackOverflow, see module description.
-    const output3 = cie_1964[0].map((_, colIndex) => cie_1964.map(row => row[colIndex]));
+    const xy_$year = JSON.parse('$columns');
+    const info$year = JSON.parse('$info_data');
 
     // makes a curve for the standard function here
-    var curve_64 = {
-        x: output3[1],
-        y: output3[2],
+    var curve_$short = {
+        x: xy_$year[1],
+        y: xy_$year[2],
+        type: 'scattergl',
         mode: 'lines',
         line: {
-            dash: '""" + mode + """',
+            dash: '$mode',
             color: 'rgb(0, 0, 0)'
         }
     }
     
     // finds relevant datapoints, and makes into variable for plotting.
-    const y_points_1964 = []
-    const x_points_1964 = []
-    const pointes_1964 = """ + str(points) + """;
-    for (let i = 0; i < pointes_1964.length; i++) {
-        let index = output3[0].indexOf(pointes_1964[i]);
-        x_points_1964.push(output3[1][index]);
-        y_points_1964.push(output3[2][index]);
-    }
-    var points_64 = {
-        x: x_points_1964 ,
-        y: y_points_1964,
+    const pointes_$year = $points;
+    const indices_$year = $indices;
+    const x_points_$year = indices_$year.map(index => xy_$year[1][index]);
+    const y_points_$year = indices_$year.map(index => xy_$year[2][index]);
+    var points_$short = {
+        x: x_points_$year ,
+        y: y_points_$year,
         mode: 'markers',
         type: 'scatter',
         textposition: 'top right',
         marker: {
-            color: 'rgb(125, 125, 125)',
+            color: '$color',
             size: 10,
             line: {
                 color: 'rgb(0, 0, 0)',
@@ -1128,173 +1038,108 @@ def comparison_xy_1964(parameters, mode="dot"):
         }
     }
     // finds the purpleline for standardization function
-    var purpleline_64 = {
-        x: [info1964['tg_purple'][0][1], info1964['tg_purple'][1][1]],
-        y: [info1964['tg_purple'][0][2], info1964['tg_purple'][1][2]],
+    var purpleline_$short = {
+        x: [info$year['tg_purple'][0][1], info$year['tg_purple'][1][1]],
+        y: [info$year['tg_purple'][0][2], info$year['tg_purple'][1][2]],
         mode: 'lines',
         line: {
-            dash: '""" + mode + """',
+            dash: '$mode',
             color: 'rgb(150, 32, 240)',
             width: 3
         }
     }
 
-    """
+    """))
 
+# the year and short year that the variables of each standard function are named by, and the colour of its points,
+# by its field size
+COMPARISON_XY_STANDARDS = {
+    2: ("1931", "31", "rgb(0, 0, 0)"),
+    10: ("1964", "64", "rgb(125, 125, 125)"),
+}
 
-def comparison_xy_1931(parameters, mode="dash"):
+
+def comparison_xy_1964(parameters, mode="dot"):
     """
-    Partial-HTML constructor for plotting of xy-1931 (field size 2).
+    Plotting function for the xy-1964 (field_size 10) standard function, both endpoint
+    and for comparison checkboxes in other endpoints. Specifically made to be put into other HTML outputs.
     Parameters
     ----------
     parameters: parameters from global system
-    mode: string representing the render mode for the plot, either solid (for standard function endpoint), or "dash"
-    for when in usage for other endpoints for comparison.
+    mode: string representing the render mode for the plot, either solid (for standard function endpoint)
+    or empty/"dot" for comparisons in other endpoints.
 
     Returns
     -------
-    Partially constructed HTML with values from computation.
-    """
-
-    # finds relevant info and calculations,
-    temp = parameters.copy()
-    temp['field_size'] = 2
-    temp['info'] = False
-    data = cieapi.new_calculation_JSON(
-        compute_xyz_standard_modular,
-        temp)
-    temp['info'] = True
-    info_data = cieapi.new_calculation_JSON(
-        compute_xyz_standard_modular,
-        temp)
-    # retrieves relevant datapoints
-    points = retrievePoints(XY_graph, parameters)
+    String representing partial-created HTML.
 
-    # returns html
-    return """
-    // makes the variables from calculation into js variables
-    const cie_1931 = JSON.parse('""" + data + """')['plot'];
-    const info1931 = JSON.parse('""" + info_data + """');
-    // from StackOverflow, see module description.
-    const output2 = cie_1931[0].map((_, colIndex) => cie_1931.map(row => row[colIndex]));
-    
-    // makes curve into variable
-    var curve_31 = {
-        x: output2[1],
-        y: output2[2],
-        mode: 'lines',
-        line: {
-            dash: '""" + mode + """',
-            color: 'rgb(0, 0, 0)'
-        }
-    }
-    
-    // makes points into variable after finding them
-    const y_points_1931 = []
-    const x_points_1931 = []
-    const pointes_1931 = """ + str(points) + """;
-    for (let i = 0; i < pointes_1931.length; i++) {
-        let index = output2[0].indexOf(pointes_1931[i]);
-        x_points_1931.push(output2[1][index]);
-        y_points_1931.push(output2[2][index]);
-    }
-    var points_31 = {
-        x: x_points_1931 ,
-        y: y_points_1931,
-        mode: 'markers',
-        type: 'scatter',
-        textposition: 'top right',
-        marker: {
-            color: 'rgb(0, 0, 0)',
-            size: 10,
-            line: {
-                color: 'rgb(0, 0, 0)',
-                width: 2
-            }
-        }
-    }
-    
-    // finds purpleline and expresses as variable
-    var purpleline_31 = {
-        x: [info1931['tg_purple'][0][1], info1931['tg_purple'][1][1]],
-        y: [info1931['tg_purple'][0][2], info1931['tg_purple'][1][2]],
-        mode: 'lines',
-        line: {
-            dash: '""" + mode + """',
-            color: 'rgb(150, 32, 240)',
-            width: 3
-        }
-    }
-    
     """
+    # the standard function does not depend on the parameters, so this part of the pages only depends on the
+    # domain (through the points) and the mode
+    return cached_comparison_xy(10, parameters['min'], parameters['max'], mode)
 
 
-def XYZ_graph(parameters):
+def comparison_xy_1931(parameters, mode="dash"):
     """
-    Plotting function for the xyz endpoint.
+    Partial-HTML constructor for plotting of xy-1931 (field size 2).
     Parameters
     ----------
     parameters: parameters from global system
+    mode: string representing the render mode for the plot, either solid (for standard function endpoint), or "dash"
+    for when in usage for other endpoints for comparison.
 
     Returns
     -------
-    Fully constructed string within HTML for the plotting of xyz endpoint.
+    Partially constructed HTML with values from computation.
+    """
+    # the standard function does not depend on the parameters, so this part of the pages only depends on the
+    # domain (through the points) and the mode
+    return cached_comparison_xy(2, parameters['min'], parameters['max'], mode)
 
+
+@lru_cache(maxsize=32)
+def cached_comparison_xy(field_size, minimum, maximum, mode):
     """
-    # finds the calculation, not info due to not needed or non existant
-    json = cieapi.new_calculation_JSON(compute_XYZ_modular, parameters)
-    # creates formatted string title
-    title = (
-        "CIE XYZ cone-fundamental-based tristumulus functions<br>Field size: {}°"
-        ", Age: {} yr, Domain: {} nm - {} nm, Step: {} nm".
-        format(parameters['field_size'], parameters['age'], parameters['min'], parameters['max'],
-               parameters['step_size']))
-    # adds it to the title
-    if parameters['norm']:
-        title += ", Renormalized values"
+    The cached body of comparison_xy_1931(...) and comparison_xy_1964(...), given the field size of the standard
+    function and the domain of the parameters.
+    """
+    parameters = {'min': minimum, 'max': maximum, 'field_size': field_size}
+    (year, short, color) = COMPARISON_XY_STANDARDS[field_size]
+    # finds both calculations and info
+    columns = cieapi.new_plot_columns_JSON(compute_xyz_standard_modular, {**parameters, 'info': False})
+    info_data = cieapi.new_calculation_JSON(compute_xyz_standard_modular, {**parameters, 'info': True})
+    # finds relevant datapoints
+    points = retrievePoints(XY_graph, parameters)
+    # and where they are on the curve, so that the page does not have to search for them
+    wavelengths = compute_xyz_standard_modular({**parameters, 'info': False})['plot'][:, 0]
+    indices = orjson.dumps(point_indices(wavelengths, points)).decode()
 
-    # generates the html
-    raw = head(XYZ_graph) + """
-        // makes into js variables from original computation
-        const json = '""" + json + """';
-        const plot = JSON.parse(json)['plot'];
-        // from StackOverflow, see module description.
-        const output = plot[0].map((_, colIndex) => plot.map(row => row[colIndex]));
+    # returns partially constructed html
+    return COMPARISON_XY_TEMPLATE.substitute(
+        year=year, short=short, color=color, columns=columns, info_data=info_data, mode=mode,
+        points=orjson.dumps(points).decode(), indices=indices)
+
+
+# the page of XYZ_graph(...) after its head, with placeholders for what depends on the parameters
+XYZ_TEMPLATE = Template(compact("""
+        // makes the columns of the computation into js variables
+        const output = JSON.parse('$columns');
         
-        // finds the three tristumuluses xyz from transposed output
-        var r = {
-            x: output[0],
-            y: output[1],
-            mode: 'lines',
-            name: 'x',
-            line: {
-                color: 'rgb(255, 0, 0)'
-            }
-        }
-        var g = {
-            x: output[0],
-            y: output[2],
-            mode: 'lines',
-            name: 'y',
-            line: {
-                color: 'rgb(0, 127, 0)'
-            }
-        }
-        var b = {
-            x: output[0],
-            y: output[3],
-            mode: 'lines',
-            name: 'z',
-            line: {
-                color: 'rgb(0, 0, 255)'
-            }
-        }
+        // finds the three tristumuluses xyz from the columns, as a name, column and colour each
+        var [r, g, b] = [['x', 1, 'rgb(255, 0, 0)'], ['y', 2, 'rgb(0, 127, 0)'], ['z', 3, 'rgb(0, 0, 255)']].map(
+            ([name, column, color]) => ({
+                x: output[0],
+                y: output[column],
+                type: 'scattergl',
+                mode: 'lines',
+                name: name,
+                line: {color: color}
+            }));
         
-        // generic config/layout for plotly
-        const config = {responsive: true}
+        // generic layout for plotly
         var layout = {
             showlegend: false,
-            title: '""" + title + """',
+            title: '$title',
             autosize: true,
             height: 700,
                 yaxis: {
@@ -1312,39 +1157,38 @@ def XYZ_graph(parameters):
         
         // adds partially constructed htmls for comparison graphs xyz 1931 and xyz 1964
         
-        """ + comparsion_graph_1931(parameters) + """
+        $comparison_1931
+        
+        // xyz 1931 is rendered from the start, hidden until its checkbox is checked
+        for (const trace of [cr, cg, cb]) {
+            trace.visible = false;
+            renders.push(trace);
+        }
         
-        // adds event listener for xyz 1931
+        // adds event listener for xyz 1931, which only shows or hides it
         cie1931.addEventListener('change', (event) => {
-            if (document.getElementById('cie1931').checked) {
-            // var grid = document.getElementById('grid').checked;
-                renders.push(cr, cg, cb);
-            } else {
-               renders = renders.filter( (element) => !( [cr, cg, cb].includes(element)) );
-            }
-            console.log(renders);
-            Plotly.react('plot', renders, layout, config);
+            Plotly.restyle('plot', {visible: event.currentTarget.checked},
+                           [cr, cg, cb].map(trace => renders.indexOf(trace)));
         })
         
-        """ + comparsion_graph_1964(parameters) + """
+        $comparison_1964
+        
+        // and so is xyz 1964
+        for (const trace of [cr_64, cg_64, cb_64]) {
+            trace.visible = false;
+            renders.push(trace);
+        }
         
         // adds event listener for xyz 1964 checkbutton
         cie1964.addEventListener('change', (event) => {
-            if (document.getElementById('cie1964').checked) {
-                renders.push(cr_64, cg_64, cb_64);
-            } else {
-               renders = renders.filter( (element) => !( [cr_64, cg_64, cb_64].includes(element)) );
-            }
-            Plotly.react('plot', renders, layout, config);
+            Plotly.restyle('plot', {visible: event.currentTarget.checked},
+                           [cr_64, cg_64, cb_64].map(trace => renders.indexOf(trace)));
         })
         
         // event listener for grid checkbox
         grid.addEventListener('change', (event) => {
-            var grid = document.getElementById('grid').checked;
-            layout['yaxis']['showgrid'] = grid;
-            layout['xaxis']['showgrid'] = grid;
-            
-            Plotly.react('plot', renders, layout, config);
+            var shown = event.currentTarget.checked;
+            Plotly.relayout('plot', {'xaxis.showgrid': shown, 'yaxis.showgrid': shown});
         })
         
         // initial creation of plot
@@ -1353,114 +1197,99 @@ def XYZ_graph(parameters):
     </body>
 </html>
     
-    """
-    return raw
+    """))
 
 
-def comparsion_graph_1931(parameters, mode="dot"):
+def XYZ_graph(parameters):
     """
-    Plotting function for xyz 1931 (field size 2), with different mode of render depending on
-    if by itself or for comparisons.
+    Plotting function for the xyz endpoint.
     Parameters
     ----------
     parameters: parameters from global system
-    mode: String that is either "lines" for when function plots by itself (standardization endpoint),
-    or empty/"dot" when used in another function for comparison.
 
-    Returns
-    -------
-    Partially constructed HTML within a string for the parts of xyz 1931.
+    Yields
+    ------
+    Fully constructed string within HTML for the plotting of xyz endpoint.
+    It is yielded in two parts: its head, and then the rest of it.
+
     """
-    # finds the calculations necessary
-    temp = parameters.copy()
-    temp['field_size'] = 2
-    data = cieapi.new_calculation_JSON(compute_XYZ_standard_modular, temp)
-    # constructs the string of html
-    raw = """
-        // makes calculation data into variable
-        const data = '""" + data + """';
-        const comp_1931 = JSON.parse(data)['plot'];
-        // from StackOverflow, see module description.
-        const output_1931 = comp_1931[0].map((_, colIndex) => comp_1931.map(row => row[colIndex]));
+    yield head(XYZ_graph)
+    # finds the columns of the calculation, not info due to not needed or non existant
+    columns = cieapi.new_plot_columns_JSON(compute_XYZ_modular, {**parameters, 'info': False})
+    # creates formatted string title
+    title = (
+        "CIE XYZ cone-fundamental-based tristumulus functions<br>Field size: {}°"
+        ", Age: {} yr, Domain: {} nm - {} nm, Step: {} nm".
+        format(parameters['field_size'], parameters['age'], parameters['min'], parameters['max'],
+               parameters['step_size']))
+    # adds it to the title
+    if parameters['norm']:
+        title += ", Renormalized values"
+
+    # generates the html
+    yield XYZ_TEMPLATE.substitute(
+        columns=columns, title=title, comparison_1931=comparsion_graph_1931(parameters),
+        comparison_1964=comparsion_graph_1964(parameters))
+
+
+# the part of the pages that comparsion_graph_1931(...) makes, with placeholders for what depends on the parameters
+COMPARISON_XYZ_1931_TEMPLATE = Template(compact("""
+        // makes the columns of the calculation into variable
+        const output_1931 = JSON.parse('$columns');
         
         // expresses the cie xyz 1931 as cr, cg and cb variables for plotly
-        var cr = {
-            x: output_1931[0],
-            y: output_1931[1],
-            mode: 'lines',
-            name: 'x',
-            line: {
-                dash: '""" + mode + """',
-                color: 'rgb(255, 0, 0)'
-            }
-        }
-        var cg = {
-            x: output_1931[0],
-            y: output_1931[2],
-            mode: 'lines',
-            name: 'y',
-            line: {
-                dash: '""" + mode + """',
-                color: 'rgb(0, 127, 0)'
-            }
-        }
-        var cb = {
-            x: output_1931[0],
-            y: output_1931[3],
-            mode: 'lines',
-            name: 'z',
-            line: {
-                dash: '""" + mode + """',
-                color: 'rgb(0, 0, 255)'
-            }
-        }
+        var [cr, cg, cb] = [['x', 1, 'rgb(255, 0, 0)'], ['y', 2, 'rgb(0, 127, 0)'], ['z', 3, 'rgb(0, 0, 255)']].map(
+            ([name, column, color]) => ({
+                x: output_1931[0],
+                y: output_1931[column],
+                type: 'scattergl',
+                mode: 'lines',
+                name: name,
+                line: {dash: '$mode', color: color}
+            }));
         
-    """
-    return raw
+    """))
 
 
-def cieXYZ_std(parameters):
+def comparsion_graph_1931(parameters, mode="dot"):
     """
-    Plotting function for xyz-std endpoint.
+    Plotting function for xyz 1931 (field size 2), with different mode of render depending on
+    if by itself or for comparisons.
     Parameters
     ----------
-    parameters: parameters from the global system
+    parameters: parameters from global system
+    mode: String that is either "lines" for when function plots by itself (standardization endpoint),
+    or empty/"dot" when used in another function for comparison.
 
     Returns
     -------
-    Constructed HTML for xyz-std plot within a string.
+    Partially constructed HTML within a string for the parts of xyz 1931.
+    """
+    # the standard function does not depend on the parameters, so neither does this part of the pages
+    return cached_comparsion_graph_1931(mode)
 
+
+@lru_cache(maxsize=None)
+def cached_comparsion_graph_1931(mode):
     """
-    # has to first route depending on the field_size;
-    if parameters['field_size'] == 2:
-        # decides the 'type' for checkboxes; cie1931 needs cie1964 as a checkbox,
-        # while cie1964 needs cie1931 as one
-        type = "cie1931_2"
-        # decides the modes for both functions, how they get drawn
-        mode1931 = "solid"
-        mode1964 = "dot"
-        # the starter variables for plotly to render
-        starter = "[cr, cb, cg]"
-        # different titles as well
-        title = "CIE 1931 XYZ standard 2° colour-matching functions"
-    else:
-        type = "cie1964_10"
-        mode1931 = "dot"
-        mode1964 = "solid"
-        starter = "[cr_64, cg_64, cb_64]"
-        title = "CIE 1964 XYZ standard 10° colour-matching functions"
+    The cached body of comparsion_graph_1931(...), which is the same for every plot with the same mode.
+    """
+    # finds the calculations necessary
+    columns = cieapi.new_plot_columns_JSON(compute_XYZ_standard_modular, {'field_size': 2, 'info': False})
+    # constructs the string of html
+    return COMPARISON_XYZ_1931_TEMPLATE.substitute(columns=columns, mode=mode)
 
-    # creates the html
-    raw = head(type) + """
+
+# the page of cieXYZ_std(...) after its head, with placeholders for what depends on the parameters
+XYZ_STD_TEMPLATE = Template(compact("""
     
     // adds the variables for comparison
-    """ + comparsion_graph_1931(parameters, mode1931) + comparsion_graph_1964(parameters, mode1964) + """
+    $comparison_1931$comparison_1964
     
-    // adds generic config/layout for plotly
-    const config = {responsive: true}
+    // adds generic layout for plotly
     var layout = {
         showlegend: false,
-        title: '""" + title + """',
+        title: '$title',
         autosize: true,
         height: 700,
             yaxis: {
@@ -1474,38 +1303,27 @@ def cieXYZ_std(parameters):
             }
         }
     
-    // makes a render pile of what to render in plotly
-    renders = """ + starter + """;
+    // makes a render pile of what to render in plotly, with the one to compare with hidden until checked
+    const other = $other;
+    other.forEach(trace => trace.visible = false);
+    renders = $starter.concat(other);
     
     // adds event listeners for both regardless of disabled or enabled; users wont be able
     // to get them regardless
     cie1931.addEventListener('change', (event) => {
-        if (document.getElementById('cie1931').checked) {
-        var grid = document.getElementById('grid').checked;
-            renders.push(cr, cg, cb);
-        } else {
-           renders = renders.filter( (element) => !( [cr, cg, cb].includes(element)) );
-        }
-        console.log(renders);
-        Plotly.react('plot', renders, layout, config);
+        Plotly.restyle('plot', {visible: event.currentTarget.checked},
+                       [cr, cg, cb].map(trace => renders.indexOf(trace)));
     })
     
     cie1964.addEventListener('change', (event) => {
-        if (document.getElementById('cie1964').checked) {
-            renders.push(cr_64, cg_64, cb_64);
-        } else {
-           renders = renders.filter( (element) => !( [cr_64, cg_64, cb_64].includes(element)) );
-        }
-        Plotly.react('plot', renders, layout, config);
+        Plotly.restyle('plot', {visible: event.currentTarget.checked},
+                       [cr_64, cg_64, cb_64].map(trace => renders.indexOf(trace)));
     })
     
     // generic eventlistener for grid
     grid.addEventListener('change', (event) => {
-        var grid = document.getElementById('grid').checked;
-        layout['yaxis']['showgrid'] = grid;
-        layout['xaxis']['showgrid'] = grid;
-        
-        Plotly.react('plot', renders, layout, config);
+        var shown = event.currentTarget.checked;
+        Plotly.relayout('plot', {'xaxis.showgrid': shown, 'yaxis.showgrid': shown});
     })
     
     // initial drawing of plot
@@ -1515,47 +1333,60 @@ def cieXYZ_std(parameters):
     </body>
 </html>
         
-    """
-    return raw
+    """))
 
 
-def ciexyz_std(parameters):
+def cieXYZ_std(parameters):
     """
-    Plotting function for the xy-std endpoint.
+    Plotting function for xyz-std endpoint.
     Parameters
     ----------
     parameters: parameters from the global system
 
-    Returns
-    -------
-    String with constructed HTML for xy-std plots.
+    Yields
+    ------
+    Constructed HTML for xyz-std plot within a string.
+    It is yielded in two parts: its head, and then the rest of it.
+
     """
-    # routes it much like cieXYZ_std(),
+    # has to first route depending on the field_size;
     if parameters['field_size'] == 2:
-        type = "xyz1931_2"
+        # decides the 'type' for checkboxes; cie1931 needs cie1964 as a checkbox,
+        # while cie1964 needs cie1931 as one
+        type = "cie1931_2"
+        # decides the modes for both functions, how they get drawn
         mode1931 = "solid"
         mode1964 = "dot"
-        starter = "[curve_31, points_31, purpleline_31, illuminantE]"
-        title = "CIE 1931 xy standard 2° chromaticity diagram"
-        main = "points_31"
+        # the starter variables for plotly to render
+        starter = "[cr, cb, cg]"
+        # and the one to compare with
+        other = "[cr_64, cg_64, cb_64]"
+        # different titles as well
+        title = "CIE 1931 XYZ standard 2° colour-matching functions"
     else:
-        type = "xyz1964_10"
+        type = "cie1964_10"
         mode1931 = "dot"
         mode1964 = "solid"
-        starter = "[curve_64, points_64, purpleline_64, illuminantE]"
-        title = "CIE 1964 xy standard 10° chromaticity diagram"
-        main = "points_64"
+        starter = "[cr_64, cg_64, cb_64]"
+        other = "[cr, cg, cb]"
+        title = "CIE 1964 XYZ standard 10° colour-matching functions"
 
-    # creates html
-    raw = head(type) + """
+    yield head(type)
+    # creates the html
+    yield XYZ_STD_TEMPLATE.substitute(
+        comparison_1931=comparsion_graph_1931(parameters, mode1931),
+        comparison_1964=comparsion_graph_1964(parameters, mode1964), title=title, other=other, starter=starter)
+
+
+# the page of ciexyz_std(...) after its head, with placeholders for what depends on the parameters
+XY_STD_TEMPLATE = Template(compact("""
     // adds the values/variables from comparison functions
-    """ + comparison_xy_1931(parameters, mode1931) + comparison_xy_1964(parameters, mode1964) + """
+    $comparison_1931$comparison_1964
     
-    // generic config/layout
-    const config = {responsive: true}
+    // generic layout
     var layout = {
         showlegend: false,
-        title: '""" + title + """',
+        title: '$title',
         autosize: false,
         height: 800,
         width: 800,
@@ -1563,13 +1394,13 @@ def ciexyz_std(parameters):
                 zeroline: false,
                 scaleanchor: "xaxis",
                 automargin: true,
-                title: '""" + "y<sub>{}</sub>".format(parameters['field_size']) + """',
+                title: '$yaxis',
             },
             xaxis: {
                 automargin: true,
                 nticks: 10,
                 domain: "contraint",
-                title: '""" + "x<sub>{}</sub>".format(parameters['field_size']) + """',
+                title: '$xaxis',
             }
         }
     
@@ -1591,53 +1422,37 @@ def ciexyz_std(parameters):
     
     }
     
-    renders = """ + starter + """;
+    // the one to compare with is rendered from the start, hidden until its checkbox is checked
+    const other = $other;
+    other.forEach(trace => trace.visible = false);
+    renders = $starter.concat(other);
     
     // adds generic event listeners for both, cannot be used if enabled so it's fine to add both
     cie1931.addEventListener('change', (event) => {
-        if (document.getElementById('cie1931').checked) {
-        var grid = document.getElementById('grid').checked;
-            renders.push(curve_31, points_31, purpleline_31);
-        } else {
-           renders = renders.filter( (element) => !( [curve_31, points_31, purpleline_31].includes(element)) );
-        }
-        console.log(renders);
-        Plotly.react('plot', renders, layout, config);
+        Plotly.restyle('plot', {visible: event.currentTarget.checked},
+                       [curve_31, points_31, purpleline_31].map(trace => renders.indexOf(trace)));
     })
     
     cie1964.addEventListener('change', (event) => {
-        if (document.getElementById('cie1964').checked) {
-            renders.push(curve_64, points_64, purpleline_64);
-        } else {
-           renders = renders.filter( (element) => !( [curve_64, points_64, purpleline_64].includes(element)) );
-        }
-        Plotly.react('plot', renders, layout, config);
+        Plotly.restyle('plot', {visible: event.currentTarget.checked},
+                       [curve_64, points_64, purpleline_64].map(trace => renders.indexOf(trace)));
     })
     
     // label checkbox event listener
     label.addEventListener('change', (event) => {
-    var label = document.getElementById('label').checked;
+    var label = event.currentTarget.checked;
+        const labelled = [renders.indexOf($main), renders.indexOf(illuminantE)];
         if (label) {
-            """ + main + """['mode'] = 'markers+text';
-            """ + main + """['text'] = pointes_1931;
-            illuminantE['mode'] = 'markers+text';
-            illuminantE['text'] = ['E'];
+            Plotly.restyle('plot', {mode: 'markers+text', text: [pointes_1931, ['E']]}, labelled);
         } else {
-            """ + main + """['mode'] = 'markers';
-            """ + main + """['text'] = [];
-            illuminantE['mode'] = 'markers';
-            illuminantE['text'] = [];
+            Plotly.restyle('plot', {mode: 'markers', text: [[], []]}, labelled);
         }
-        Plotly.react('plot', renders, layout, config);
     })
     
     // grid event listener 
     grid.addEventListener('change', (event) => {
-        var grid = document.getElementById('grid').checked;
-        layout['yaxis']['showgrid'] = grid;
-        layout['xaxis']['showgrid'] = grid;
-        
-        Plotly.react('plot', renders, layout, config);
+        var shown = event.currentTarget.checked;
+        Plotly.relayout('plot', {'xaxis.showgrid': shown, 'yaxis.showgrid': shown});
     })
     
     // initial creation of plot
@@ -1648,187 +1463,121 @@ def ciexyz_std(parameters):
 </html>
     
     
-    """
-    return raw
+    """))
 
 
-def comparsion_graph_1964(parameters, mode="dash"):
+def ciexyz_std(parameters):
     """
-    Partial constructor for xyz-1964 (field size 10) plot.
+    Plotting function for the xy-std endpoint.
     Parameters
     ----------
-    parameters: parameters from global system
-    mode: String representing either normal plotting (value of "lines") or when used in comparison
-    (value of none/"dash")
-
-    Returns
-    -------
-    Partial construction of HTML for xyz-1964 in plot as string.
+    parameters: parameters from the global system
 
+    Yields
+    ------
+    String with constructed HTML for xy-std plots.
+    It is yielded in two parts: its head, and then the rest of it.
     """
-    # calculated the XYZ with field size of 10 for computations
-    temp = parameters.copy()
-    temp['field_size'] = 10
-    data = cieapi.new_calculation_JSON(compute_XYZ_standard_modular, temp)
-    raw = """
-        // converts calculation from python to js variables through js
-        const data2 = '""" + data + """';
-        const comp_1964 = JSON.parse(data2)['plot'];
-        // from StackOverflow, see module description.
-        const output_1964 = comp_1964[0].map((_, colIndex) => comp_1964.map(row => row[colIndex]));
+    # routes it much like cieXYZ_std(),
+    if parameters['field_size'] == 2:
+        type = "xyz1931_2"
+        mode1931 = "solid"
+        mode1964 = "dot"
+        starter = "[curve_31, points_31, purpleline_31, illuminantE]"
+        other = "[curve_64, points_64, purpleline_64]"
+        title = "CIE 1931 xy standard 2° chromaticity diagram"
+        main = "points_31"
+    else:
+        type = "xyz1964_10"
+        mode1931 = "dot"
+        mode1964 = "solid"
+        starter = "[curve_64, points_64, purpleline_64, illuminantE]"
+        other = "[curve_31, points_31, purpleline_31]"
+        title = "CIE 1964 xy standard 10° chromaticity diagram"
+        main = "points_64"
+
+    yield head(type)
+    # creates html
+    yield XY_STD_TEMPLATE.substitute(
+        comparison_1931=comparison_xy_1931(parameters, mode1931),
+        comparison_1964=comparison_xy_1964(parameters, mode1964), title=title,
+        xaxis="x<sub>{}</sub>".format(parameters['field_size']), yaxis="y<sub>{}</sub>".format(parameters['field_size']),
+        other=other, starter=starter, main=main)
+
+
+# the part of the pages that comparsion_graph_1964(...) makes, with placeholders for what depends on the parameters
+COMPARISON_XYZ_1964_TEMPLATE = Template(compact("""
+        // converts the columns of the calculation from python to js variables through json
+        const output_1964 = JSON.parse('$columns');
 
         // creates three curves representing the xyz from standardization function
-        var cr_64 = {
-            x: output_1964[0],
-            y: output_1964[1],
-            mode: 'lines',
-            name: 'x',
-            line: {
-                dash: '""" + mode + """',
-                color: 'rgb(255, 0, 0)'
-            }
-        }
-        var cg_64 = {
-            x: output_1964[0],
-            y: output_1964[2],
-            mode: 'lines',
-            name: 'y',
-            line: {
-                dash: '""" + mode + """',
-                color: 'rgb(0, 127, 0)'
-            }
-        }
-        var cb_64 = {
-            x: output_1964[0],
-            y: output_1964[3],
-            mode: 'lines',
-            name: 'z',
-            line: {
-                dash: '""" + mode + """',
-                color: 'rgb(0, 0, 255)'
-            }
-        }
+        var [cr_64, cg_64, cb_64] = [['x', 1, 'rgb(255, 0, 0)'], ['y', 2, 'rgb(0, 127, 0)'], ['z', 3, 'rgb(0, 0, 255)']].map(
+            ([name, column, color]) => ({
+                x: output_1964[0],
+                y: output_1964[column],
+                type: 'scattergl',
+                mode: 'lines',
+                name: name,
+                line: {dash: '$mode', color: color}
+            }));
 
-    """
-    return raw
+    """))
 
 
-def LMS_graph(parameters):
+def comparsion_graph_1964(parameters, mode="dash"):
     """
-    The plotting function for the LMS endpoint.
+    Partial constructor for xyz-1964 (field size 10) plot.
     Parameters
     ----------
     parameters: parameters from global system
+    mode: String representing either normal plotting (value of "lines") or when used in comparison
+    (value of none/"dash")
 
     Returns
     -------
-    Completely constructed HTML for LMS plot.
+    Partial construction of HTML for xyz-1964 in plot as string.
 
     """
-    # generate computations for LMS + log LMS
-    json = cieapi.new_calculation_JSON(compute_LMS_modular, parameters)
-    temp = parameters.copy()
-    temp['log'] = not parameters['log']
-    other_json = cieapi.new_calculation_JSON(compute_LMS_modular, temp)
+    # the standard function does not depend on the parameters, so neither does this part of the pages
+    return cached_comparsion_graph_1964(mode)
 
-    # creates title customary of given log and base
-    titles = ["CIE 2006 LMS cone fundamentals",
-              "<br> Field size: {}°, Age: {} yr, Domain: {} nm - {} nm, Step: {} nm",
-              "<br> Field size: {}°, Age: {} yr, Domain: {} nm - {} nm, Step: {} nm, Logarithmic values"]
-    if parameters['base']:
-        titles[0] += " (9 signs. figs. data)"
 
-    title = titles[0] + titles[1].format(parameters['field_size'], parameters['age'], parameters['min'],
-                                         parameters['max'], parameters['step_size'])
-    log_title = titles[0] + titles[2].format(parameters['field_size'], parameters['age'], parameters['min'],
-                                             parameters['max'], parameters['step_size'])
+@lru_cache(maxsize=None)
+def cached_comparsion_graph_1964(mode):
+    """
+    The cached body of comparsion_graph_1964(...), which is the same for every plot with the same mode.
+    """
+    # calculated the XYZ with field size of 10 for computations
+    columns = cieapi.new_plot_columns_JSON(compute_XYZ_standard_modular, {'field_size': 10, 'info': False})
+    return COMPARISON_XYZ_1964_TEMPLATE.substitute(columns=columns, mode=mode)
 
-    # adds functionality to tackle specifically given
-    if parameters['log']:
-        startervariant = "true"
-    else:
-        startervariant = "false"
 
-    # creates the html with head() and embedded js code
-    raw = head(LMS_graph) + """
+# the page of LMS_graph(...) after its head, with placeholders for what depends on the parameters
+LMS_TEMPLATE = Template(compact("""
         // finds checkbox for logarithmic value enabling,
         // shifts it on or off depending on optionals in url
         const checkbox = document.querySelector("#log");
-        checkbox.checked = """ + startervariant + """
+        checkbox.checked = $startervariant
     
-        // creates variables from jsonified calculations for both normal and log lms
-        const json = '""" + json + """';
-        var one = JSON.parse(json);
-        const loga = '""" + other_json + """';
-        var log = JSON.parse(loga);
+        // creates variables from the jsonified columns of the calculations for both normal and log lms
+        const output = JSON.parse('$columns');
+        const output2 = JSON.parse('$other_columns');
         
-        // creates variables for their plots
-        const plot = one['plot'];
-        const log_plot = log['plot'];
+        // creates them into the traces of both plots, S, M and L as a name, column and colour each, once, so that
+        // the toggles hand plotly the same arrays; a cone has the same uid in both, so that react updates its trace
+        const cones = [['S', 3, 'rgb(0, 0, 255)'], ['M', 2, 'rgb(0, 127, 0)'], ['L', 1, 'rgb(255, 0, 0)']];
+        const [traces, other_traces] = [output, output2].map(columns => cones.map(
+            ([name, column, color]) => ({
+                name: name,
+                uid: name,
+                x: columns[0],
+                y: columns[column],
+                type: 'scattergl',
+                mode: 'lines',
+                line: {color: color}
+            })));
         
-        // from StackOverflow, see module description.
-        output = plot[0].map((_, colIndex) => plot.map(row => row[colIndex]));
-        output2 = log_plot[0].map((_, colIndex) => log_plot.map(row => row[colIndex]));
-        // above, transposes them
-        
-        // creates them into variables for plotly to be used
-        var test = {
-            name: 'S',
-            x: output[0],
-            y: output[3],
-            mode: 'lines',
-            line: {
-                color: 'rgb(0, 0, 255)'
-            }
-        }
-        var test2 = {
-            name: 'M',
-            x: output[0],
-            y: output[2],
-            mode: 'lines',
-            line: {
-                color: 'rgb(0, 127, 0)'
-            }
-        }
-        var test3 = {
-            name: 'L',
-            x: output[0],
-            y: output[1],
-            mode: 'lines',
-            line: {
-                color: 'rgb(255, 0, 0)'
-            }
-        }
-        var test4 = {
-            name: 'S',
-            x: output2[0],
-            y: output2[3],
-            mode: 'lines',
-            line: {
-                color: 'rgb(0, 0, 255)'
-            }
-        }
-        var test5 = {
-            name: 'M',
-            x: output2[0],
-            y: output2[2],
-            mode: 'lines',
-            line: {
-                color: 'rgb(0, 127, 0)'
-            }
-        }
-        var test6 = {
-            name: 'L',
-            x: output2[0],
-            y: output2[1],
-            mode: 'lines',
-            line: {
-                color: 'rgb(255, 0, 0)'
-            }
-        }
-        
-        // generic config/layout system for plotly
-        const config = {responsive: true}
+        // generic layout system for plotly
         var layout = {
             showlegend: false,
             autosize: true,
@@ -1842,39 +1591,141 @@ def LMS_graph(parameters):
                 }
             }
             
-        // adds event listener for grid
+        // adds event listener for grid, which also keeps the grid in the layout that draw(...) reacts with
         grid.addEventListener('change', (event) => {
-            var grid = document.getElementById('grid').checked;
-            layout['yaxis']['showgrid'] = grid;
-            layout['xaxis']['showgrid'] = grid;
-            
-            var event = new Event('change');
-            checkbox.dispatchEvent(event);
+            var shown = event.currentTarget.checked;
+            layout['xaxis']['showgrid'] = layout['yaxis']['showgrid'] = shown;
+            Plotly.relayout('plot', {'xaxis.showgrid': shown, 'yaxis.showgrid': shown});
         })
         
-        // adds unique listener for logarithmic checkbox
-        checkbox.addEventListener('change', (event) => {
-          if (event.currentTarget.checked) {
+        // draws either a log or normal lms
+        function draw(log) {
+          if (log) {
             layout['yaxis']['title'] = "Log10 (relative energy sensitivity)"
             layout['xaxis']['title'] = "Wavelength (nm)"
-            layout['title'] = '""" + log_title + """'
-            var newa = [test4, test5, test6];
-            Plotly.react('plot', newa, layout, config);
+            layout['title'] = '$log_title'
+            Plotly.react('plot', other_traces, layout, config);
           } else {
             layout['yaxis']['title'] = "Relative energy sensitivities"
             layout['xaxis']['title'] = "Wavelength (nm)"
-            layout['title'] = '""" + title + """';
-            var newa = [test, test2, test3];
-            Plotly.react('plot', newa, layout, config);
+            layout['title'] = '$title';
+            Plotly.react('plot', traces, layout, config);
           }
-        })
+        }
+        
+        // adds unique listener for logarithmic checkbox
+        checkbox.addEventListener('change', (event) => draw(event.currentTarget.checked))
         
-        // instead of previous functions, starts the initial drawing by dispatching a change event
-        // to the checkbox, forcing it to essentially react and draw either a log or normal lms
-        var event = new Event('change');
-        checkbox.dispatchEvent(event);
+        // starts the initial drawing directly, as the checkbox is set
+        draw(checkbox.checked);
     </script>
 </body>
 </html>
-"""
-    return raw
+"""))
+
+
+def LMS_graph(parameters):
+    """
+    The plotting function for the LMS endpoint.
+    Parameters
+    ----------
+    parameters: parameters from global system
+
+    Yields
+    ------
+    Completely constructed HTML for LMS plot.
+    It is yielded in two parts: its head, and then the rest of it.
+
+    """
+    yield head(LMS_graph)
+    # generate the columns of the computations for LMS + log LMS
+    columns = cieapi.new_plot_columns_JSON(compute_LMS_modular, parameters)
+    other_columns = cieapi.new_plot_columns_JSON(compute_LMS_modular, {**parameters, 'log': not parameters['log']})
+
+    # creates title customary of given log and base
+    titles = ["CIE 2006 LMS cone fundamentals",
+              "<br> Field size: {}°, Age: {} yr, Domain: {} nm - {} nm, Step: {} nm",
+              "<br> Field size: {}°, Age: {} yr, Domain: {} nm - {} nm, Step: {} nm, Logarithmic values"]
+    if parameters['base']:
+        titles[0] += " (9 signs. figs. data)"
+
+    title = titles[0] + titles[1].format(parameters['field_size'], parameters['age'], parameters['min'],
+                                         parameters['max'], parameters['step_size'])
+    log_title = titles[0] + titles[2].format(parameters['field_size'], parameters['age'], parameters['min'],
+                                             parameters['max'], parameters['step_size'])
+
+    # adds functionality to tackle specifically given
+    if parameters['log']:
+        startervariant = "true"
+    else:
+        startervariant = "false"
+
+    # creates the html with head() and embedded js code
+    yield LMS_TEMPLATE.substitute(
+        startervariant=startervariant, columns=columns, other_columns=other_columns, log_title=log_title,
+        title=title)
+
+
+# which of the four checkboxes of checkboxes(...) each plot has enabled (True) or disabled (False)
+DISABLED_CHECKBOXES = {
+    LMS_graph: (False, False, True, False),
+    XYZP_graph: (False, False, True, False),
+    maxwellian_graph: (False, False, True, True),
+    macleod_graph: (False, False, True, True),
+    xyp_graph: (False, False, True, True),
+    XYZ_graph: (True, True, True, False),
+    XY_graph: (True, True, True, True),
+    "cie1931_2": (False, True, True, False),
+    "cie1964_10": (True, False, True, False),
+    "xyz1931_2": (False, True, True, True),
+    "xyz1964_10": (True, False, True, True),
+}
+
+
+# the end of a plot page whose head was sent, but whose plot could not be made
+PLOT_ERROR_HTML = compact("""
+    </script>
+    <p>An error occurred while making the plot. Please try again, or change the parameters.</p>
+</body>
+</html>
+""").encode()
+
+
+def plot_body_HTML(graph_function, parameters):
+    """
+    Generates the page of a plot after its head, reusing the HTML of an earlier identical request.
+
+    Parameters
+    ----------
+    graph_function: One of the plotting functions above.
+    parameters: Global parameter system, dict of user inputs.
+
+    Returns
+    -------
+    The HTML of the plot after its head, encoded as UTF-8 bytes, which is what the endpoints send.
+
+    """
+    return cached_plot_body_HTML(graph_function, tuple(sorted(parameters.items())))
+
+
+@lru_cache(maxsize=32)
+def cached_plot_body_HTML(graph_function, parameters):
+    """
+    The cached body of plot_body_HTML(...). The plots are deterministic, so going back to an earlier plot
+    neither calculates nor templates it again. The pages are large (the whole plot is embedded), hence the
+    smaller cache than for the sidemenus.
+
+    Parameters
+    ----------
+    graph_function: One of the plotting functions above.
+    parameters: A sorted tuple of the (name, value) pairs of the treated URL parameters.
+
+    Returns
+    -------
+    The HTML of the plot after its head, encoded as UTF-8 bytes.
+
+    """
+    pages = graph_function(dict(parameters))
+    # the head is skipped, as the endpoints send it on its own before this is ready
+    next(pages)
+    return "".join(pages).encode()